@@ -11,3 +11,12 @@ class CoreConfig(AppConfig):
     """
     default_auto_field = "django.db.models.BigAutoField"
     name = "core"
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+
+        from .db import count_connection
+        from .signals import connect_tombstones
+
+        connect_tombstones()
+        connection_created.connect(count_connection)
@@ -0,0 +1,132 @@
+"""
+Helpers for native async endpoints.
+
+DRF views are synchronous, so the I/O-bound endpoints that clients poll or
+download from (health check, transcript verification and download, job
+status) are plain Django coroutines. ``async_api_view`` authenticates them
+with DRF's configured authenticators and answers in the API's error format.
+Under ASGI they no longer hold a worker while waiting on the database, Redis
+or a slow client; under WSGI they keep working one request at a time.
+"""
+
+from __future__ import annotations
+
+from functools import wraps
+from typing import Any, cast
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse
+from redis import Redis as SyncRedis
+from redis.asyncio import Redis
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from rq.job import Job
+from rq.results import Result
+from rq.serializers import resolve_serializer
+
+READ_METHODS = ("GET", "HEAD")
+
+
+class APIJsonResponse(JsonResponse):
+    """``JsonResponse`` keeping its payload on ``.data`` like DRF's ``Response``."""
+
+    def __init__(self, data, **kwargs):
+        super().__init__(data, **kwargs)
+        self.data = data
+
+
+def error_response(code: int, message: str) -> APIJsonResponse:
+    return APIJsonResponse({"error": {"code": code, "message": message}}, status=code)
+
+
+def _authenticate(request):
+    authenticators = [auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+    return Request(request, authenticators=authenticators).user
+
+
+def async_api_view(view):
+    """
+    Wrap a coroutine view so it only answers authenticated GET requests.
+
+    The authenticated user is set on ``request.user`` before ``view`` runs.
+    """
+
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if request.method not in READ_METHODS:
+            return error_response(405, f'Method "{request.method}" not allowed.')
+        try:
+            user = await sync_to_async(_authenticate)(request)
+        except APIException as exc:
+            return error_response(exc.status_code, str(exc.detail))
+        if not user.is_authenticated:
+            return error_response(401, "Authentication credentials were not provided.")
+        request.user = user
+        return await view(request, *args, **kwargs)
+
+    return wrapper
+
+
+def get_redis() -> Redis:
+    """
+    Return an async client for the RQ Redis database.
+
+    Use it as ``async with get_redis() as redis:`` so the connection is
+    closed on the event loop that opened it.
+    """
+    config: dict[str, Any] = settings.RQ_QUEUES["default"]
+    return Redis(
+        host=str(config["HOST"]),
+        port=int(config["PORT"]),
+        db=int(config["DB"]),
+        socket_connect_timeout=2,
+        socket_timeout=5,
+    )
+
+
+def _text(value: bytes | None) -> str | None:
+    return value.decode() if value else None
+
+
+async def fetch_job(job_id: str) -> dict | None:
+    """
+    Read an RQ job's status and outcome without blocking.
+
+    Returns:
+        ``{"job_id", "status", "enqueued_at", "started_at", "ended_at",
+        "result", "error"}``, or ``None`` if the job does not exist (or has
+        expired)
+    """
+    async with get_redis() as redis:
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.hgetall(Job.key_for(job_id).decode())
+            pipe.xrevrange(Result.get_key(job_id), count=1)
+            data, results = await pipe.execute()
+    if not data:
+        return None
+
+    job = {
+        "job_id": job_id,
+        "status": _text(data.get(b"status")),
+        "enqueued_at": _text(data.get(b"enqueued_at")),
+        "started_at": _text(data.get(b"started_at")),
+        "ended_at": _text(data.get(b"ended_at")),
+        "result": None,
+        "error": None,
+    }
+    if results:
+        result_id, payload = results[0]
+        # The result is only read, so it needs no (sync) connection.
+        result = Result.restore(
+            job_id, result_id.decode(), payload, connection=cast(SyncRedis, None)
+        )
+        if result.type == Result.Type.SUCCESSFUL:
+            job["result"] = result.return_value
+        elif result.exc_string:
+            job["error"] = result.exc_string.strip().splitlines()[-1]
+    elif data.get(b"result"):
+        # Redis servers without streams keep the return value on the job.
+        job["result"] = resolve_serializer(None).loads(data[b"result"])
+    return job
@@ -0,0 +1,301 @@
+"""
+API benchmark.
+
+:func:`run_benchmark` drives the API's hot paths and reports, per scenario,
+latency percentiles, queries per request and throughput. Requests go either
+in-process through Django's test client, which also counts the queries each
+request runs, or over HTTP to a running server (``HTTPClient``), optionally
+from several threads at once.
+
+Scenario parameters (a busy section, one of its students, a search term)
+are read from the database the server uses; see :func:`load_fixtures`. The
+``bench`` management command seeds a throwaway database, runs the scenarios
+and writes the report as JSON so that two runs can be compared with
+:func:`compare_reports`.
+"""
+
+from __future__ import annotations
+
+import abc
+import json
+import math
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count, Max
+from django.http import StreamingHttpResponse
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from sims_backend.academics.models import Section
+from sims_backend.admissions.models import Student
+from sims_backend.attendance.models import Attendance
+from sims_backend.enrollment.models import Enrollment
+
+
+@dataclass
+class Fixtures:
+    """Database rows and the login the scenarios address."""
+
+    credentials: dict
+    section_id: int
+    roster: list[int]
+    search: str
+    first_date: date
+
+
+@dataclass
+class Scenario:
+    """A hot path; ``build(fixtures, i)`` returns request ``i``'s path and body."""
+
+    name: str
+    method: str
+    build: Callable[[Fixtures, int], tuple[str, dict | None]]
+
+
+def _attendance_row(fixtures: Fixtures, i: int) -> tuple[str, dict]:
+    # A new day for the whole roster every len(roster) requests.
+    day, index = divmod(i, len(fixtures.roster))
+    return "/api/attendance/", {
+        "section": fixtures.section_id,
+        "student": fixtures.roster[index],
+        "date": (fixtures.first_date + timedelta(days=day)).isoformat(),
+        "present": index % 5 != 0,
+    }
+
+
+def _student(fixtures: Fixtures, i: int) -> int:
+    return fixtures.roster[i % len(fixtures.roster)]
+
+
+SCENARIOS = [
+    Scenario("login", "POST", lambda f, i: ("/api/auth/login/", f.credentials)),
+    Scenario(
+        "student_search",
+        "GET",
+        lambda f, i: (f"/api/students/?search={f.search}", None),
+    ),
+    Scenario("section_list", "GET", lambda f, i: ("/api/sections/", None)),
+    Scenario("attendance_list", "GET", lambda f, i: ("/api/attendance/", None)),
+    Scenario("attendance_mark", "POST", _attendance_row),
+    Scenario(
+        "eligibility",
+        "GET",
+        lambda f, i: (
+            f"/api/attendance/eligibility/?student_id={_student(f, i)}"
+            f"&section_id={f.section_id}",
+            None,
+        ),
+    ),
+    Scenario(
+        "gradebook",
+        "GET",
+        lambda f, i: (f"/api/sections/{f.section_id}/gradebook/", None),
+    ),
+    Scenario(
+        "transcript", "GET", lambda f, i: (f"/api/transcripts/{_student(f, i)}/", None)
+    ),
+    Scenario("dashboard", "GET", lambda f, i: ("/api/dashboard/stats/", None)),
+]
+SCENARIO_NAMES = [scenario.name for scenario in SCENARIOS]
+COMPARED_METRICS = (
+    "p50_ms",
+    "p95_ms",
+    "p99_ms",
+    "queries_per_request",
+    "throughput_rps",
+)
+
+
+def load_fixtures(credentials: dict) -> Fixtures:
+    """
+    Pick the benchmark's targets from the current database.
+
+    Raises:
+        ValueError: If no section has enrollments
+    """
+    section = (
+        Section.objects.annotate(size=Count("enrollments"))
+        .filter(size__gt=0)
+        .order_by("-size", "id")
+        .first()
+    )
+    if section is None:
+        raise ValueError("No enrolled sections to benchmark; seed some data first")
+    roster = list(
+        Enrollment.objects.filter(section=section)
+        .order_by("student_id")
+        .values_list("student_id", flat=True)
+    )
+    name = Student.objects.get(pk=roster[0]).name
+    last = Attendance.objects.filter(section=section).aggregate(last=Max("date"))
+    return Fixtures(
+        credentials=credentials,
+        section_id=section.pk,
+        roster=roster,
+        search=name.split()[0],
+        first_date=(last["last"] or date.today()) + timedelta(days=1),
+    )
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+class BenchClient(abc.ABC):
+    """
+    Base client: ``request`` returns ``(status, content, queries)``, with
+    ``queries`` ``None`` when it cannot be counted.
+    """
+
+    concurrency = 1
+
+    def __init__(self, credentials: dict):
+        self.credentials = credentials
+        self.headers: dict[str, str] = {}
+
+    def login(self) -> None:
+        status, content, _ = self.request("POST", "/api/auth/login/", self.credentials)
+        if status != 200:
+            raise ValueError(f"Login failed with status {status}")
+        access = json.loads(content)["tokens"]["access"]
+        self.headers = {"Authorization": f"Bearer {access}"}
+
+    @abc.abstractmethod
+    def request(self, method: str, path: str, body: dict | None):
+        """Send one request and return ``(status, content, queries)``."""
+
+
+class InProcessClient(BenchClient):
+    """Send requests through Django's test client, counting their queries."""
+
+    def __init__(self, credentials: dict):
+        super().__init__(credentials)
+        self.client = Client()
+
+    def request(self, method: str, path: str, body: dict | None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.generic(
+                method,
+                path,
+                json.dumps(body) if body is not None else "",
+                content_type="application/json",
+                headers=self.headers,
+            )
+            # Streamed responses (transcript PDFs) are timed until fully read.
+            content = (
+                b"".join(response)
+                if isinstance(response, StreamingHttpResponse)
+                else response.content
+            )
+        return response.status_code, content, len(queries)
+
+
+class HTTPClient(BenchClient):
+    """Send requests to a running server from ``concurrency`` threads."""
+
+    def __init__(self, base_url: str, credentials: dict, concurrency: int = 1):
+        super().__init__(credentials)
+        self.base_url = base_url.rstrip("/")
+        self.concurrency = concurrency
+
+    def request(self, method: str, path: str, body: dict | None):
+        request = urllib.request.Request(
+            self.base_url + path,
+            data=json.dumps(body).encode() if body is not None else None,
+            method=method,
+            headers={"Content-Type": "application/json", **self.headers},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=60) as response:
+                return response.status, response.read(), None
+        except urllib.error.HTTPError as exc:
+            return exc.code, exc.read(), None
+
+
+def _run_scenario(
+    client, scenario: Scenario, fixtures: Fixtures, requests: int, warmup: int
+) -> dict:
+    def timed(i):
+        path, body = scenario.build(fixtures, i)
+        start = time.perf_counter()
+        status, _, queries = client.request(scenario.method, path, body)
+        return (time.perf_counter() - start) * 1000, status, queries
+
+    for i in range(warmup):
+        timed(i)
+    start = time.perf_counter()
+    indexes = range(warmup, warmup + requests)
+    if client.concurrency > 1:
+        with ThreadPoolExecutor(client.concurrency) as pool:
+            samples = list(pool.map(timed, indexes))
+    else:
+        samples = [timed(i) for i in indexes]
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(sample[0] for sample in samples)
+    queries = [sample[2] for sample in samples if sample[2] is not None]
+    mean_queries = round(sum(queries) / len(queries), 1) if queries else None
+    return {
+        "requests": requests,
+        "errors": sum(1 for sample in samples if sample[1] >= 400),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "mean_ms": round(sum(latencies) / len(latencies), 2),
+        "queries_per_request": mean_queries,
+        "throughput_rps": round(requests / elapsed, 1) if elapsed else None,
+    }
+
+
+def run_benchmark(client, scenarios=None, requests: int = 50, warmup: int = 3) -> dict:
+    """
+    Run ``scenarios`` (names, default all) against ``client``.
+
+    Returns:
+        Dict of scenario name to ``{"requests", "errors", "p50_ms", "p95_ms",
+        "p99_ms", "mean_ms", "queries_per_request", "throughput_rps"}``;
+        ``queries_per_request`` is ``None`` over HTTP
+    """
+    fixtures = load_fixtures(client.credentials)
+    selected = [s for s in SCENARIOS if scenarios is None or s.name in scenarios]
+    # The test client's requests must pass host validation.
+    with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+        client.login()
+        return {
+            scenario.name: _run_scenario(client, scenario, fixtures, requests, warmup)
+            for scenario in selected
+        }
+
+
+def compare_reports(baseline: dict, current: dict) -> list[dict]:
+    """
+    Compare two saved reports scenario by scenario.
+
+    Returns:
+        One row per scenario present in both, with each metric's baseline and
+        current value and the relative change in percent
+    """
+    rows = []
+    for name, before in baseline["scenarios"].items():
+        after = current["scenarios"].get(name)
+        if after is None:
+            continue
+        row = {"scenario": name}
+        for metric in COMPARED_METRICS:
+            old, new = before.get(metric), after.get(metric)
+            change = (
+                round((new - old) / old * 100, 1) if old and new is not None else None
+            )
+            row[metric] = {"baseline": old, "current": new, "change_pct": change}
+        rows.append(row)
+    return rows
@@ -0,0 +1,175 @@
+"""
+Versioned response cache for near-static reference data.
+
+Cached responses live under keys that embed a per-namespace version number.
+Writes bump the version (see ``bump_namespaces``), which orphans every entry
+of the old version at once, so readers never see data from before a write.
+Hit and miss counters are kept alongside so the hit ratio can be reported.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import get_conditional_response
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "refdata"
+CACHED_HEADERS = ("ETag", "Last-Modified", "Cache-Control", "Vary")
+ROLE_PRIORITY = ["Admin", "Registrar", "ExamCell", "Faculty", "Student"]
+
+
+def _version_key(namespace: str) -> str:
+    return f"{KEY_PREFIX}:{namespace}:version"
+
+
+def _stats_key(namespace: str, kind: str) -> str:
+    return f"{KEY_PREFIX}:{namespace}:{kind}"
+
+
+def _initial_version() -> int:
+    # A fresh, time-based version never collides with entries written under
+    # an earlier version whose counter was evicted.
+    return time.time_ns()
+
+
+def get_version(namespace: str) -> int:
+    version = cache.get_or_set(_version_key(namespace), _initial_version, timeout=None)
+    if version is None:
+        # A ``None`` stored under the key would put every write under one
+        # shared ``vNone`` key; start a fresh version instead.
+        version = _initial_version()
+        cache.set(_version_key(namespace), version, timeout=None)
+    return int(version)
+
+
+def bump_version(namespace: str) -> None:
+    try:
+        cache.incr(_version_key(namespace))
+    except ValueError:
+        cache.set(_version_key(namespace), _initial_version(), timeout=None)
+
+
+def bump_namespaces(*namespaces: str) -> None:
+    """
+    Invalidate the given namespaces once the current transaction commits.
+
+    Bumping after commit guarantees that any reader who sees the new version
+    also sees the committed rows.
+    """
+
+    def _bump():
+        for namespace in namespaces:
+            try:
+                bump_version(namespace)
+            except Exception:
+                logger.exception("Failed to bump cache version for %s", namespace)
+
+    transaction.on_commit(_bump)
+
+
+def record(namespace: str, kind: str) -> None:
+    key = _stats_key(namespace, kind)
+    cache.add(key, 0, timeout=None)
+    cache.incr(key)
+
+
+def get_stats(namespaces) -> dict[str, dict[str, float | int]]:
+    """Return hit/miss counters and the hit ratio for each namespace."""
+    stats = {}
+    for namespace in namespaces:
+        hits = cache.get(_stats_key(namespace, "hits"), 0)
+        misses = cache.get(_stats_key(namespace, "misses"), 0)
+        total = hits + misses
+        stats[namespace] = {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / total, 4) if total else 0.0,
+        }
+    return stats
+
+
+def get_role(user) -> str:
+    if not getattr(user, "is_authenticated", False):
+        return "anonymous"
+    if user.is_superuser:
+        return "superuser"
+    groups = set(user.groups.values_list("name", flat=True))
+    return next((role for role in ROLE_PRIORITY if role in groups), "user")
+
+
+def build_key(namespace: str, request) -> str:
+    # The absolute URI keeps pagination links correct for every served host.
+    digest = hashlib.md5(
+        request.build_absolute_uri().encode(), usedforsecurity=False
+    ).hexdigest()
+    role = get_role(request.user)
+    return f"{KEY_PREFIX}:{namespace}:v{get_version(namespace)}:{role}:{digest}"
+
+
+class CachedResponseMixin:
+    """
+    ViewSet mixin caching ``list`` and ``retrieve`` responses per query string
+    and role under the versioned ``cache_namespace``.
+
+    Cached entries keep the validators set by :class:`ConditionalGetMixin`, so
+    a matching ``If-None-Match`` is answered with ``304`` without touching the
+    database. Cache errors fall back to the uncached view.
+    """
+
+    cache_namespace = ""
+
+    def list(self, request, *args, **kwargs):
+        return self._cached_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached_response(request, super().retrieve, *args, **kwargs)
+
+    def _cached_response(self, request, handler, *args, **kwargs):
+        namespace = self.cache_namespace
+        try:
+            key = build_key(namespace, request)
+            entry = cache.get(key)
+        except Exception:
+            logger.exception("Reference cache unavailable")
+            return handler(request, *args, **kwargs)
+
+        if entry is not None:
+            self._record(namespace, "hits")
+            headers = entry["headers"]
+            response = Response(entry["data"], headers=headers)
+            not_modified = get_conditional_response(request, etag=headers.get("ETag"))
+            if not_modified is not None:
+                for name, value in headers.items():
+                    not_modified[name] = value
+                return not_modified
+            return response
+
+        self._record(namespace, "misses")
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            entry = {
+                "data": response.data,
+                "headers": {
+                    name: response[name] for name in CACHED_HEADERS if name in response
+                },
+            }
+            try:
+                cache.set(key, entry, timeout=settings.REFERENCE_CACHE_TIMEOUT)
+            except Exception:
+                logger.exception("Failed to store reference cache entry")
+        return response
+
+    @staticmethod
+    def _record(namespace: str, kind: str) -> None:
+        try:
+            record(namespace, kind)
+        except Exception:
+            logger.exception("Failed to record reference cache %s", kind)
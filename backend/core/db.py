@@ -0,0 +1,131 @@
+"""
+Database connection settings and connection metrics.
+
+``database_settings`` builds ``DATABASES["default"]`` from environment
+variables. Three connection modes are supported:
+
+* ``persistent`` (default): each process keeps its connection open for
+  ``DB_CONN_MAX_AGE`` seconds and health-checks it before reuse.
+* ``psycopg``: Django's built-in psycopg 3 connection pool. Requires the
+  optional ``psycopg[binary,pool]`` package; persistent connections are
+  disabled because the pool owns connection reuse.
+* ``pgbouncer``: connections go through PgBouncer in transaction pooling
+  mode, which cannot keep server-side cursors open across transactions.
+
+``connection_stats`` reports how many connections this process has opened
+and, in ``psycopg`` mode, the pool's wait statistics.
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+import threading
+from collections.abc import Mapping
+from typing import Any
+
+from django.core.exceptions import ImproperlyConfigured
+
+POOL_MODES = ("persistent", "psycopg", "pgbouncer")
+
+_opened = 0
+_lock = threading.Lock()
+
+
+def _flag(value: str) -> bool:
+    return value.strip().lower() in ("1", "true", "yes")
+
+
+def database_settings(env: Mapping[str, str] = os.environ) -> dict:
+    """
+    Return the default database settings for the given environment.
+
+    Raises:
+        ImproperlyConfigured: if ``DB_POOL_MODE`` is unknown
+    """
+    mode = env.get("DB_POOL_MODE", "persistent").strip().lower() or "persistent"
+    if mode not in POOL_MODES:
+        raise ImproperlyConfigured(
+            f"DB_POOL_MODE must be one of: {', '.join(POOL_MODES)}"
+        )
+    database: dict[str, Any] = {
+        "ENGINE": env.get("DB_ENGINE", "django.db.backends.postgresql"),
+        "NAME": env.get("DB_NAME", "sims_db"),
+        "USER": env.get("DB_USER", "sims_user"),
+        "PASSWORD": env.get("DB_PASSWORD", "sims_password"),
+        "HOST": env.get("DB_HOST", "localhost"),
+        "PORT": env.get("DB_PORT", "5432"),
+        "CONN_MAX_AGE": int(env.get("DB_CONN_MAX_AGE", "60")),
+        "CONN_HEALTH_CHECKS": _flag(env.get("DB_CONN_HEALTH_CHECKS", "true")),
+        "OPTIONS": {},
+    }
+    if mode == "psycopg":
+        # Django rejects persistent connections on top of its pool.
+        database["CONN_MAX_AGE"] = 0
+        database["OPTIONS"]["pool"] = {
+            "min_size": int(env.get("DB_POOL_MIN_SIZE", "2")),
+            "max_size": int(env.get("DB_POOL_MAX_SIZE", "10")),
+            "timeout": float(env.get("DB_POOL_TIMEOUT", "10")),
+        }
+    elif mode == "pgbouncer":
+        database["DISABLE_SERVER_SIDE_CURSORS"] = True
+    return database
+
+
+def replica_databases(
+    default: dict, env: Mapping[str, str] = os.environ
+) -> dict[str, dict]:
+    """
+    Return ``replica_<n>`` settings for each ``host[:port]`` in
+    ``DB_REPLICA_HOSTS``, otherwise identical to ``default``.
+    """
+    replicas = {}
+    hosts = [h.strip() for h in env.get("DB_REPLICA_HOSTS", "").split(",")]
+    for number, host in enumerate(filter(None, hosts), start=1):
+        name, _, port = host.partition(":")
+        replica = copy.deepcopy(default)
+        replica.update(HOST=name, PORT=port or default["PORT"])
+        # Tests read the replicas through the primary's test database.
+        replica["TEST"] = {"MIRROR": "default"}
+        replicas[f"replica_{number}"] = replica
+    return replicas
+
+
+def count_connection(sender, connection, **kwargs) -> None:
+    """``connection_created`` receiver counting connections opened here."""
+    global _opened
+    with _lock:
+        _opened += 1
+
+
+def connection_stats(alias: str = "default") -> dict:
+    """
+    Report this process's connection settings and counters.
+
+    Returns:
+        Dict with the ``mode``, ``conn_max_age``, ``health_checks``, the
+        number of ``connections_opened`` by this process and, in ``psycopg``
+        mode, the pool's statistics (``requests_wait_ms``, ``pool_size``...)
+        under ``pool``
+    """
+    from django.db import connections
+
+    connection = connections[alias]
+    settings_dict = connection.settings_dict
+    pool = None
+    if settings_dict.get("OPTIONS", {}).get("pool"):
+        # Only the postgresql backend has a pool.
+        pool = getattr(connection, "pool", None)
+    if pool is not None:
+        mode = "psycopg"
+    elif settings_dict.get("DISABLE_SERVER_SIDE_CURSORS"):
+        mode = "pgbouncer"
+    else:
+        mode = "persistent"
+    return {
+        "mode": mode,
+        "conn_max_age": settings_dict.get("CONN_MAX_AGE", 0),
+        "health_checks": settings_dict.get("CONN_HEALTH_CHECKS", False),
+        "connections_opened": _opened,
+        "pool": pool.get_stats() if pool is not None else None,
+    }
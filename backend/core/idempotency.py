@@ -0,0 +1,153 @@
+"""
+Idempotency keys for POST endpoints that clients retry.
+
+A client sends an ``Idempotency-Key`` header (any unique string, e.g. a
+UUID) with a write and reuses it for every retry of that write. The first
+request claims the key in the cache (Redis in production) and runs; its
+response is stored for ``IDEMPOTENCY_KEY_TTL`` seconds and replayed to
+later requests with the same key, marked ``Idempotent-Replayed: true``,
+without running the view again. A duplicate that arrives while the first
+request is still running waits up to ``IDEMPOTENCY_WAIT_SECONDS`` for its
+response instead of running twice.
+
+Keys are scoped to the user and endpoint. Reusing a key for a different
+request body is rejected with 422. Server errors are not stored, so the
+client's next retry runs again. Requests without the header, and all
+requests while the cache is unreachable, run normally.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+logger = logging.getLogger(__name__)
+
+HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+IN_FLIGHT = "in_flight"
+
+
+def _error(code: int, message: str, headers: dict | None = None) -> Response:
+    return Response(
+        {"error": {"code": code, "message": message}}, status=code, headers=headers
+    )
+
+
+def cache_key(user_id, view_name: str, key: str) -> str:
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return f"idempotency:{user_id}:{view_name}:{digest}"
+
+
+def fingerprint(path: str, data) -> str:
+    body = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(f"{path}\n{body}".encode()).hexdigest()
+
+
+def _release(key: str) -> None:
+    try:
+        cache.delete(key)
+    except Exception:
+        logger.exception("Failed to release idempotency key")
+
+
+def _claim(key: str, request_fingerprint: str) -> dict | None:
+    """
+    Claim ``cache_key`` for this request or wait for its owner to finish.
+
+    Returns:
+        ``None`` once the key is claimed, otherwise the stored entry: the
+        owner's response, or the in-flight marker if it did not finish in time
+    """
+    deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_SECONDS
+    delay = 0.05
+    while True:
+        marker = {"state": IN_FLIGHT, "fingerprint": request_fingerprint}
+        if cache.add(key, marker, timeout=settings.IDEMPOTENCY_LOCK_SECONDS):
+            return None
+        entry: dict | None = cache.get(key)
+        # The owner failed and released the key: claim it again.
+        if entry is None:
+            continue
+        if (
+            entry["state"] != IN_FLIGHT
+            or entry["fingerprint"] != request_fingerprint
+            or time.monotonic() >= deadline
+        ):
+            return entry
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
+
+
+def idempotent(view):
+    """
+    Make a DRF view function or viewset action honour ``Idempotency-Key``.
+
+    Apply it below ``@api_view``/``@action`` so it runs after authentication.
+    """
+    view_name = view.__qualname__
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        request = next(arg for arg in args if isinstance(arg, Request))
+        key = request.headers.get(HEADER)
+        if not key:
+            return view(*args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return _error(400, f"{HEADER} must be at most {MAX_KEY_LENGTH} characters")
+
+        claim_key = cache_key(request.user.pk, view_name, key)
+        request_fingerprint = fingerprint(request.path, request.data)
+        try:
+            entry = _claim(claim_key, request_fingerprint)
+        except Exception:
+            logger.exception("Idempotency cache unavailable")
+            return view(*args, **kwargs)
+        if entry is not None:
+            if entry["fingerprint"] != request_fingerprint:
+                return _error(422, f"{HEADER} was already used for another request")
+            if entry["state"] == IN_FLIGHT:
+                return _error(
+                    409,
+                    f"A request with this {HEADER} is still being processed",
+                    headers={"Retry-After": "1"},
+                )
+            return Response(
+                entry["data"],
+                status=entry["status"],
+                headers={REPLAYED_HEADER: "true"},
+            )
+
+        try:
+            response = view(*args, **kwargs)
+        except BaseException:
+            _release(claim_key)
+            raise
+        if response.status_code >= 500:
+            _release(claim_key)
+            return response
+        try:
+            cache.set(
+                claim_key,
+                {
+                    "state": "done",
+                    "fingerprint": request_fingerprint,
+                    "status": response.status_code,
+                    "data": response.data,
+                },
+                timeout=settings.IDEMPOTENCY_KEY_TTL,
+            )
+        except Exception:
+            logger.exception("Failed to store idempotent response")
+        return response
+
+    return wrapper
@@ -0,0 +1,185 @@
+"""
+Management command to benchmark the API's hot paths
+"""
+
+import json
+import time
+import urllib.error
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import setup_databases, teardown_databases
+from django.utils import timezone
+
+from core.bench import (
+    SCENARIO_NAMES,
+    HTTPClient,
+    InProcessClient,
+    compare_reports,
+    run_benchmark,
+)
+from core.mixins import parse_csv_param
+from core.schema import code_version
+
+
+class Command(BaseCommand):
+    """
+    Measure latency percentiles, queries per request and throughput of the
+    API's hot paths.
+
+    By default a throwaway test database is created and seeded with
+    ``seed_demo --scale``, and requests go in-process through Django's test
+    client. ``--current-db`` benchmarks the configured database as it is, and
+    ``--url`` sends real HTTP requests to a running server (whose database
+    must be the configured one) from ``--concurrency`` threads.
+    ``attendance_mark`` writes new attendance rows.
+    """
+
+    help = "Benchmark the API's hot paths and save the results as JSON"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--students",
+            type=int,
+            default=500,
+            help="Students in the seeded dataset (default: 500)",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=10,
+            help="Attendance days per enrollment in the seeded dataset (default: 10)",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Random seed for the dataset"
+        )
+        parser.add_argument(
+            "--current-db",
+            action="store_true",
+            help="Benchmark the configured database instead of a seeded copy",
+        )
+        parser.add_argument(
+            "--url", help="Benchmark a running server at this base URL over HTTP"
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Concurrent HTTP clients with --url (default: 1)",
+        )
+        parser.add_argument("--username", default="admin", help="Login identifier")
+        parser.add_argument("--password", default="admin123", help="Login password")
+        parser.add_argument(
+            "--scenarios",
+            help=f"Comma-separated subset of: {', '.join(SCENARIO_NAMES)}",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=50,
+            help="Timed requests per scenario (default: 50)",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=3,
+            help="Untimed requests per scenario (default: 3)",
+        )
+        parser.add_argument("--output", help="Write the report to this JSON file")
+        parser.add_argument(
+            "--compare", help="Compare with a report saved by an earlier run"
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Print the report as JSON"
+        )
+
+    def handle(self, *args, **options):
+        scenarios = parse_csv_param(options["scenarios"]) or None
+        unknown = set(scenarios or ()) - set(SCENARIO_NAMES)
+        if unknown:
+            raise CommandError(f"Unknown scenarios: {', '.join(sorted(unknown))}")
+        baseline = None
+        if options["compare"]:
+            baseline = json.loads(Path(options["compare"]).read_text())
+
+        credentials = {
+            "identifier": options["username"],
+            "password": options["password"],
+        }
+        meta = {
+            "mode": "http" if options["url"] else "in-process",
+            "url": options["url"],
+            "concurrency": options["concurrency"] if options["url"] else 1,
+            "requests": options["requests"],
+            "warmup": options["warmup"],
+            "code_version": code_version(),
+            "created_at": timezone.now().isoformat(),
+        }
+        if options["url"]:
+            client = HTTPClient(options["url"], credentials, options["concurrency"])
+        else:
+            client = InProcessClient(credentials)
+
+        old_config = None
+        if not (options["url"] or options["current_db"]):
+            old_config = setup_databases(verbosity=0, interactive=False)
+        try:
+            if old_config is not None:
+                start = time.perf_counter()
+                call_command(
+                    "seed_demo",
+                    "--scale",
+                    "--students",
+                    str(options["students"]),
+                    "--days",
+                    str(options["days"]),
+                    "--seed",
+                    str(options["seed"]),
+                    stdout=StringIO(),
+                )
+                meta["dataset"] = {
+                    "students": options["students"],
+                    "days": options["days"],
+                    "seed": options["seed"],
+                    "seed_seconds": round(time.perf_counter() - start, 1),
+                }
+            results = run_benchmark(
+                client, scenarios, options["requests"], options["warmup"]
+            )
+        except (ValueError, urllib.error.URLError) as exc:
+            raise CommandError(str(exc)) from exc
+        finally:
+            if old_config is not None:
+                teardown_databases(old_config, verbosity=0)
+
+        report = {"meta": meta, "scenarios": results}
+        if options["output"]:
+            Path(options["output"]).write_text(json.dumps(report, indent=2))
+        comparison = compare_reports(baseline, report) if baseline else None
+        if options["json"]:
+            self.stdout.write(
+                json.dumps({**report, "comparison": comparison}, indent=2)
+            )
+            return
+
+        self.stdout.write(
+            f"{'scenario':<16} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+            f"{'queries':>8} {'req/s':>8} {'errors':>6}"
+        )
+        for name, row in results.items():
+            queries = row["queries_per_request"]
+            self.stdout.write(
+                f"{name:<16} {row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} "
+                f"{row['p99_ms']:>8.2f} {'-' if queries is None else queries:>8} "
+                f"{row['throughput_rps']:>8} {row['errors']:>6}"
+            )
+        if comparison:
+            self.stdout.write("\nChange from baseline (p50 / p95 / req/s, %):")
+            for row in comparison:
+                self.stdout.write(
+                    f"{row['scenario']:<16} {row['p50_ms']['change_pct']:>8} "
+                    f"{row['p95_ms']['change_pct']:>8} "
+                    f"{row['throughput_rps']['change_pct']:>8}"
+                )
@@ -0,0 +1,147 @@
+"""
+Management command to benchmark the stdlib and orjson JSON backends
+"""
+
+import io
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core import renderers
+from core.renderers import ORJSONParser, ORJSONRenderer
+from sims_backend.academics.models import Section
+from sims_backend.assessments.gradebook import build_gradebook
+from sims_backend.attendance.models import Attendance
+from sims_backend.attendance.serializers import AttendanceSerializer
+from sims_backend.audit.models import AuditLog
+from sims_backend.audit.serializers import AuditLogSerializer
+
+
+def _page(results) -> dict:
+    return {"count": len(results), "next": None, "previous": None, "results": results}
+
+
+def build_payloads(rows: int) -> dict:
+    """
+    Serialize the API's largest responses from the current database.
+
+    Returns:
+        Dict of payload name to the data a view would hand to the renderer:
+        an attendance page with ``student_detail``, an audit log page and the
+        gradebook of the section with the most enrollments. Payloads without
+        rows are left out.
+    """
+    payloads = {}
+    attendance = Attendance.objects.select_related("student").order_by("id")[:rows]
+    if attendance:
+        payloads["attendance"] = _page(AttendanceSerializer(attendance, many=True).data)
+    logs = AuditLog.objects.select_related("actor")[:rows]
+    if logs:
+        payloads["audit_logs"] = _page(AuditLogSerializer(logs, many=True).data)
+    section = (
+        Section.objects.annotate(size=Count("enrollments"))
+        .filter(size__gt=0)
+        .order_by("-size")
+        .first()
+    )
+    if section is not None:
+        payloads["gradebook"] = build_gradebook(section)
+    return payloads
+
+
+def _time(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def benchmark(payloads: dict, repeat: int) -> list[dict]:
+    """
+    Time rendering and parsing each payload with both backends.
+
+    Returns:
+        One row per payload with its ``bytes``, ``identical`` (whether both
+        renderers produce the same bytes) and the mean milliseconds per call
+        for ``render_stdlib``, ``render_orjson``, ``parse_stdlib`` and
+        ``parse_orjson``
+    """
+    report = []
+    for name, data in payloads.items():
+        content = JSONRenderer().render(data)
+        fast = ORJSONRenderer().render(data)
+        report.append(
+            {
+                "payload": name,
+                "bytes": len(content),
+                "identical": content == fast,
+                "render_stdlib": _time(lambda: JSONRenderer().render(data), repeat),
+                "render_orjson": _time(lambda: ORJSONRenderer().render(data), repeat),
+                "parse_stdlib": _time(
+                    lambda: JSONParser().parse(io.BytesIO(content)), repeat
+                ),
+                "parse_orjson": _time(
+                    lambda: ORJSONParser().parse(io.BytesIO(content)), repeat
+                ),
+            }
+        )
+    return report
+
+
+class Command(BaseCommand):
+    """
+    Compare DRF's stdlib JSON renderer and parser with the orjson pair on
+    representative payloads.
+
+    Payloads are built from the current database, so seed it first (e.g.
+    ``manage.py seed_demo --students 200``). Serialization happens once up
+    front; only encoding and decoding are timed.
+    """
+
+    help = "Benchmark the stdlib and orjson JSON renderers and parsers"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=500,
+            help="Rows per list payload (default: 500)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=50,
+            help="Timed iterations per payload (default: 50)",
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Print the report as JSON"
+        )
+
+    def handle(self, *args, **options):
+        payloads = build_payloads(options["rows"])
+        if not payloads:
+            raise CommandError("No data to benchmark; run `manage.py seed_demo` first")
+        report = benchmark(payloads, options["repeat"])
+        if options["json"]:
+            self.stdout.write(
+                json.dumps({"orjson": renderers.orjson is not None, "payloads": report})
+            )
+            return
+
+        if renderers.orjson is None:
+            self.stdout.write("orjson is not installed; both columns use the stdlib")
+        self.stdout.write(
+            f"{'payload':<12} {'bytes':>9} {'render ms':>17} {'parse ms':>17}  same"
+        )
+        self.stdout.write(f"{'':<22} {'stdlib/orjson':>17} {'stdlib/orjson':>17}")
+        for row in report:
+            self.stdout.write(
+                f"{row['payload']:<12} {row['bytes']:>9} "
+                f"{row['render_stdlib']:>8.3f}/{row['render_orjson']:<8.3f} "
+                f"{row['parse_stdlib']:>8.3f}/{row['parse_orjson']:<8.3f}  "
+                f"{'yes' if row['identical'] else 'NO'}"
+            )
@@ -0,0 +1,62 @@
+"""
+Management command to profile cold-start import time and memory
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+def run_profile(per_app: bool = True) -> dict:
+    """Profile startup in a fresh interpreter and return its report."""
+    command = [sys.executable, "-c", "from core.startup import main; main()"]
+    if not per_app:
+        command.append("--no-apps")
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE}
+    process = subprocess.run(
+        command, cwd=settings.BASE_DIR, env=env, capture_output=True, text=True
+    )
+    if process.returncode != 0:
+        raise CommandError(f"Startup profile failed:\n{process.stderr[-2000:]}")
+    report: dict = json.loads(process.stdout.strip().splitlines()[-1])
+    return report
+
+
+class Command(BaseCommand):
+    """
+    Report how long a fresh worker spends importing each app and how much
+    resident memory it adds.
+
+    The profile runs in a new interpreter so that nothing is already imported.
+    Modules shared by several apps are charged to the first app to import them.
+    """
+
+    help = "Profile cold-start import time and RSS per app"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--json", action="store_true", help="Print the report as JSON"
+        )
+
+    def handle(self, *args, **options):
+        report = run_profile()
+        if options["json"]:
+            self.stdout.write(json.dumps(report, indent=2))
+            return
+
+        steps = [report["setup"], *report["apps"], report["urlconf"]]
+        width = max(len(step["name"]) for step in steps)
+        self.stdout.write(f"{'step':<{width}}  {'ms':>8}  {'rss KiB':>8}")
+        for step in steps:
+            self.stdout.write(
+                f"{step['name']:<{width}}  {step['ms']:>8.1f}  {step['rss_kb']:>8}"
+            )
+        self.stdout.write(
+            f"total {report['total_ms']:.1f} ms, RSS {report['rss_kb']} KiB"
+        )
+        heavy = ", ".join(report["heavy_modules"]) or "none"
+        self.stdout.write(f"heavy optional modules loaded at startup: {heavy}")
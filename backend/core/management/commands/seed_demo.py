@@ -3,13 +3,19 @@ Management command to seed demo data for SIMS
 Creates sample Programs, Courses, Terms, Sections, Students, Enrollment, Attendance, Assessments, and Results
 """
 
+import csv
+import io
+import math
+import random
 from datetime import date, timedelta
+from itertools import islice
 
 from django.contrib.auth import get_user_model
-from django.core.management.base import BaseCommand
-from django.db import transaction
-from faker import Faker
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
 
+from core.cache import bump_namespaces
 from sims_backend.academics.models import Course, Program, Section, Term
 from sims_backend.admissions.models import Student
 from sims_backend.assessments.models import Assessment, AssessmentScore
@@ -18,7 +24,22 @@ from sims_backend.enrollment.models import Enrollment
 from sims_backend.results.models import Result
 
 User = get_user_model()
-fake = Faker()
+
+ASSESSMENT_SCHEME = [
+    {"type": "midterm", "weight": 30},
+    {"type": "final", "weight": 50},
+    {"type": "quiz", "weight": 10},
+    {"type": "assignment", "weight": 10},
+]
+# First day of the first generated term in --scale mode.
+SCALE_START = date(2024, 1, 15)
+
+
+def chunked(iterable, size):
+    """Yield lists of up to ``size`` items from ``iterable``."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
 
 
 class Command(BaseCommand):
@@ -51,6 +72,42 @@ class Command(BaseCommand):
             action="store_true",
             help="Clear existing data before seeding",
         )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Random seed; the same seed produces the same data (default: 0)",
+        )
+        parser.add_argument(
+            "--scale",
+            action="store_true",
+            help="Generate a large dataset with chunked bulk inserts",
+        )
+        parser.add_argument(
+            "--terms",
+            type=int,
+            default=2,
+            help="Terms to generate in --scale mode (default: 2)",
+        )
+        parser.add_argument(
+            "--sections",
+            type=int,
+            default=None,
+            help="Sections per term in --scale mode (default: about 40 "
+            "students per section)",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=10,
+            help="Attendance days per enrollment in --scale mode (default: 10)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=5000,
+            help="Rows per insert in --scale mode (default: 5000)",
+        )
 
     @transaction.atomic
     def handle(self, *args, **options):
@@ -65,6 +122,12 @@ class Command(BaseCommand):
             *args: Variable length argument list.
             **options: Keyword arguments, including command-line options.
         """
+        # Faker is only needed here, so it is not imported with the module.
+        from faker import Faker
+
+        self.fake = Faker()
+        self.fake.seed_instance(options["seed"])
+        self.rng = random.Random(options["seed"])
         num_students = options["students"]
         clear_data = options["clear"]
 
@@ -72,6 +135,10 @@ class Command(BaseCommand):
             self.stdout.write(self.style.WARNING("Clearing existing data..."))
             self._clear_data()
 
+        if options["scale"]:
+            self._seed_scale(options)
+            return
+
         self.stdout.write(self.style.SUCCESS("Starting data seeding..."))
 
         # Create users for different roles
@@ -202,8 +269,8 @@ class Command(BaseCommand):
                     username=username,
                     email=f"faculty{i}@sims.edu",
                     password="faculty123",
-                    first_name=fake.first_name(),
-                    last_name=fake.last_name(),
+                    first_name=self.fake.first_name(),
+                    last_name=self.fake.last_name(),
                 )
                 user.groups.add(faculty_group)
                 users[username] = user
@@ -403,7 +470,7 @@ class Command(BaseCommand):
             student, created = Student.objects.get_or_create(
                 reg_no=reg_no,
                 defaults={
-                    "name": f"{fake.first_name()} {fake.last_name()}",
+                    "name": f"{self.fake.first_name()} {self.fake.last_name()}",
                     "program": bscs_program.name,
                     "status": "active",
                 },
@@ -428,7 +495,7 @@ class Command(BaseCommand):
 
         for student in students:
             # Enroll each student in 4-5 sections
-            student_sections = sections[: (4 + (hash(student.reg_no) % 2))]
+            student_sections = sections[: 4 + self.rng.randint(0, 1)]
 
             for section in student_sections:
                 enrollment, created = Enrollment.objects.get_or_create(
@@ -452,20 +519,19 @@ class Command(BaseCommand):
             enrollments (list): A list of `Enrollment` objects.
         """
         attendance_count = 0
+        start_dates = dict(Term.objects.values_list("name", "start_date"))
 
         for enrollment in enrollments:
             # Create 10 attendance records per enrollment
             # Get term start date from enrollment
-            try:
-                term = Term.objects.get(name=enrollment.term)
-                start_date = term.start_date
-            except Term.DoesNotExist:
-                start_date = date.today() - timedelta(days=30)
+            start_date = start_dates.get(
+                enrollment.term, date.today() - timedelta(days=30)
+            )
 
             for day in range(0, 30, 3):  # Every 3 days for 10 records
                 attendance_date = start_date + timedelta(days=day)
                 # 80% attendance rate
-                present = (hash(str(enrollment.id) + str(day)) % 10) < 8
+                present = self.rng.random() < 0.8
 
                 Attendance.objects.get_or_create(
                     section=enrollment.section,
@@ -488,15 +554,7 @@ class Command(BaseCommand):
             sections (list): A list of `Section` objects.
         """
         for section in sections:
-            # Create assessment scheme
-            assessments_data = [
-                {"type": "midterm", "weight": 30},
-                {"type": "final", "weight": 50},
-                {"type": "quiz", "weight": 10},
-                {"type": "assignment", "weight": 10},
-            ]
-
-            for data in assessments_data:
+            for data in ASSESSMENT_SCHEME:
                 assessment, created = Assessment.objects.get_or_create(
                     section=section,
                     type=data["type"],
@@ -507,14 +565,7 @@ class Command(BaseCommand):
                 enrollments = Enrollment.objects.filter(section=section)
                 for enrollment in enrollments:
                     # Random score between 60-95 out of 100
-                    base_score = 60
-                    variance = 35
-                    score = (
-                        base_score
-                        + (hash(str(enrollment.id) + str(assessment.id)) % 100)
-                        / 100
-                        * variance
-                    )
+                    score = self.rng.uniform(60, 95)
 
                     AssessmentScore.objects.get_or_create(
                         assessment=assessment,
@@ -563,6 +614,306 @@ class Command(BaseCommand):
 
         self.stdout.write(f"  ✓ Created {results_count} results")
 
+    def _seed_scale(self, options):
+        """
+        Seeds a large, reproducible dataset for performance work.
+
+        Every value comes from the seeded RNG, so the same options always
+        produce the same rows. Rows are generated lazily and inserted
+        ``--chunk-size`` at a time with ``bulk_create`` (attendance uses COPY
+        on PostgreSQL), so memory stays flat. Model signals do not fire; the
+        reference-data caches are invalidated once at the end.
+
+        Args:
+            options (dict): The command-line options.
+        """
+        if Student.objects.exists():
+            raise CommandError("--scale needs an empty database; add --clear")
+
+        num_students = options["students"]
+        days = options["days"]
+        chunk_size = options["chunk_size"]
+        per_term = options["sections"] or max(12, math.ceil(num_students * 4.5 / 40))
+
+        users = self._create_users()
+        faculty = [users[f"faculty{suffix}"] for suffix in ("", "1", "2", "3")]
+        programs = self._create_programs()
+        terms = Term.objects.bulk_create(self._scale_terms(options["terms"]))
+        courses = Course.objects.bulk_create(
+            Course(
+                code=f"SC{i + 1:04d}",
+                title=f"Scale Course {i + 1}",
+                credits=self.rng.choice((3, 3, 4)),
+                program=programs[i % len(programs)],
+            )
+            for i in range(per_term)
+        )
+        self.stdout.write(f"  ✓ Created {len(terms)} terms, {len(courses)} courses")
+
+        # Section indexes each student takes, per term.
+        plan = [
+            [
+                self.rng.sample(
+                    range(per_term), min(4 + self.rng.randint(0, 1), per_term)
+                )
+                for _ in range(num_students)
+            ]
+            for _ in terms
+        ]
+        section_ids = []
+        for term, choices in zip(terms, plan):
+            load = [0] * per_term
+            for picked in choices:
+                for index in picked:
+                    load[index] += 1
+            sections = Section.objects.bulk_create(
+                Section(
+                    course=course,
+                    term=term.name,
+                    teacher=faculty[i % len(faculty)],
+                    teacher_name=faculty[i % len(faculty)].get_full_name(),
+                    capacity=max(30, load[i]),
+                )
+                for i, course in enumerate(courses)
+            )
+            section_ids.append([section.id for section in sections])
+        self.stdout.write(f"  ✓ Created {len(terms) * per_term} sections")
+
+        student_ids = []
+        for batch in chunked(self._scale_students(num_students), chunk_size):
+            student_ids.extend(
+                student.id for student in Student.objects.bulk_create(batch)
+            )
+        self.stdout.write(f"  ✓ Created {len(student_ids)} students")
+
+        enrollments = [
+            (term, student_id, section_ids[t][index])
+            for t, term in enumerate(terms)
+            for student_id, picked in zip(student_ids, plan[t])
+            for index in picked
+        ]
+        del plan
+        count = self._bulk_create(
+            Enrollment,
+            (
+                Enrollment(
+                    student_id=student_id,
+                    section_id=section_id,
+                    term=term.name,
+                    status="enrolled",
+                )
+                for term, student_id, section_id in enrollments
+            ),
+            chunk_size,
+        )
+        self.stdout.write(f"  ✓ Created {count} enrollments")
+
+        count = self._insert_attendance(
+            self._scale_attendance(enrollments, days), chunk_size
+        )
+        self.stdout.write(f"  ✓ Created {count} attendance records")
+
+        assessments = self._bulk_create(
+            Assessment,
+            (
+                Assessment(section_id=section_id, **data)
+                for ids in section_ids
+                for section_id in ids
+                for data in ASSESSMENT_SCHEME
+            ),
+            chunk_size,
+        )
+        scheme = {}
+        term_names = [term.name for term in terms]
+        for assessment in Assessment.objects.filter(
+            section__term__in=term_names
+        ).values("id", "section_id", "weight"):
+            scheme.setdefault(assessment["section_id"], []).append(
+                (assessment["id"], assessment["weight"])
+            )
+        grades = []
+        count = self._bulk_create(
+            AssessmentScore, self._scale_scores(enrollments, scheme, grades), chunk_size
+        )
+        results = self._bulk_create(
+            Result,
+            (
+                Result(
+                    student_id=student_id,
+                    section_id=section_id,
+                    final_grade=grade,
+                    state="draft",
+                )
+                for (_, student_id, section_id), grade in zip(enrollments, grades)
+            ),
+            chunk_size,
+        )
+        self.stdout.write(
+            f"  ✓ Created {assessments} assessments, {count} scores and "
+            f"{results} results"
+        )
+
+        bump_namespaces("programs", "courses", "terms")
+        self.stdout.write(self.style.SUCCESS("\n✅ Scale data seeded successfully!"))
+
+    def _scale_terms(self, num_terms):
+        """
+        Builds alternating Spring and Fall terms from ``SCALE_START``.
+
+        Args:
+            num_terms (int): The number of terms.
+
+        Returns:
+            list: Unsaved `Term` objects, oldest first; only the last is open.
+        """
+        terms = []
+        for i in range(num_terms):
+            year = SCALE_START.year + i // 2
+            if i % 2 == 0:
+                name, start, end = "Spring", date(year, 1, 15), date(year, 5, 15)
+            else:
+                name, start, end = "Fall", date(year, 9, 1), date(year, 12, 31)
+            terms.append(
+                Term(
+                    name=f"{name} {year}",
+                    start_date=start,
+                    end_date=end,
+                    status="open" if i == num_terms - 1 else "closed",
+                )
+            )
+        return terms
+
+    def _scale_students(self, num_students):
+        """
+        Yields unsaved `Student` objects spread across the demo programs.
+
+        Args:
+            num_students (int): The number of students.
+        """
+        programs = [
+            ("CS", "Bachelor of Science in Computer Science"),
+            ("EE", "Bachelor of Science in Electrical Engineering"),
+            ("MBA", "Master of Business Administration"),
+        ]
+        for i in range(num_students):
+            code, program = programs[i % len(programs)]
+            yield Student(
+                reg_no=f"{SCALE_START.year}-{code}-{i + 1:05d}",
+                name=f"{self.fake.first_name()} {self.fake.last_name()}",
+                program=program,
+                status="active",
+            )
+
+    def _scale_attendance(self, enrollments, days):
+        """
+        Yields ``(section_id, student_id, date, present, reason)`` rows.
+
+        Each enrollment gets ``days`` records spread evenly over its term,
+        with an 80% attendance rate.
+
+        Args:
+            enrollments (list): ``(term, student_id, section_id)`` tuples.
+            days (int): Attendance records per enrollment.
+        """
+        for term, student_id, section_id in enrollments:
+            step = max(1, (term.end_date - term.start_date).days // max(days, 1))
+            for day in range(days):
+                present = self.rng.random() < 0.8
+                yield (
+                    section_id,
+                    student_id,
+                    term.start_date + timedelta(days=day * step),
+                    present,
+                    "" if present else "Absent",
+                )
+
+    def _scale_scores(self, enrollments, scheme, grades):
+        """
+        Yields assessment scores for every enrollment.
+
+        Args:
+            enrollments (list): ``(term, student_id, section_id)`` tuples.
+            scheme (dict): Section id to its ``(assessment_id, weight)`` pairs.
+            grades (list): Receives each enrollment's final grade, in order,
+                as its scores are generated.
+        """
+        for _, student_id, section_id in enrollments:
+            total = 0
+            for assessment_id, weight in scheme.get(section_id, []):
+                score = round(self.rng.uniform(60, 95), 2)
+                total += score / 100 * weight
+                yield AssessmentScore(
+                    assessment_id=assessment_id,
+                    student_id=student_id,
+                    score=score,
+                    max_score=100,
+                )
+            grades.append(self._calculate_grade(total))
+
+    def _bulk_create(self, model, objects, chunk_size):
+        """
+        Inserts ``objects`` in chunks of ``chunk_size``.
+
+        Returns:
+            int: The number of rows inserted.
+        """
+        count = 0
+        for batch in chunked(objects, chunk_size):
+            model.objects.bulk_create(batch)
+            count += len(batch)
+        return count
+
+    def _insert_attendance(self, rows, chunk_size):
+        """
+        Inserts attendance rows, with COPY on PostgreSQL.
+
+        Args:
+            rows: ``(section_id, student_id, date, present, reason)`` tuples.
+            chunk_size (int): Rows per statement.
+
+        Returns:
+            int: The number of rows inserted.
+        """
+        if connection.vendor != "postgresql":
+            return self._bulk_create(
+                Attendance,
+                (
+                    Attendance(
+                        section_id=section_id,
+                        student_id=student_id,
+                        date=day,
+                        present=present,
+                        reason=reason,
+                    )
+                    for section_id, student_id, day, present, reason in rows
+                ),
+                chunk_size,
+            )
+
+        quote = connection.ops.quote_name
+        columns = ("section_id", "student_id", "date", "present", "reason")
+        sql = (
+            f"COPY {quote(Attendance._meta.db_table)} "
+            f"({', '.join(map(quote, (*columns, 'updated_at')))}) "
+            "FROM STDIN WITH (FORMAT csv)"
+        )
+        now = timezone.now().isoformat()
+        count = 0
+        with connection.cursor() as cursor:
+            for batch in chunked(rows, chunk_size):
+                buffer = io.StringIO()
+                csv.writer(buffer, quoting=csv.QUOTE_ALL).writerows(
+                    (*row, now) for row in batch
+                )
+                buffer.seek(0)
+                if hasattr(cursor, "copy_expert"):  # psycopg2
+                    cursor.copy_expert(sql, buffer)
+                else:  # psycopg 3
+                    with cursor.copy(sql) as copy:
+                        copy.write(buffer.getvalue())
+                count += len(batch)
+        return count
+
     def _calculate_grade(self, score):
         """
         Calculates the letter grade based on a numerical score.
@@ -0,0 +1,56 @@
+# Generated by Django 5.1.4 on 2026-10-19 17:08
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "model",
+                    models.CharField(
+                        help_text="The `app_label.Model` label of the deleted object.",
+                        max_length=100,
+                    ),
+                ),
+                (
+                    "object_id",
+                    models.CharField(
+                        help_text="The primary key of the deleted object.",
+                        max_length=64,
+                    ),
+                ),
+                (
+                    "deleted_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="The timestamp when the object was deleted.",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("deleted_at", "id"),
+                "indexes": [
+                    models.Index(
+                        fields=["model", "deleted_at", "id"], name="tombstone_feed_idx"
+                    )
+                ],
+            },
+        ),
+    ]
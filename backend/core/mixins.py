@@ -0,0 +1,454 @@
+"""Reusable serializer and viewset mixins shared by the SIMS apps."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import json
+from collections.abc import Iterable
+from datetime import UTC
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.dateparse import parse_datetime
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.generics import GenericAPIView
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+
+from .models import Tombstone
+from .replicas import use_replica
+
+
+def parse_csv_param(value: str | None) -> list[str]:
+    """Split a comma-separated query parameter into a list of names."""
+    if not value:
+        return []
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def _query_params(request):
+    return getattr(request, "query_params", None) or getattr(request, "GET", {})
+
+
+class ExpandableFieldsMixin:
+    """
+    Serializer mixin adding sparse fieldsets and opt-in nested expansion.
+
+    ``?fields=id,name`` trims the representation of safe requests to the listed
+    top-level keys. ``?expand=student_detail`` embeds a related object declared
+    in ``Meta.expandable_fields``, which maps an output name to a
+    ``(serializer_class, options)`` pair; ``options`` are passed to the nested
+    serializer and may set ``source``, ``many`` and ``fields``. Dotted paths
+    such as ``section_detail.course_detail`` expand through nested serializers.
+
+    Names in ``Meta.default_expand`` are embedded unless ``?fields=`` leaves
+    them out, so clients that send neither parameter see the same payload as
+    before.
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        expand = kwargs.pop("expand", None)
+        super().__init__(*args, **kwargs)
+
+        request = self.context.get("request")
+        if request is not None:
+            params = _query_params(request)
+            if fields is None and request.method in SAFE_METHODS:
+                fields = parse_csv_param(params.get("fields"))
+            if expand is None:
+                expand = parse_csv_param(params.get("expand"))
+
+        expansions = self.resolve_expansions(fields or (), expand or ())
+        expandable = self.get_expandable_fields()
+        for name, nested_expand in expansions.items():
+            serializer_class, options = expandable[name]
+            options = dict(options)
+            if issubclass(serializer_class, ExpandableFieldsMixin):
+                options["expand"] = nested_expand
+            self.fields[name] = serializer_class(read_only=True, **options)
+
+        if fields:
+            keep = set(fields) | set(expansions)
+            for name in list(self.fields):
+                if name not in keep:
+                    self.fields.pop(name)
+
+    @classmethod
+    def get_expandable_fields(cls) -> dict:
+        return getattr(getattr(cls, "Meta", None), "expandable_fields", {})
+
+    @classmethod
+    def resolve_expansions(
+        cls, fields: Iterable[str] = (), expand: Iterable[str] = ()
+    ) -> dict[str, list[str]]:
+        """Map each expanded field name to the nested paths it forwards."""
+        fields = list(fields)
+        expandable = cls.get_expandable_fields()
+        expansions: dict[str, list[str]] = {}
+
+        for path in expand:
+            name, _, rest = path.partition(".")
+            if name not in expandable:
+                continue
+            nested = expansions.setdefault(name, [])
+            if rest:
+                nested.append(rest)
+
+        for name in getattr(getattr(cls, "Meta", None), "default_expand", ()):
+            if name in expandable and (not fields or name in fields):
+                expansions.setdefault(name, [])
+
+        return expansions
+
+    @classmethod
+    def get_related_lookups(
+        cls,
+        fields: Iterable[str] = (),
+        expand: Iterable[str] = (),
+        prefix: str = "",
+    ) -> tuple[list[str], list[str]]:
+        """
+        Return the ``select_related`` and ``prefetch_related`` lookups needed
+        to render the requested expansions without per-row queries.
+        """
+        select: list[str] = []
+        prefetch: list[str] = []
+        expandable = cls.get_expandable_fields()
+
+        for name, nested_expand in cls.resolve_expansions(fields, expand).items():
+            serializer_class, options = expandable[name]
+            lookup = prefix + options.get("source", name).replace(".", "__")
+            many = options.get("many", False)
+            (prefetch if many else select).append(lookup)
+
+            if issubclass(serializer_class, ExpandableFieldsMixin):
+                nested_select, nested_prefetch = serializer_class.get_related_lookups(
+                    options.get("fields") or (), nested_expand, prefix=f"{lookup}__"
+                )
+                if many:
+                    prefetch.extend(nested_select)
+                else:
+                    select.extend(nested_select)
+                prefetch.extend(nested_prefetch)
+
+        return select, prefetch
+
+
+class ExpandableQuerysetMixin:
+    """
+    ViewSet mixin that applies ``select_related``/``prefetch_related`` for the
+    expansions requested through an :class:`ExpandableFieldsMixin` serializer.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        request = getattr(self, "request", None)
+        serializer_class = self.get_serializer_class()
+        if request is None or not issubclass(serializer_class, ExpandableFieldsMixin):
+            return queryset
+
+        params = _query_params(request)
+        fields = (
+            parse_csv_param(params.get("fields"))
+            if request.method in SAFE_METHODS
+            else []
+        )
+        select, prefetch = serializer_class.get_related_lookups(
+            fields, parse_csv_param(params.get("expand"))
+        )
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
+
+
+def _stamp_lookups(view: GenericAPIView, field: str, model) -> list[str]:
+    """Lookups of ``field`` on ``model`` and on the relations ``view`` expands."""
+    if not _has_field(model, field):
+        return []
+
+    lookups = [field]
+    serializer_class = view.get_serializer_class()
+    if issubclass(serializer_class, ExpandableFieldsMixin):
+        params = _query_params(view.request)
+        select, _ = serializer_class.get_related_lookups(
+            parse_csv_param(params.get("fields")),
+            parse_csv_param(params.get("expand")),
+        )
+        for lookup in select:
+            related = _related_model(model, lookup)
+            if related is not None and _has_field(related, field):
+                lookups.append(f"{lookup}__{field}")
+    return lookups
+
+
+class ConditionalGetMixin:
+    """
+    ViewSet mixin answering unchanged list and detail polls with
+    ``304 Not Modified`` before anything is serialized.
+
+    Validators are built from ``conditional_timestamp_field``. A list is
+    stamped with ``MAX(updated_at)`` and the row count from one aggregate
+    query; a detail with the object's own timestamp. Expanded relations that
+    carry the same field contribute their timestamps too, so editing an
+    embedded object changes the ETag.
+    """
+
+    conditional_timestamp_field = "updated_at"
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        lookups = _stamp_lookups(self, self.conditional_timestamp_field, queryset.model)
+        if not lookups:
+            return super().list(request, *args, **kwargs)
+
+        values = queryset.order_by().aggregate(
+            row_count=Count("pk"),
+            **{f"stamp_{i}": Max(lookup) for i, lookup in enumerate(lookups)},
+        )
+        stamps = [values[f"stamp_{i}"] for i in range(len(lookups))]
+        validators = self._build_validators(request, [values["row_count"], *stamps])
+
+        not_modified = get_conditional_response(request, *validators)
+        if not_modified is not None:
+            return self._set_validators(not_modified, *validators)
+        response = super().list(request, *args, **kwargs)
+        return self._set_validators(response, *validators)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        lookups = _stamp_lookups(
+            self, self.conditional_timestamp_field, type(instance)
+        )
+        if not lookups:
+            return Response(self.get_serializer(instance).data)
+
+        stamps = [self._resolve_stamp(instance, lookup) for lookup in lookups]
+        validators = self._build_validators(request, [instance.pk, *stamps])
+
+        not_modified = get_conditional_response(request, *validators)
+        if not_modified is not None:
+            return self._set_validators(not_modified, *validators)
+        response = Response(self.get_serializer(instance).data)
+        return self._set_validators(response, *validators)
+
+    @staticmethod
+    def _resolve_stamp(instance, lookup: str):
+        value = instance
+        for part in lookup.split("__"):
+            value = getattr(value, part, None)
+            if value is None:
+                return None
+        return value
+
+    def _build_validators(self, request, parts) -> tuple[str, int | None]:
+        user = getattr(request, "user", None)
+        raw = "|".join(
+            [str(getattr(user, "pk", "")), request.get_full_path()]
+            + [part.isoformat() if hasattr(part, "isoformat") else str(part) for part in parts]
+        )
+        etag = f'W/"{hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()}"'
+        stamps = [part for part in parts[1:] if part is not None]
+        last_modified = int(max(stamps).timestamp()) if stamps else None
+        return etag, last_modified
+
+    @staticmethod
+    def _set_validators(response, etag: str, last_modified: int | None):
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        # Clients may keep the body but must revalidate it on every poll.
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ["Authorization"])
+        return response
+
+
+class ChangesFeedMixin:
+    """
+    ViewSet mixin adding a ``changes/`` endpoint for incremental sync.
+
+    ``GET changes/?updated_since=<ISO 8601>`` returns rows whose
+    ``updated_at`` is later than the given time, ordered by
+    ``(updated_at, id)``, together with the primary keys of rows deleted since
+    then (see :class:`core.models.Tombstone`). Each page carries an opaque
+    ``next_cursor``; passing it back as ``?cursor=`` resumes exactly after the
+    last row served, so rows sharing a timestamp are neither skipped nor
+    repeated. The viewset's own filters and role scoping still apply.
+
+    Tombstones keep only a primary key, so they cannot be scoped like the live
+    rows. Viewsets whose ``get_queryset`` narrows rows by role list in
+    ``changes_deletions_roles`` the groups that may list every row; other
+    users (superusers aside) get an empty ``deleted`` list.
+    """
+
+    changes_default_limit = 100
+    changes_max_limit = 1000
+    changes_deletions_roles: tuple[str, ...] | None = None
+
+    @action(detail=False, methods=["get"])
+    def changes(self, request):
+        params = request.query_params
+        try:
+            position = self._get_feed_position(params)
+            limit = self._get_feed_limit(params)
+        except ValueError as exc:
+            return Response(
+                {"error": {"code": 400, "message": str(exc)}},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        queryset = self.filter_queryset(self.get_queryset())
+        since, last_id = position["u"], position["i"]
+        if since is not None:
+            queryset = queryset.filter(
+                Q(updated_at__gt=since) | Q(updated_at=since, pk__gt=last_id)
+            )
+        rows = list(queryset.order_by("updated_at", "pk")[: limit + 1])
+
+        deleted = []
+        if self._can_see_deletions(request.user):
+            tombstones = Tombstone.objects.filter(model=queryset.model._meta.label)
+            deleted_since, last_tombstone = position["du"], position["di"]
+            if deleted_since is not None:
+                tombstones = tombstones.filter(
+                    Q(deleted_at__gt=deleted_since)
+                    | Q(deleted_at=deleted_since, pk__gt=last_tombstone)
+                )
+            deleted = list(
+                tombstones.order_by("deleted_at", "pk").values_list(
+                    "pk", "object_id", "deleted_at"
+                )[: limit + 1]
+            )
+
+        has_more = len(rows) > limit or len(deleted) > limit
+        rows, deleted = rows[:limit], deleted[:limit]
+        if rows:
+            position["u"], position["i"] = rows[-1].updated_at, rows[-1].pk
+        if deleted:
+            position["di"], _, position["du"] = deleted[-1]
+
+        return Response(
+            {
+                "results": self.get_serializer(rows, many=True).data,
+                "deleted": [object_id for _, object_id, _ in deleted],
+                "next_cursor": _encode_cursor(position),
+                "has_more": has_more,
+            }
+        )
+
+    def _can_see_deletions(self, user) -> bool:
+        roles = self.changes_deletions_roles
+        if roles is None or user.is_superuser:
+            return True
+        return bool(user.groups.filter(name__in=roles).exists())
+
+    @staticmethod
+    def _get_feed_position(params) -> dict:
+        if params.get("cursor"):
+            return _decode_cursor(params["cursor"])
+
+        since = params.get("updated_since")
+        if not since:
+            # A full sync has nothing to delete; only later deletions matter.
+            return {"u": None, "i": 0, "du": timezone.now(), "di": 0}
+        since = _parse_timestamp(since)
+        if since is None:
+            raise ValueError("updated_since must be an ISO 8601 datetime")
+        return {"u": since, "i": 0, "du": since, "di": 0}
+
+    def _get_feed_limit(self, params) -> int:
+        raw = params.get("limit")
+        if raw is None:
+            return self.changes_default_limit
+        try:
+            limit = int(raw)
+        except ValueError:
+            raise ValueError("limit must be an integer") from None
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        return min(limit, self.changes_max_limit)
+
+
+def _parse_timestamp(value: str):
+    try:
+        parsed = parse_datetime(value)
+    except ValueError:
+        return None
+    if parsed is not None and timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed, UTC)
+    return parsed
+
+
+def _encode_cursor(position: dict) -> str:
+    payload = {
+        key: value.isoformat() if hasattr(value, "isoformat") else value
+        for key, value in position.items()
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(token: str) -> dict:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token.encode()))
+        position = {
+            "u": _parse_timestamp(payload["u"]) if payload["u"] else None,
+            "i": int(payload["i"]),
+            "du": _parse_timestamp(payload["du"]) if payload["du"] else None,
+            "di": int(payload["di"]),
+        }
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValueError("Invalid cursor") from None
+    return position
+
+
+def _has_field(model, name: str) -> bool:
+    try:
+        model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    return True
+
+
+def _related_model(model, lookup: str):
+    for part in lookup.split("__"):
+        try:
+            model = model._meta.get_field(part).related_model
+        except FieldDoesNotExist:
+            return None
+        if model is None:
+            return None
+    return model
+
+
+class ReplicaReadMixin:
+    """
+    ViewSet mixin serving safe requests from a read replica.
+
+    The replica is chosen after authentication so that a user who wrote
+    recently is kept on the primary (see ``core.replicas``).
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self._replica = use_replica(request)
+        self._replica.__enter__()
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        replica = getattr(self, "_replica", None)
+        if replica is not None:
+            self._replica = None
+            replica.__exit__(None, None, None)
+        return super().finalize_response(request, response, *args, **kwargs)
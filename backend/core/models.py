@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from django.db import models
+from django.utils import timezone
 
 
 class TimeStampedModel(models.Model):
@@ -39,3 +40,35 @@ class TimeStampedModel(models.Model):
             self.save(using=using, update_fields=list(update_fields))
         else:
             self.save(using=using)
+
+
+class Tombstone(models.Model):
+    """A record that a row was deleted, served by the changes feed.
+
+    Incremental sync clients cannot see deleted rows in a queryset, so a
+    tombstone keeps the model label and primary key of every deleted object
+    tracked by the feed.
+    """
+
+    model = models.CharField(
+        max_length=100, help_text="The `app_label.Model` label of the deleted object."
+    )
+    object_id = models.CharField(
+        max_length=64, help_text="The primary key of the deleted object."
+    )
+    deleted_at = models.DateTimeField(
+        default=timezone.now, help_text="The timestamp when the object was deleted."
+    )
+
+    class Meta:
+        """Meta options for the Tombstone model."""
+
+        ordering = ("deleted_at", "id")
+        indexes = [
+            models.Index(
+                fields=["model", "deleted_at", "id"], name="tombstone_feed_idx"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.model} #{self.object_id}"
@@ -0,0 +1,77 @@
+"""
+orjson-backed JSON renderer and parser.
+
+Enabled with ``API_JSON_BACKEND=orjson`` (see ``REST_FRAMEWORK`` in
+settings). The output is byte-for-byte what DRF's ``JSONRenderer`` produces
+with the project's settings (compact, UTF-8, ``\\u2028``/``\\u2029``
+escaped): datetimes, dates and times go through DRF's ``JSONEncoder`` rather
+than orjson's own formatting, and so do Decimals, lazy strings and
+querysets. UUIDs are written as ``str(uuid)`` by both. The exceptions are
+floats in exponent notation (``1e-07`` becomes ``1e-7``, the same number)
+and NaN/Infinity, which orjson writes as ``null`` where the stdlib renderer
+raises.
+
+Anything orjson cannot encode or decode (indented output for the browsable
+API, integers wider than 64 bits, non-UTF-8 request bodies) is handed to the
+stdlib implementation, so error messages are unchanged too. Without orjson
+installed both classes behave exactly like DRF's.
+"""
+
+from __future__ import annotations
+
+import io
+
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+    | orjson.OPT_NON_STR_KEYS
+    if orjson
+    else 0
+)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """``JSONRenderer`` encoding with orjson when it is installed."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            or not self.compact
+            or self.ensure_ascii
+            or self.get_indent(accepted_media_type, renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(
+                data, default=self.encoder_class().default, option=OPTIONS
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
+
+
+class ORJSONParser(JSONParser):
+    """``JSONParser`` decoding with orjson when it is installed."""
+
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get("encoding", "utf-8")
+        if orjson is None or encoding.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type, parser_context)
+        content = stream.read()
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().parse(io.BytesIO(content), media_type, parser_context)
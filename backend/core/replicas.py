@@ -0,0 +1,175 @@
+"""
+Read-replica routing.
+
+Replicas are the ``replica_*`` aliases in ``DATABASES`` (see
+``core.db.replica_databases``). Queries only go to a replica inside
+``use_replica()``, which designated viewsets (:class:`~core.mixins.ReplicaReadMixin`)
+enter for safe requests and reporting jobs enter through ``replica_reads``.
+Everything else, including every write and every read inside a transaction,
+stays on the primary.
+
+Read-your-writes: after a successful write, ``ReplicaPinMiddleware`` pins
+the client to the primary for ``DB_REPLICA_PIN_SECONDS``, with a cookie and,
+for authenticated users, a cache entry (API clients do not send cookies).
+
+A replica that cannot be reached is skipped for ``DB_REPLICA_RETRY_SECONDS``
+and reads fall back to the next replica or the primary.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from rest_framework.permissions import SAFE_METHODS
+
+logger = logging.getLogger(__name__)
+
+PIN_COOKIE = "sims_db_pin"
+
+_target: ContextVar[str | None] = ContextVar("replica_target", default=None)
+# Replica alias -> monotonic time before which it is not retried.
+_unavailable: dict[str, float] = {}
+
+
+def replica_aliases() -> list[str]:
+    return [alias for alias in settings.DATABASES if alias.startswith("replica_")]
+
+
+def _pin_key(user_id: int) -> str:
+    return f"replica:pin:{user_id}"
+
+
+def _available(alias: str) -> bool:
+    if _unavailable.get(alias, 0) > time.monotonic():
+        return False
+    try:
+        connections[alias].ensure_connection()
+    except DatabaseError:
+        logger.warning("Read replica %s unavailable, using the primary", alias)
+        _unavailable[alias] = time.monotonic() + settings.DB_REPLICA_RETRY_SECONDS
+        return False
+    _unavailable.pop(alias, None)
+    return True
+
+
+def pick_replica() -> str | None:
+    """Return a reachable replica alias, or ``None`` to use the primary."""
+    aliases = replica_aliases()
+    random.shuffle(aliases)
+    return next((alias for alias in aliases if _available(alias)), None)
+
+
+def is_pinned(request) -> bool:
+    """Whether ``request``'s client wrote recently and must read the primary."""
+    if PIN_COOKIE in request.COOKIES:
+        return True
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        try:
+            return cache.get(_pin_key(user.pk)) is not None
+        except Exception:
+            logger.exception("Replica pin lookup failed")
+            return True
+    return False
+
+
+@contextmanager
+def use_replica(request=None):
+    """
+    Route reads inside the block to a replica.
+
+    With a ``request``, unsafe methods and pinned clients stay on the primary.
+    """
+    alias = None
+    if request is None or (request.method in SAFE_METHODS and not is_pinned(request)):
+        alias = pick_replica()
+    token = _target.set(alias)
+    try:
+        yield alias
+    finally:
+        _target.reset(token)
+
+
+def replica_reads(func: Callable) -> Callable:
+    """Decorate a read-only (reporting) job to read from a replica."""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with use_replica():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+class ReplicaRouter:
+    """Send reads to the active replica and everything else to the primary."""
+
+    def db_for_read(self, model, **hints):
+        alias = _target.get()
+        if alias is None or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+        return alias
+
+    def db_for_write(self, model, **hints):
+        # Instances read from a replica must still be saved to the primary.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *replica_aliases()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return False if db in replica_aliases() else None
+
+
+class ReplicaPinMiddleware:
+    """Pin clients to the primary for a short window after a write."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self.get_response(request)
+        self._pin(request, response)
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if request.method not in SAFE_METHODS:
+            await sync_to_async(self._pin)(request, response)
+        return response
+
+    def _pin(self, request, response) -> None:
+        if (
+            request.method in SAFE_METHODS
+            or response.status_code >= 400
+            or not replica_aliases()
+        ):
+            return
+        seconds = settings.DB_REPLICA_PIN_SECONDS
+        response.set_cookie(PIN_COOKIE, "1", max_age=seconds, httponly=True)
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            try:
+                cache.set(_pin_key(user.pk), 1, timeout=seconds)
+            except Exception:
+                logger.exception("Failed to pin client to the primary")
@@ -0,0 +1,116 @@
+"""
+Prebuilt OpenAPI schema.
+
+Generating the schema introspects every viewset and serializer, so it is
+built once per code version, on the first request, and kept rendered: in
+this process and in the shared cache for the other workers. Responses carry
+an ETag and are served gzip-compressed to clients that accept it.
+
+The code version is ``CODE_VERSION`` when set (e.g. the git commit baked
+into the image), otherwise a hash of the backend's Python sources.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import os
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.translation import get_language
+from drf_spectacular.views import SpectacularAPIView
+
+logger = logging.getLogger(__name__)
+
+SHARED_TIMEOUT = 7 * 24 * 60 * 60
+SKIPPED_DIRS = {"tests", "htmlcov", "staticfiles", "static", "media", "__pycache__"}
+
+_schemas: dict[str, dict] = {}
+
+
+@lru_cache(maxsize=1)
+def code_version() -> str:
+    """Return an identifier that changes whenever the deployed code does."""
+    if os.getenv("CODE_VERSION"):
+        return os.environ["CODE_VERSION"]
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(settings.BASE_DIR):
+        dirs[:] = sorted(d for d in dirs if d not in SKIPPED_DIRS)
+        for name in sorted(files):
+            if name.endswith(".py"):
+                path = os.path.join(root, name)
+                digest.update(os.path.relpath(path, settings.BASE_DIR).encode())
+                with open(path, "rb") as source:
+                    digest.update(source.read())
+    return digest.hexdigest()[:16]
+
+
+def _render(response, request, view) -> bytes:
+    response.accepted_renderer = request.accepted_renderer
+    response.accepted_media_type = request.accepted_media_type
+    response.renderer_context = view.get_renderer_context()
+    response.render()
+    content: bytes = response.content
+    return content
+
+
+class CachedSchemaView(SpectacularAPIView):
+    """``SpectacularAPIView`` serving the schema from the prebuilt cache."""
+
+    def _get_schema_response(self, request):
+        key = ":".join(
+            [
+                "schema",
+                code_version(),
+                request.accepted_media_type,
+                get_language() or "",
+                str(self.api_version or request.version or ""),
+            ]
+        )
+        entry = _schemas.get(key)
+        if entry is None:
+            try:
+                entry = cache.get(key)
+            except Exception:
+                logger.exception("Schema cache unavailable")
+        if entry is None:
+            response = super()._get_schema_response(request)
+            content = _render(response, request, self)
+            entry = {
+                "content": content,
+                "gzip": gzip.compress(content),
+                "etag": f'W/"{hashlib.sha256(content).hexdigest()[:32]}"',
+                "content_type": response["Content-Type"],
+                "disposition": response["Content-Disposition"],
+            }
+            try:
+                cache.set(key, entry, timeout=SHARED_TIMEOUT)
+            except Exception:
+                logger.exception("Failed to store the schema")
+        _schemas[key] = entry
+        return self._respond(request, entry)
+
+    @staticmethod
+    def _respond(request, entry) -> HttpResponse:
+        response = get_conditional_response(request, etag=entry["etag"])
+        if response is None:
+            if "gzip" in request.META.get("HTTP_ACCEPT_ENCODING", ""):
+                response = HttpResponse(
+                    entry["gzip"], content_type=entry["content_type"]
+                )
+                response["Content-Encoding"] = "gzip"
+            else:
+                response = HttpResponse(
+                    entry["content"], content_type=entry["content_type"]
+                )
+            response["Content-Disposition"] = entry["disposition"]
+        response["ETag"] = entry["etag"]
+        response["Vary"] = "Accept, Accept-Encoding"
+        # Clients revalidate with the ETag, which only changes on deploy.
+        patch_cache_control(response, public=True, no_cache=True)
+        return response
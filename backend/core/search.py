@@ -0,0 +1,89 @@
+"""
+Ranked ``?search=`` filtering.
+
+Matching is exactly DRF's ``SearchFilter``: every term must appear in at
+least one search field (case-insensitive substring). On PostgreSQL the
+``UPPER(column) LIKE`` lookups are served by ``gin_trgm_ops`` indexes (see the
+``trigram_search_indexes`` migrations) instead of sequential scans.
+
+Matches are ranked so type-ahead shows the best hits first: exact matches,
+then prefix matches, then trigram word similarity on PostgreSQL. An explicit
+``?ordering=`` always wins over the rank.
+"""
+
+from __future__ import annotations
+
+from django.db import connection
+from django.db.models import Case, FloatField, Value, When
+from django.db.models.functions import Coalesce
+from rest_framework.filters import SearchFilter
+from rest_framework.settings import api_settings
+
+EXACT_BOOST = 2.0
+PREFIX_BOOST = 1.0
+
+
+class RankedSearchFilter(SearchFilter):
+    """
+    ``SearchFilter`` that orders matches by relevance.
+
+    List it after ``OrderingFilter`` in ``filter_backends`` so the rank is
+    applied ahead of the view's default ordering, which breaks ties.
+    """
+
+    rank_annotation = "search_rank"
+
+    def filter_queryset(self, request, queryset, view):
+        queryset = super().filter_queryset(request, queryset, view)
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+        if not search_fields or not search_terms:
+            return queryset
+        if request.query_params.get(api_settings.ORDERING_PARAM):
+            return queryset
+
+        fields = [self._strip_prefix(field) for field in search_fields]
+        rank = self.get_rank_expression(fields, search_terms)
+        ordering = (
+            list(queryset.query.order_by) or list(queryset.model._meta.ordering) or ["pk"]
+        )
+        return queryset.annotate(**{self.rank_annotation: rank}).order_by(
+            f"-{self.rank_annotation}", *ordering
+        )
+
+    def get_rank_expression(self, fields, terms):
+        parts = []
+        for field in fields:
+            for term in terms:
+                parts.append(
+                    Case(
+                        When(**{f"{field}__iexact": term}, then=Value(EXACT_BOOST)),
+                        When(**{f"{field}__istartswith": term}, then=Value(PREFIX_BOOST)),
+                        default=Value(0.0),
+                        output_field=FloatField(),
+                    )
+                )
+                similarity = self._similarity(field, term)
+                if similarity is not None:
+                    parts.append(similarity)
+
+        rank = parts[0]
+        for part in parts[1:]:
+            rank = rank + part
+        return rank
+
+    @staticmethod
+    def _similarity(field, term):
+        if connection.vendor != "postgresql":
+            return None
+        from django.contrib.postgres.search import TrigramWordSimilarity
+
+        # Joined fields may be NULL (e.g. a section without a teacher).
+        return Coalesce(
+            TrigramWordSimilarity(term, field), Value(0.0), output_field=FloatField()
+        )
+
+    def _strip_prefix(self, field: str) -> str:
+        if field[:1] in self.lookup_prefixes:
+            return field[1:]
+        return field
@@ -0,0 +1,30 @@
+"""Record tombstones for deletions of models exposed through the changes feed."""
+
+from django.apps import apps
+from django.db.models.signals import post_delete
+
+from .models import Tombstone
+
+# Models whose deletions are reported by the ``changes`` endpoints.
+CHANGE_FEED_MODELS = [
+    "admissions.Student",
+    "academics.Program",
+    "academics.Course",
+    "academics.Section",
+    "attendance.Attendance",
+    "results.Result",
+    "requests.Request",
+]
+
+
+def record_tombstone(sender, instance, **kwargs):
+    Tombstone.objects.create(model=sender._meta.label, object_id=str(instance.pk))
+
+
+def connect_tombstones():
+    for label in CHANGE_FEED_MODELS:
+        post_delete.connect(
+            record_tombstone,
+            sender=apps.get_model(label),
+            dispatch_uid=f"tombstone:{label}",
+        )
@@ -0,0 +1,97 @@
+"""
+Cold-start import profiling.
+
+``profile_startup`` runs in a fresh interpreter (see the ``profile_startup``
+management command) and times ``django.setup()``, then each project app's
+views, serializers, URLs and admin modules, then the root URLconf. Modules
+shared by several apps are charged to the first app that imports them.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import json
+import os
+import resource
+import sys
+import time
+
+APP_MODULES = ("serializers", "views", "urls", "admin")
+# Optional dependencies that should only load when they are actually used.
+HEAVY_MODULES = ("reportlab", "qrcode", "PIL", "faker", "openpyxl", "numpy")
+
+
+def rss_kb() -> int:
+    """Return this process's resident set size in KiB."""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError):
+        # Peak RSS: KiB on Linux, bytes on macOS.
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _measure(name: str, func) -> dict:
+    rss, start = rss_kb(), time.perf_counter()
+    func()
+    return {
+        "name": name,
+        "ms": round((time.perf_counter() - start) * 1000, 1),
+        "rss_kb": rss_kb() - rss,
+    }
+
+
+def _import_app(app_name: str) -> None:
+    for module in APP_MODULES:
+        name = f"{app_name}.{module}"
+        if importlib.util.find_spec(name) is not None:
+            importlib.import_module(name)
+
+
+def profile_startup(per_app: bool = True) -> dict:
+    """
+    Time a cold start in this (fresh) interpreter.
+
+    With ``per_app=False`` the URLconf step covers every module it pulls in.
+
+    Returns:
+        Dict with the ``setup`` and ``urlconf`` steps, one step per project
+        app under ``apps``, the ``total_ms``, the final ``rss_kb`` and the
+        ``heavy_modules`` loaded by the end of startup
+    """
+    import django
+    from django.conf import settings
+
+    start = time.perf_counter()
+    setup = _measure("django.setup", django.setup)
+
+    from django.apps import apps
+
+    project_apps = [
+        config.name
+        for config in apps.get_app_configs()
+        if config.path.startswith(str(settings.BASE_DIR))
+    ]
+    app_steps = [
+        _measure(name, lambda name=name: _import_app(name))
+        for name in (project_apps if per_app else [])
+    ]
+    urlconf = _measure(
+        settings.ROOT_URLCONF,
+        lambda: importlib.import_module(settings.ROOT_URLCONF),
+    )
+    return {
+        "setup": setup,
+        "apps": app_steps,
+        "urlconf": urlconf,
+        "total_ms": round((time.perf_counter() - start) * 1000, 1),
+        "rss_kb": rss_kb(),
+        "heavy_modules": [name for name in HEAVY_MODULES if name in sys.modules],
+    }
+
+
+def main() -> None:
+    print(json.dumps(profile_startup(per_app="--no-apps" not in sys.argv)))
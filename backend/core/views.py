@@ -6,7 +6,7 @@ from django.db.models import Count, ExpressionWrapper, F, FloatField, Q
 from rest_framework import status
 from rest_framework.authentication import BaseAuthentication
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -20,6 +20,10 @@ from sims_backend.enrollment.models import Enrollment
 from sims_backend.requests.models import Request
 from sims_backend.results.models import Result
 
+from .async_api import APIJsonResponse, async_api_view, error_response, fetch_job
+from .cache import get_stats
+from .db import connection_stats
+from .replicas import use_replica
 from .serializers import (
     AUTH_ERROR_CODES,
     EmailTokenObtainPairSerializer,
@@ -207,8 +211,11 @@ def dashboard_stats(request):
         Response: A DRF response object containing a dictionary of
                   dashboard statistics.
     """
-    user = request.user
+    with use_replica(request):
+        return _dashboard_stats(request.user)
 
+
+def _dashboard_stats(user):
     stats = {}
 
     # Common stats
@@ -266,6 +273,48 @@ def dashboard_stats(request):
     return Response(stats, status=status.HTTP_200_OK)
 
 
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def cache_stats(request):
+    """
+    Report hit/miss counters and hit ratios for the reference-data cache.
+
+    Returns:
+        Response: Per-namespace ``hits``, ``misses`` and ``hit_ratio``.
+    """
+    return Response(get_stats(["programs", "courses", "terms"]))
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def database_stats(request):
+    """
+    Report this worker's database connection mode and counters.
+
+    Returns:
+        Response: Connection ``mode``, settings, ``connections_opened`` and,
+        when pooling with psycopg, the pool's wait statistics.
+    """
+    return Response(connection_stats())
+
+
+@async_api_view
+async def job_status(request, job_id: str):
+    """
+    Report a background job's status, and its result once it has finished.
+
+    Clients poll this while a job runs, so it reads Redis without blocking.
+    """
+    try:
+        job = await fetch_job(job_id)
+    except Exception:
+        logger.exception("Failed to read job %s", job_id)
+        return error_response(503, "Job status is unavailable")
+    if job is None:
+        return error_response(404, "Job not found")
+    return APIJsonResponse(job)
+
+
 def _count_ineligible_students():
     """
     Calculates the number of active students with an attendance rate below 75%.
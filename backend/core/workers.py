@@ -0,0 +1,20 @@
+"""
+RQ worker that reuses its database connection between jobs.
+
+RQ's default worker forks a work horse per job, so every job opened and
+dropped its own database connection. ``DatabaseWorker`` runs jobs in the
+worker process instead and, like Django's request cycle, closes connections
+that are broken or older than ``CONN_MAX_AGE`` before and after each job.
+"""
+
+from django.db import close_old_connections
+from rq.worker import SimpleWorker
+
+
+class DatabaseWorker(SimpleWorker):
+    def perform_job(self, job, queue) -> bool:
+        close_old_connections()
+        try:
+            return super().perform_job(job, queue)
+        finally:
+            close_old_connections()
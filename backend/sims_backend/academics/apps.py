@@ -6,3 +6,6 @@ class AcademicsConfig(AppConfig):
     name = "sims_backend.academics"
     label = "academics"
     verbose_name = "Academics"
+
+    def ready(self):
+        from . import signals  # noqa: F401
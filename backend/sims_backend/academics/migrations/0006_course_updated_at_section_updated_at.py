@@ -0,0 +1,29 @@
+# Generated by Django 5.1.4 on 2026-10-19 09:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("academics", "0005_migrate_teacher_to_foreignkey"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="course",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="section",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.1.4 on 2026-10-19 17:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("academics", "0006_course_updated_at_section_updated_at"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="program",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                help_text="The timestamp when the record was created.",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="program",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True,
+                help_text="The timestamp when the record was last updated.",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="course",
+            index=models.Index(fields=["updated_at", "id"], name="course_updated_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="program",
+            index=models.Index(fields=["updated_at", "id"], name="program_updated_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="section",
+            index=models.Index(fields=["updated_at", "id"], name="section_updated_idx"),
+        ),
+    ]
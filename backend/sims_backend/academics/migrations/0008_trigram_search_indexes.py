@@ -0,0 +1,51 @@
+# Generated by Django 5.1.4 on 2026-10-19 09:00
+
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# Columns searched through ``?search=`` on courses and sections. The indexes
+# cover ``UPPER(column) LIKE '%term%'``, which is how ``icontains`` is
+# rendered on PostgreSQL.
+SEARCH_COLUMNS = [
+    ("academics.Course", ["code", "title"]),
+    ("academics.Section", ["term", "teacher_name"]),
+    (settings.AUTH_USER_MODEL, ["username", "first_name", "last_name"]),
+]
+
+
+def _indexes(apps):
+    for label, columns in SEARCH_COLUMNS:
+        table = apps.get_model(label)._meta.db_table
+        for column in columns:
+            yield f"{table}_{column}_trgm", table, column
+
+
+def create_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    quote = schema_editor.quote_name
+    for name, table, column in _indexes(apps):
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {quote(name)} ON {quote(table)} "
+            f"USING gin ((UPPER({quote(column)}::text)) gin_trgm_ops)"
+        )
+
+
+def drop_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _, _ in _indexes(apps):
+        schema_editor.execute(f"DROP INDEX IF EXISTS {schema_editor.quote_name(name)}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("academics", "0007_updated_at_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
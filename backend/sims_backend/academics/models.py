@@ -23,6 +23,11 @@ class Term(models.Model):
 class Program(TimeStampedModel):
     name = models.CharField(max_length=128, unique=True)
 
+    class Meta(TimeStampedModel.Meta):
+        indexes = [
+            models.Index(fields=["updated_at", "id"], name="program_updated_idx"),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -34,6 +39,12 @@ class Course(models.Model):
     program = models.ForeignKey(
         Program, on_delete=models.CASCADE, related_name="courses"
     )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["updated_at", "id"], name="course_updated_idx"),
+        ]
 
     def __str__(self):
         return f"{self.code} - {self.title}"
@@ -73,9 +84,13 @@ class Section(models.Model):
         help_text="Display name for teacher (auto-populated from user)",
     )
     capacity = models.PositiveIntegerField(default=30)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         unique_together = ("course", "term", "teacher")
+        indexes = [
+            models.Index(fields=["updated_at", "id"], name="section_updated_idx"),
+        ]
 
     def save(self, *args, **kwargs):
         # Auto-populate teacher_name from teacher user when teacher is set
@@ -1,38 +1,58 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from core.mixins import ExpandableFieldsMixin
+
 from .models import Course, Program, Section, Term
 
 
-class TermSerializer(serializers.ModelSerializer):
+class TermSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Term
         fields = ["id", "name", "status", "start_date", "end_date"]
 
 
-class ProgramSerializer(serializers.ModelSerializer):
+class ProgramSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Program
         fields = ["id", "name", "created_at", "updated_at"]
         read_only_fields = ["created_at", "updated_at"]
 
 
-class CourseSerializer(serializers.ModelSerializer):
+class CourseSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Course
         fields = ["id", "code", "title", "credits", "program"]
+        expandable_fields = {
+            "program_detail": (ProgramSerializer, {"source": "program"}),
+        }
 
 
 User = get_user_model()
 
 
-class SectionSerializer(serializers.ModelSerializer):
+# Section fields that are safe to embed in other payloads; the seat counts
+# need the viewset annotations and would otherwise cost a query per row.
+SECTION_SUMMARY_FIELDS = [
+    "id",
+    "course",
+    "course_detail",
+    "term",
+    "teacher",
+    "teacher_name",
+    "capacity",
+]
+
+
+class SectionSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     teacher_name = serializers.CharField(required=False, allow_blank=True)
     teacher = serializers.PrimaryKeyRelatedField(
         queryset=User.objects.all(), allow_null=True, required=False
     )
-    # Nested course data for read operations
-    course_detail = CourseSerializer(source="course", read_only=True)
+    # Seat availability; read from the viewset annotations when present
+    enrolled_count = serializers.SerializerMethodField()
+    waitlist_count = serializers.SerializerMethodField()
+    seats_remaining = serializers.SerializerMethodField()
 
     def to_internal_value(self, data):
         """Allow creating sections with either a teacher id or a teacher name.
@@ -73,14 +93,36 @@ class SectionSerializer(serializers.ModelSerializer):
 
         return super().create(validated_data)
 
+    def get_enrolled_count(self, obj) -> int:
+        count = getattr(obj, "enrolled_count", None)
+        if count is None:
+            count = obj.enrollments.filter(status="enrolled").count()
+        return int(count)
+
+    def get_waitlist_count(self, obj) -> int:
+        count = getattr(obj, "waitlist_count", None)
+        if count is None:
+            count = obj.enrollments.filter(status="waitlisted").count()
+        return int(count)
+
+    def get_seats_remaining(self, obj) -> int:
+        return max(int(obj.capacity) - self.get_enrolled_count(obj), 0)
+
     class Meta:
         model = Section
         fields = [
             "id",
             "course",
-            "course_detail",
             "term",
             "teacher",
             "teacher_name",
             "capacity",
+            "enrolled_count",
+            "waitlist_count",
+            "seats_remaining",
         ]
+        # Nested course data for read operations
+        expandable_fields = {
+            "course_detail": (CourseSerializer, {"source": "course"}),
+        }
+        default_expand = ["course_detail"]
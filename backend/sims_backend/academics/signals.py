@@ -0,0 +1,27 @@
+"""Invalidate cached reference data when the catalog changes."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.cache import bump_namespaces
+
+from .models import Course, Program, Term
+
+
+@receiver(post_save, sender=Program)
+@receiver(post_delete, sender=Program)
+def invalidate_programs(sender, **kwargs):
+    # Course responses can embed their program.
+    bump_namespaces("programs", "courses")
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def invalidate_courses(sender, **kwargs):
+    bump_namespaces("courses")
+
+
+@receiver(post_save, sender=Term)
+@receiver(post_delete, sender=Term)
+def invalidate_terms(sender, **kwargs):
+    bump_namespaces("terms")
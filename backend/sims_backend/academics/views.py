@@ -1,10 +1,28 @@
-from django_filters.rest_framework import CharFilter, DjangoFilterBackend, FilterSet
-from rest_framework import viewsets
+from django.db.models import Count, F, Q
+from django_filters.rest_framework import (
+    BooleanFilter,
+    CharFilter,
+    DjangoFilterBackend,
+    FilterSet,
+)
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.permissions import IsAuthenticated
-
+from rest_framework.response import Response
+
+from core.cache import CachedResponseMixin
+from core.mixins import (
+    ChangesFeedMixin,
+    ConditionalGetMixin,
+    ExpandableQuerysetMixin,
+    ReplicaReadMixin,
+)
+from core.search import RankedSearchFilter
+from sims_backend.assessments.gradebook import build_gradebook
 from sims_backend.common_permissions import (
     IsAdminOrRegistrarReadOnlyFacultyStudent,
+    can_grade_section,
     in_group,
 )
 
@@ -17,7 +35,10 @@ from .serializers import (
 )
 
 
-class TermViewSet(viewsets.ModelViewSet):
+class TermViewSet(
+    CachedResponseMixin, ExpandableQuerysetMixin, viewsets.ModelViewSet
+):
+    cache_namespace = "terms"
     queryset = Term.objects.all()
     serializer_class = TermSerializer
     permission_classes = [IsAuthenticated, IsAdminOrRegistrarReadOnlyFacultyStudent]
@@ -28,7 +49,14 @@ class TermViewSet(viewsets.ModelViewSet):
     ordering = ["id"]
 
 
-class ProgramViewSet(viewsets.ModelViewSet):
+class ProgramViewSet(
+    CachedResponseMixin,
+    ChangesFeedMixin,
+    ConditionalGetMixin,
+    ExpandableQuerysetMixin,
+    viewsets.ModelViewSet,
+):
+    cache_namespace = "programs"
     queryset = Program.objects.all()
     serializer_class = ProgramSerializer
     permission_classes = [IsAuthenticated, IsAdminOrRegistrarReadOnlyFacultyStudent]
@@ -47,23 +75,49 @@ class CourseFilter(FilterSet):
         fields = ["program", "credits"]
 
 
-class CourseViewSet(viewsets.ModelViewSet):
+class CourseViewSet(
+    CachedResponseMixin,
+    ChangesFeedMixin,
+    ConditionalGetMixin,
+    ExpandableQuerysetMixin,
+    viewsets.ModelViewSet,
+):
+    cache_namespace = "courses"
     queryset = Course.objects.all()
     serializer_class = CourseSerializer
     permission_classes = [IsAuthenticated, IsAdminOrRegistrarReadOnlyFacultyStudent]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, OrderingFilter, RankedSearchFilter]
     filterset_class = CourseFilter
     search_fields = ["code", "title"]
     ordering_fields = ["id", "code", "title", "credits"]
     ordering = ["id"]
 
 
-class SectionViewSet(viewsets.ModelViewSet):
+class SectionFilter(FilterSet):
+    has_open_seats = BooleanFilter(method="filter_has_open_seats")
+
+    class Meta:
+        model = Section
+        fields = ["term", "course", "has_open_seats"]
+
+    def filter_has_open_seats(self, queryset, name, value):
+        if value:
+            return queryset.filter(enrolled_count__lt=F("capacity"))
+        return queryset.filter(enrolled_count__gte=F("capacity"))
+
+
+class SectionViewSet(
+    ReplicaReadMixin,
+    ChangesFeedMixin,
+    ConditionalGetMixin,
+    ExpandableQuerysetMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Section.objects.all()
     serializer_class = SectionSerializer
     permission_classes = [IsAuthenticated, IsAdminOrRegistrarReadOnlyFacultyStudent]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ["term", "course"]
+    filter_backends = [DjangoFilterBackend, OrderingFilter, RankedSearchFilter]
+    filterset_class = SectionFilter
     search_fields = [
         "course__code",
         "term",
@@ -72,12 +126,28 @@ class SectionViewSet(viewsets.ModelViewSet):
         "teacher__last_name",
         "teacher_name",
     ]
-    ordering_fields = ["id", "term", "teacher_name"]
+    ordering_fields = ["id", "term", "teacher_name", "enrolled_count"]
     ordering = ["id"]
+    # Faculty only list their own sections, so only these roles see deletions.
+    changes_deletions_roles = ("Admin", "Registrar")
 
     def get_queryset(self):
         """Filter sections based on user role"""
-        queryset = super().get_queryset()
+        # Seat counts are annotated in the same query so listing a page of
+        # sections costs a constant number of queries.
+        queryset = (
+            super()
+            .get_queryset()
+            .select_related("course", "teacher")
+            .annotate(
+                enrolled_count=Count(
+                    "enrollments", filter=Q(enrollments__status="enrolled")
+                ),
+                waitlist_count=Count(
+                    "enrollments", filter=Q(enrollments__status="waitlisted")
+                ),
+            )
+        )
         user = self.request.user
 
         # Faculty users should only see their own sections
@@ -90,3 +160,14 @@ class SectionViewSet(viewsets.ModelViewSet):
                 queryset = queryset.filter(teacher=user)
 
         return queryset
+
+    @action(detail=True, methods=["get"])
+    def gradebook(self, request, pk=None):
+        """Return the section's students × assessments score matrix"""
+        section = self.get_object()
+        if not can_grade_section(request.user, section):
+            return Response(
+                {"error": {"code": 403, "message": "Permission denied"}},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+        return Response(build_gradebook(section))
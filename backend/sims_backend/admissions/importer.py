@@ -0,0 +1,229 @@
+"""
+Streaming bulk import of students from CSV or XLSX files.
+
+Rows are read one at a time and processed in chunks: each chunk is
+validated, checked against the database for existing registration numbers
+with a single ``reg_no IN (...)`` query, and written with one
+``bulk_create(update_conflicts=True)`` statement. Rejected rows go to a CSV
+error report. Only one chunk is held in memory, so memory use does not grow
+with the size of the file.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import tempfile
+import uuid
+from dataclasses import dataclass, field
+
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import transaction
+
+from .models import Student
+
+COLUMNS = ("reg_no", "name", "program", "status")
+UPDATE_FIELDS = ["name", "program", "status", "import_batch", "updated_at"]
+DEFAULT_CHUNK_SIZE = 1000
+MODES = ("upsert", "create")
+ERROR_REPORT_COLUMNS = ["line", "reg_no", "error"]
+# Errors returned inline in API responses; the full list is in the report.
+MAX_INLINE_ERRORS = 100
+REPORT_DIR = "imports/students"
+
+
+class ImportFormatError(ValueError):
+    """Raised when an upload cannot be read as a student import file."""
+
+
+@dataclass
+class ImportSummary:
+    total: int = 0
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+    errors: list[dict] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "created": self.created,
+            "updated": self.updated,
+            "failed": self.failed,
+        }
+
+
+def iter_rows(fileobj, filename: str = ""):
+    """Yield ``(line, row)`` pairs from a CSV or XLSX upload."""
+    if filename.lower().endswith(".xlsx"):
+        yield from _iter_xlsx(fileobj)
+    else:
+        yield from _iter_csv(fileobj)
+
+
+def _iter_csv(fileobj):
+    if isinstance(fileobj, io.TextIOBase):
+        text = fileobj
+    else:
+        text = io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline="")
+    reader = csv.reader(text)
+    try:
+        header = next(reader)
+    except StopIteration:
+        raise ImportFormatError("The file is empty.") from None
+    except UnicodeDecodeError:
+        raise ImportFormatError("CSV files must be UTF-8 encoded.") from None
+
+    columns = _check_header(header)
+    try:
+        for values in reader:
+            if any(value.strip() for value in values):
+                yield reader.line_num, dict(zip(columns, values, strict=False))
+    except (UnicodeDecodeError, csv.Error) as exc:
+        raise ImportFormatError(f"Could not read CSV: {exc}") from None
+
+
+def _iter_xlsx(fileobj):
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportFormatError("XLSX import requires openpyxl; upload CSV instead.") from None
+
+    try:
+        workbook = load_workbook(fileobj, read_only=True, data_only=True)
+    except Exception as exc:
+        raise ImportFormatError(f"Could not read XLSX: {exc}") from None
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            raise ImportFormatError("The file is empty.")
+        columns = _check_header(["" if cell is None else str(cell) for cell in header])
+        for line, cells in enumerate(rows, start=2):
+            values = ["" if cell is None else str(cell) for cell in cells]
+            if any(value.strip() for value in values):
+                yield line, dict(zip(columns, values, strict=False))
+    finally:
+        workbook.close()
+
+
+def _check_header(header: list[str]) -> list[str]:
+    columns = [name.strip().lower() for name in header]
+    missing = [name for name in COLUMNS if name not in columns]
+    if missing:
+        raise ImportFormatError(f"Missing required columns: {', '.join(missing)}")
+    return columns
+
+
+def validate_row(row: dict) -> tuple[dict, str | None]:
+    """Return the cleaned row and an error message, if any."""
+    cleaned = {name: (row.get(name) or "").strip() for name in COLUMNS}
+    for name in COLUMNS:
+        if not cleaned[name]:
+            return cleaned, f"{name} is required."
+        max_length = getattr(Student._meta.get_field(name), "max_length", None)
+        if max_length is not None and len(cleaned[name]) > max_length:
+            return cleaned, f"{name} must be at most {max_length} characters."
+    return cleaned, None
+
+
+class StudentImporter:
+    """
+    Import students chunk by chunk.
+
+    In ``upsert`` mode existing registration numbers are updated; in
+    ``create`` mode they are rejected. A registration number repeated in the
+    same file is rejected after its first occurrence: rows written by this
+    import carry its ``batch`` id, which the existing-row query reads back.
+    """
+
+    def __init__(self, mode: str = "upsert", chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of: {', '.join(MODES)}")
+        self.mode = mode
+        self.chunk_size = chunk_size
+        self.batch = uuid.uuid4().hex
+        self.summary = ImportSummary()
+        self.report = tempfile.TemporaryFile(mode="w+", newline="")
+        self._report_writer = csv.writer(self.report)
+        self._report_writer.writerow(ERROR_REPORT_COLUMNS)
+
+    def run(self, rows) -> ImportSummary:
+        chunk = []
+        for line, row in rows:
+            chunk.append((line, row))
+            if len(chunk) >= self.chunk_size:
+                self._process(chunk)
+                chunk = []
+        if chunk:
+            self._process(chunk)
+        self.report.seek(0)
+        return self.summary
+
+    def _process(self, chunk) -> None:
+        self.summary.total += len(chunk)
+        valid: dict[str, tuple[int, dict]] = {}
+        for line, row in chunk:
+            cleaned, error = validate_row(row)
+            if error is None and cleaned["reg_no"] in valid:
+                error = "Duplicate reg_no in file."
+            if error:
+                self._reject(line, cleaned["reg_no"], error)
+            else:
+                valid[cleaned["reg_no"]] = (line, cleaned)
+        if not valid:
+            return
+
+        existing = dict(
+            Student.objects.filter(reg_no__in=valid).values_list("reg_no", "import_batch")
+        )
+        students = []
+        for reg_no, (line, cleaned) in valid.items():
+            if existing.get(reg_no) == self.batch:
+                self._reject(line, reg_no, "Duplicate reg_no in file.")
+                continue
+            if reg_no in existing:
+                if self.mode == "create":
+                    self._reject(line, reg_no, "A student with this reg_no already exists.")
+                    continue
+            students.append(Student(**cleaned, import_batch=self.batch))
+        if not students:
+            return
+
+        with transaction.atomic():
+            Student.objects.bulk_create(
+                students,
+                update_conflicts=True,
+                unique_fields=["reg_no"],
+                update_fields=UPDATE_FIELDS,
+            )
+        updated = sum(1 for student in students if student.reg_no in existing)
+        self.summary.updated += updated
+        self.summary.created += len(students) - updated
+
+    def _reject(self, line: int, reg_no: str, error: str) -> None:
+        self.summary.failed += 1
+        self._report_writer.writerow([line, reg_no, error])
+        if len(self.summary.errors) < MAX_INLINE_ERRORS:
+            self.summary.errors.append({"line": line, "reg_no": reg_no, "error": error})
+
+
+def save_error_report(importer: StudentImporter) -> str | None:
+    """Store the importer's error report and return its id, if it has errors."""
+    if not importer.summary.failed:
+        return None
+    report_id = uuid.uuid4().hex
+    default_storage.save(_report_path(report_id), File(importer.report))
+    return report_id
+
+
+def open_error_report(report_id: str):
+    path = _report_path(report_id)
+    if not default_storage.exists(path):
+        return None
+    return default_storage.open(path, "rb")
+
+
+def _report_path(report_id: str) -> str:
+    return f"{REPORT_DIR}/{report_id}.csv"
@@ -0,0 +1,78 @@
+"""
+Management command to bulk import students from a CSV or XLSX file
+"""
+
+import shutil
+
+from django.core.management.base import BaseCommand, CommandError
+
+from sims_backend.admissions.importer import (
+    DEFAULT_CHUNK_SIZE,
+    MODES,
+    StudentImporter,
+    iter_rows,
+)
+
+
+class Command(BaseCommand):
+    """
+    Import students from a file with reg_no, name, program and status columns.
+
+    The file is streamed and written in chunks, so large intakes can be loaded
+    without holding the whole file in memory.
+    """
+
+    help = "Bulk import students from a CSV or XLSX file"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to the CSV or XLSX file")
+        parser.add_argument(
+            "--mode",
+            choices=MODES,
+            default="upsert",
+            help="upsert updates existing reg_no values, create rejects them "
+            "(default: upsert)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help=f"Rows validated and written per batch (default: {DEFAULT_CHUNK_SIZE})",
+        )
+        parser.add_argument(
+            "--errors",
+            help="Write the CSV error report to this path",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be positive")
+
+        importer = StudentImporter(mode=options["mode"], chunk_size=options["chunk_size"])
+        try:
+            with open(path, "rb") as fileobj:
+                summary = importer.run(iter_rows(fileobj, path))
+        except OSError as exc:
+            raise CommandError(f"Could not open {path}: {exc}") from exc
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {summary.total} rows: {summary.created} created, "
+                f"{summary.updated} updated, {summary.failed} failed"
+            )
+        )
+        if summary.failed and options["errors"]:
+            with open(options["errors"], "w", newline="") as report:
+                shutil.copyfileobj(importer.report, report)
+            self.stdout.write(f"Error report written to {options['errors']}")
+        elif summary.failed:
+            for error in summary.errors:
+                self.stdout.write(
+                    self.style.ERROR(
+                        f"  line {error['line']} ({error['reg_no']}): {error['error']}"
+                    )
+                )
+        importer.report.close()
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.4 on 2026-10-19 17:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("admissions", "0004_alter_student_created_at_alter_student_updated_at"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="student",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                help_text="The timestamp when the record was created.",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="student",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True,
+                help_text="The timestamp when the record was last updated.",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="student",
+            index=models.Index(fields=["updated_at", "id"], name="student_updated_idx"),
+        ),
+    ]
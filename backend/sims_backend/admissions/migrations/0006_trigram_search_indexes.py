@@ -0,0 +1,41 @@
+# Generated by Django 5.1.4 on 2026-10-19 09:00
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# Columns searched through ``?search=`` on students. The indexes cover
+# ``UPPER(column) LIKE '%term%'``, which is how ``icontains`` is rendered on
+# PostgreSQL.
+SEARCH_COLUMNS = ["reg_no", "name", "program", "status"]
+
+
+def create_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    quote = schema_editor.quote_name
+    table = apps.get_model("admissions", "Student")._meta.db_table
+    for column in SEARCH_COLUMNS:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {quote(f'{table}_{column}_trgm')} "
+            f"ON {quote(table)} USING gin ((UPPER({quote(column)}::text)) gin_trgm_ops)"
+        )
+
+
+def drop_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    table = apps.get_model("admissions", "Student")._meta.db_table
+    for column in SEARCH_COLUMNS:
+        name = schema_editor.quote_name(f"{table}_{column}_trgm")
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("admissions", "0005_student_updated_idx"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.4 on 2026-10-19 18:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("admissions", "0006_trigram_search_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="student",
+            name="import_batch",
+            field=models.CharField(
+                blank=True, default="", editable=False, max_length=32
+            ),
+        ),
+    ]
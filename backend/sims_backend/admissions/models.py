@@ -8,9 +8,15 @@ class Student(TimeStampedModel):
     name = models.CharField(max_length=255)
     program = models.CharField(max_length=128)
     status = models.CharField(max_length=32)
+    # Bulk import run that last wrote the row, used to spot reg_nos repeated
+    # within one file.
+    import_batch = models.CharField(max_length=32, blank=True, default="", editable=False)
 
     class Meta:
         ordering = ["reg_no"]
+        indexes = [
+            models.Index(fields=["updated_at", "id"], name="student_updated_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.reg_no} - {self.name}"
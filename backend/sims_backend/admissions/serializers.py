@@ -1,9 +1,11 @@
 from rest_framework import serializers
 
+from core.mixins import ExpandableFieldsMixin
+
 from .models import Student
 
 
-class StudentSerializer(serializers.ModelSerializer):
+class StudentSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Student
         fields = ["id", "reg_no", "name", "program", "status"]
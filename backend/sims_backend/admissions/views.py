@@ -1,21 +1,47 @@
+from django.http import FileResponse
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import viewsets
-from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.filters import OrderingFilter
+from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 
+from core.mixins import (
+    ChangesFeedMixin,
+    ConditionalGetMixin,
+    ExpandableQuerysetMixin,
+    ReplicaReadMixin,
+)
+from core.search import RankedSearchFilter
+
+from .importer import (
+    StudentImporter,
+    iter_rows,
+    open_error_report,
+    save_error_report,
+)
 from .models import Student
 from .permissions import IsAdminOrRegistrarOrReadOwnStudent, _in_group
 from .serializers import StudentSerializer
 
 
-class StudentViewSet(viewsets.ModelViewSet):
+class StudentViewSet(
+    ReplicaReadMixin,
+    ChangesFeedMixin,
+    ConditionalGetMixin,
+    ExpandableQuerysetMixin,
+    viewsets.ModelViewSet,
+):
     serializer_class = StudentSerializer
     permission_classes = [IsAuthenticated, IsAdminOrRegistrarOrReadOwnStudent]
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, OrderingFilter, RankedSearchFilter]
     filterset_fields = ["program", "status"]
     search_fields = ["reg_no", "name", "program", "status"]
     ordering_fields = ["id", "reg_no", "name", "program", "status"]
     queryset = Student.objects.all()
+    # Students only list themselves, so only these roles see deletions.
+    changes_deletions_roles = ("Admin", "Registrar")
 
     def get_queryset(self):
         qs = super().get_queryset()
@@ -27,3 +53,73 @@ class StudentViewSet(viewsets.ModelViewSet):
         ):
             return qs.filter(reg_no=getattr(user, "username", ""))
         return qs
+
+    def _can_import(self, user) -> bool:
+        return (
+            user.is_superuser
+            or _in_group(user, "Admin")
+            or _in_group(user, "Registrar")
+        )
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[MultiPartParser, FormParser],
+    )
+    def bulk_import(self, request):
+        """
+        Import students from an uploaded CSV or XLSX file.
+
+        Columns: reg_no, name, program, status. ``mode=upsert`` (default)
+        updates existing registration numbers, ``mode=create`` rejects them.
+        """
+        upload = request.FILES.get("file")
+        if upload is None:
+            return Response(
+                {"error": {"code": 400, "message": "file is required"}},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            importer = StudentImporter(mode=request.data.get("mode", "upsert"))
+            summary = importer.run(iter_rows(upload.file, upload.name))
+        except ValueError as exc:
+            return Response(
+                {"error": {"code": 400, "message": str(exc)}},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        report_id = save_error_report(importer)
+        importer.report.close()
+        data = {**summary.as_dict(), "errors": summary.errors, "error_report": None}
+        if report_id:
+            data["error_report"] = request.build_absolute_uri(
+                f"{request.path.rstrip('/')}/{report_id}/errors/"
+            )
+        return Response(data)
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path=r"import/(?P<report_id>[0-9a-f]{32})/errors",
+    )
+    def import_errors(self, request, report_id=None):
+        """Download the CSV error report of a previous import."""
+        if not self._can_import(request.user):
+            return Response(
+                {"error": {"code": 403, "message": "Permission denied"}},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+        report = open_error_report(report_id)
+        if report is None:
+            return Response(
+                {"error": {"code": 404, "message": "Error report not found"}},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return FileResponse(
+            report,
+            as_attachment=True,
+            filename=f"student-import-{report_id}-errors.csv",
+            content_type="text/csv",
+        )
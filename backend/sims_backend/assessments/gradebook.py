@@ -0,0 +1,340 @@
+"""
+Section gradebooks: batch score upload and the read-only matrix view.
+
+A gradebook is a matrix of students (rows) by assessments (columns). It can
+be sent as JSON or as a CSV file whose first column is ``reg_no`` and whose
+other columns are assessment IDs. The whole matrix is validated with a
+handful of set queries and written in one upsert; if any cell is invalid,
+nothing is written. :func:`build_gradebook` returns the same layout.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+from dataclasses import dataclass, field
+
+from django.db.models import FilteredRelation, Q
+
+from sims_backend.admissions.models import Student
+from sims_backend.enrollment.models import Enrollment
+from sims_backend.results.grading import scale_for_section
+
+from .models import Assessment, AssessmentScore
+
+DEFAULT_MAX_SCORE = 100.0
+
+
+class GradebookError(ValueError):
+    """Raised when an upload is malformed or fails validation."""
+
+    def __init__(self, message: str, errors: list[dict] | None = None):
+        super().__init__(message)
+        self.errors = errors or []
+
+
+@dataclass
+class ScoreMatrix:
+    """Scores for ``students`` × ``assessment_ids``; ``None`` cells are skipped."""
+
+    assessment_ids: list[int]
+    students: list
+    scores: list[list[float | None]]
+    max_scores: list[float | None] = field(default_factory=list)
+    # Whether ``students`` holds registration numbers or student IDs.
+    by_reg_no: bool = False
+
+
+def parse_json_matrix(data) -> ScoreMatrix:
+    """
+    Build a matrix from ``{"assessments": [...], "students": [...],
+    "scores": [[...], ...], "max_scores": [...]}``.
+    """
+    try:
+        assessment_ids = [int(value) for value in data["assessments"]]
+        students = [int(value) for value in data["students"]]
+        scores = [[_to_float(cell) for cell in row] for row in data["scores"]]
+        max_scores = [_to_float(value) for value in data.get("max_scores") or []]
+    except KeyError as exc:
+        raise GradebookError(f"{exc.args[0]} is required") from None
+    except (TypeError, ValueError):
+        raise GradebookError(
+            "assessments, students and scores must be numeric"
+        ) from None
+    return ScoreMatrix(assessment_ids, students, scores, max_scores)
+
+
+def parse_csv_matrix(fileobj, max_scores: str = "") -> ScoreMatrix:
+    """
+    Build a matrix from a CSV upload with a ``reg_no`` column followed by one
+    column per assessment ID. ``max_scores`` is an optional comma-separated
+    list matching the assessment columns.
+    """
+    text = io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline="")
+    reader = csv.reader(text)
+    try:
+        header = [name.strip() for name in next(reader)]
+    except StopIteration:
+        raise GradebookError("The file is empty.") from None
+    if not header or header[0].lower() != "reg_no":
+        raise GradebookError("The first column must be reg_no.")
+
+    try:
+        assessment_ids = [int(name) for name in header[1:]]
+        parsed_max = (
+            [_to_float(value) for value in max_scores.split(",")] if max_scores else []
+        )
+        students, scores = [], []
+        for row in reader:
+            if not any(cell.strip() for cell in row):
+                continue
+            students.append(row[0].strip())
+            scores.append([_to_float(cell) for cell in row[1 : len(header)]])
+    except ValueError:
+        raise GradebookError("Assessment columns and scores must be numeric.") from None
+    except (UnicodeDecodeError, csv.Error) as exc:
+        raise GradebookError(f"Could not read CSV: {exc}") from None
+    return ScoreMatrix(assessment_ids, students, scores, parsed_max, by_reg_no=True)
+
+
+def _to_float(value) -> float | None:
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    return float(value)
+
+
+def upsert_scores(section, matrix: ScoreMatrix) -> set[int]:
+    """
+    Validate ``matrix`` against ``section`` and upsert its scores.
+
+    Checks that every assessment belongs to the section, every student is
+    enrolled in it and every score lies between 0 and its max score.
+
+    Returns:
+        IDs of the students whose scores were written
+
+    Raises:
+        GradebookError: with per-cell ``errors`` if validation fails
+    """
+    if not matrix.assessment_ids:
+        raise GradebookError("At least one assessment is required.")
+    if len(set(matrix.assessment_ids)) != len(matrix.assessment_ids):
+        raise GradebookError("Assessments must not repeat.")
+    if matrix.max_scores and len(matrix.max_scores) != len(matrix.assessment_ids):
+        raise GradebookError("max_scores must have one value per assessment.")
+    if len(matrix.scores) != len(matrix.students):
+        raise GradebookError("scores must have one row per student.")
+
+    errors = []
+    section_assessments = set(
+        Assessment.objects.filter(
+            section=section, id__in=matrix.assessment_ids
+        ).values_list("id", flat=True)
+    )
+    for column, assessment_id in enumerate(matrix.assessment_ids):
+        if assessment_id not in section_assessments:
+            errors.append(
+                {
+                    "column": column,
+                    "assessment": assessment_id,
+                    "error": "Assessment does not belong to this section.",
+                }
+            )
+
+    key = "student__reg_no" if matrix.by_reg_no else "student_id"
+    enrolled = dict(
+        Enrollment.objects.filter(
+            section=section, status="enrolled", **{f"{key}__in": matrix.students}
+        ).values_list(key, "student_id")
+    )
+    seen = set()
+    for row, student in enumerate(matrix.students):
+        if student not in enrolled:
+            errors.append(
+                {
+                    "row": row,
+                    "student": student,
+                    "error": "Student is not enrolled in this section.",
+                }
+            )
+        elif student in seen:
+            errors.append(
+                {"row": row, "student": student, "error": "Student is listed twice."}
+            )
+        seen.add(student)
+
+    stored_max = {
+        (assessment_id, student_id): max_score
+        for assessment_id, student_id, max_score in AssessmentScore.objects.filter(
+            assessment_id__in=section_assessments,
+            student_id__in=list(enrolled.values()),
+        ).values_list("assessment_id", "student_id", "max_score")
+    }
+
+    objs = []
+    for row, (student, cells) in enumerate(
+        zip(matrix.students, matrix.scores, strict=True)
+    ):
+        if len(cells) != len(matrix.assessment_ids):
+            errors.append(
+                {
+                    "row": row,
+                    "student": student,
+                    "error": "Row has the wrong number of scores.",
+                }
+            )
+            continue
+        student_id = enrolled.get(student)
+        for column, (assessment_id, score) in enumerate(
+            zip(matrix.assessment_ids, cells, strict=True)
+        ):
+            if (
+                score is None
+                or student_id is None
+                or assessment_id not in section_assessments
+            ):
+                continue
+            max_score = matrix.max_scores[column] if matrix.max_scores else None
+            if max_score is None:
+                max_score = stored_max.get(
+                    (assessment_id, student_id), DEFAULT_MAX_SCORE
+                )
+            error = _check_score(score, max_score)
+            if error:
+                errors.append(
+                    {
+                        "row": row,
+                        "column": column,
+                        "student": student,
+                        "assessment": assessment_id,
+                        "error": error,
+                    }
+                )
+                continue
+            objs.append(
+                AssessmentScore(
+                    assessment_id=assessment_id,
+                    student_id=student_id,
+                    score=score,
+                    max_score=max_score,
+                )
+            )
+
+    if errors:
+        raise GradebookError("Gradebook validation failed.", errors)
+
+    AssessmentScore.objects.bulk_create(
+        objs,
+        update_conflicts=True,
+        unique_fields=["assessment", "student"],
+        update_fields=["score", "max_score"],
+    )
+    return {obj.student_id for obj in objs}
+
+
+def _check_score(score: float, max_score: float) -> str | None:
+    if max_score <= 0:
+        return "Max score must be positive"
+    if score < 0:
+        return "Score cannot be negative"
+    if score > max_score:
+        return f"Score ({score}) cannot exceed max_score ({max_score})"
+    return None
+
+
+def build_gradebook(section) -> dict:
+    """
+    Return the section's enrolled students × assessments matrix.
+
+    Uses two queries: one for the assessments and one joining each enrolled
+    student to their scores in this section and their result. The payload is
+    columnar: per-student values are parallel lists aligned with
+    ``students["id"]``, and ``scores``/``max_scores`` rows are aligned with
+    ``assessments["id"]``. Missing scores are ``null`` and count as zero in
+    ``total``, matching :func:`calculate_final_grade`.
+    """
+    assessments = list(
+        Assessment.objects.filter(section=section)
+        .order_by("id")
+        .values_list("id", "type", "weight")
+    )
+    columns = {assessment_id: i for i, (assessment_id, _, _) in enumerate(assessments)}
+
+    relations = {
+        "section_result": FilteredRelation(
+            "results", condition=Q(results__section=section)
+        )
+    }
+    score_fields: tuple[str, ...] = ()
+    # An empty ``__in`` condition would match no rows at all, dropping the
+    # roster, so sections without assessments skip the scores join.
+    if columns:
+        relations["section_scores"] = FilteredRelation(
+            "assessment_scores",
+            condition=Q(assessment_scores__assessment_id__in=list(columns)),
+        )
+        score_fields = (
+            "section_scores__assessment_id",
+            "section_scores__score",
+            "section_scores__max_score",
+        )
+    rows = (
+        Student.objects.filter(
+            enrollments__section=section, enrollments__status="enrolled"
+        )
+        .annotate(**relations)
+        .order_by("reg_no", "id")
+        .values_list(
+            "id",
+            "reg_no",
+            "name",
+            "section_result__final_grade",
+            "section_result__state",
+            *score_fields,
+        )
+    )
+
+    students: dict[str, list] = {"id": [], "reg_no": [], "name": []}
+    scores, max_scores, final_grades, states = [], [], [], []
+    for student_id, reg_no, name, final_grade, state, *cell in rows:
+        if not students["id"] or students["id"][-1] != student_id:
+            students["id"].append(student_id)
+            students["reg_no"].append(reg_no)
+            students["name"].append(name)
+            scores.append([None] * len(assessments))
+            max_scores.append([None] * len(assessments))
+            final_grades.append(final_grade)
+            states.append(state)
+        assessment_id, score, max_score = cell or (None, None, None)
+        if assessment_id is not None:
+            scores[-1][columns[assessment_id]] = score
+            max_scores[-1][columns[assessment_id]] = max_score
+
+    weights = [weight for _, _, weight in assessments]
+    totals = [
+        _weighted_total(row, max_row, weights)
+        for row, max_row in zip(scores, max_scores, strict=True)
+    ]
+    return {
+        "section": section.id,
+        "assessments": {
+            "id": [assessment_id for assessment_id, _, _ in assessments],
+            "type": [assessment_type for _, assessment_type, _ in assessments],
+            "weight": weights,
+        },
+        "students": students,
+        "scores": scores,
+        "max_scores": max_scores,
+        "total": [round(total, 2) for total in totals],
+        "grade": scale_for_section(section).grade_many(totals),
+        "final_grade": final_grades,
+        "result_state": states,
+    }
+
+
+def _weighted_total(scores, max_scores, weights) -> float:
+    total = 0.0
+    for score, max_score, weight in zip(scores, max_scores, weights, strict=True):
+        if score is not None and max_score > 0:
+            total += (score / max_score) * weight
+    return total
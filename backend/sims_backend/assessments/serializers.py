@@ -1,12 +1,25 @@
 from rest_framework import serializers
 
+from core.mixins import ExpandableFieldsMixin
+from sims_backend.academics.serializers import (
+    SECTION_SUMMARY_FIELDS,
+    SectionSerializer,
+)
+from sims_backend.admissions.serializers import StudentSerializer
+
 from .models import Assessment, AssessmentScore
 
 
-class AssessmentSerializer(serializers.ModelSerializer):
+class AssessmentSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Assessment
         fields = ["id", "section", "type", "weight"]
+        expandable_fields = {
+            "section_detail": (
+                SectionSerializer,
+                {"source": "section", "fields": SECTION_SUMMARY_FIELDS},
+            ),
+        }
 
     def validate(self, data):
         """Validate assessment weight doesn't exceed 100% for section"""
@@ -36,10 +49,14 @@ class AssessmentSerializer(serializers.ModelSerializer):
         return data
 
 
-class AssessmentScoreSerializer(serializers.ModelSerializer):
+class AssessmentScoreSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = AssessmentScore
         fields = ["id", "assessment", "student", "score", "max_score"]
+        expandable_fields = {
+            "assessment_detail": (AssessmentSerializer, {"source": "assessment"}),
+            "student_detail": (StudentSerializer, {"source": "student"}),
+        }
 
     def validate(self, data):
         """Validate score doesn't exceed max_score"""
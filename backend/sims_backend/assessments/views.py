@@ -1,14 +1,34 @@
-from rest_framework import viewsets
+import logging
+
+import django_rq
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter, SearchFilter
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 
-from sims_backend.common_permissions import IsAdminOrRegistrarReadOnlyFacultyStudent
+from core.mixins import ExpandableQuerysetMixin
+from sims_backend.academics.models import Section
+from sims_backend.common_permissions import (
+    IsAdminOrRegistrarReadOnlyFacultyStudent,
+    can_grade_section,
+)
+from sims_backend.results.recompute import mark_dirty
 
+from .gradebook import (
+    GradebookError,
+    parse_csv_matrix,
+    parse_json_matrix,
+    upsert_scores,
+)
 from .models import Assessment, AssessmentScore
 from .serializers import AssessmentScoreSerializer, AssessmentSerializer
 
+logger = logging.getLogger(__name__)
+
 
-class AssessmentViewSet(viewsets.ModelViewSet):
+class AssessmentViewSet(ExpandableQuerysetMixin, viewsets.ModelViewSet):
     queryset = Assessment.objects.all()
     serializer_class = AssessmentSerializer
     permission_classes = [IsAuthenticated, IsAdminOrRegistrarReadOnlyFacultyStudent]
@@ -18,7 +38,7 @@ class AssessmentViewSet(viewsets.ModelViewSet):
     ordering = ["id"]
 
 
-class AssessmentScoreViewSet(viewsets.ModelViewSet):
+class AssessmentScoreViewSet(ExpandableQuerysetMixin, viewsets.ModelViewSet):
     queryset = AssessmentScore.objects.all()
     serializer_class = AssessmentScoreSerializer
     permission_classes = [IsAuthenticated, IsAdminOrRegistrarReadOnlyFacultyStudent]
@@ -26,3 +46,86 @@ class AssessmentScoreViewSet(viewsets.ModelViewSet):
     search_fields = ["assessment__section__course__code", "student__reg_no"]
     ordering_fields = ["id", "score", "max_score"]
     ordering = ["id"]
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk",
+        permission_classes=[IsAuthenticated],
+        parser_classes=[JSONParser, MultiPartParser, FormParser],
+    )
+    def bulk_upload(self, request):
+        """
+        Upsert a section's scores from a JSON matrix or a CSV file.
+
+        JSON body:
+            {
+                "section": int,
+                "assessments": [int, ...],
+                "students": [int, ...],
+                "scores": [[float | null, ...], ...],
+                "max_scores": [float | null, ...] (optional),
+                "recompute": bool (optional)
+            }
+
+        Multipart: ``section``, ``file`` (``reg_no`` then one column per
+        assessment ID), optional ``max_scores`` ("20,30") and ``recompute``.
+        """
+        section_id = request.data.get("section")
+        if not section_id:
+            return Response(
+                {"error": {"code": 400, "message": "section is required"}},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            section = Section.objects.get(id=section_id)
+        except (Section.DoesNotExist, ValueError):
+            return Response(
+                {"error": {"code": 404, "message": "Section not found"}},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        if not can_grade_section(request.user, section):
+            return Response(
+                {"error": {"code": 403, "message": "Permission denied"}},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        try:
+            upload = request.FILES.get("file")
+            if upload is not None:
+                matrix = parse_csv_matrix(
+                    upload.file, request.data.get("max_scores", "")
+                )
+            else:
+                matrix = parse_json_matrix(request.data)
+            student_ids = upsert_scores(section, matrix)
+        except GradebookError as exc:
+            error = {"code": 400, "message": str(exc)}
+            if exc.errors:
+                error["details"] = exc.errors
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+        data = {
+            "section": section.id,
+            "students": len(student_ids),
+            "recompute_job_id": None,
+        }
+        # bulk_create skips signals, so the students are marked here.
+        mark_dirty(section.id, student_ids)
+        if str(request.data.get("recompute", "")).lower() in ("1", "true"):
+            data["recompute_job_id"] = self._enqueue_recompute(section.id)
+        return Response(data)
+
+    @staticmethod
+    def _enqueue_recompute(section_id: int) -> str | None:
+        from sims_backend.results.jobs import process_dirty_results
+
+        try:
+            job = django_rq.get_queue("default").enqueue(
+                process_dirty_results, section_id
+            )
+        except Exception:
+            # Scores are already saved; a failed enqueue must not fail the upload.
+            logger.exception("Failed to enqueue result recompute for %s", section_id)
+            return None
+        return str(job.id)
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.4 on 2026-10-19 09:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("attendance", "0002_alter_attendance_id"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="attendance",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+    ]
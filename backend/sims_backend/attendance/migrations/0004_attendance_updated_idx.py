@@ -0,0 +1,20 @@
+# Generated by Django 5.1.4 on 2026-10-19 17:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("academics", "0007_updated_at_indexes"),
+        ("admissions", "0005_student_updated_idx"),
+        ("attendance", "0003_attendance_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(
+                fields=["updated_at", "id"], name="attendance_updated_idx"
+            ),
+        ),
+    ]
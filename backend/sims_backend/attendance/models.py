@@ -11,6 +11,10 @@ class Attendance(models.Model):
     date = models.DateField()
     present = models.BooleanField(default=True)
     reason = models.CharField(max_length=255, blank=True, default="")
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         unique_together = ("section", "student", "date")
+        indexes = [
+            models.Index(fields=["updated_at", "id"], name="attendance_updated_idx"),
+        ]
@@ -1,13 +1,24 @@
 from rest_framework import serializers
 
+from core.mixins import ExpandableFieldsMixin
+from sims_backend.academics.serializers import (
+    SECTION_SUMMARY_FIELDS,
+    SectionSerializer,
+)
 from sims_backend.admissions.serializers import StudentSerializer
 
 from .models import Attendance
 
 
-class AttendanceSerializer(serializers.ModelSerializer):
-    student_detail = StudentSerializer(source="student", read_only=True)
-
+class AttendanceSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Attendance
-        fields = ["id", "section", "student", "student_detail", "date", "present", "reason"]
+        fields = ["id", "section", "student", "date", "present", "reason"]
+        expandable_fields = {
+            "student_detail": (StudentSerializer, {"source": "student"}),
+            "section_detail": (
+                SectionSerializer,
+                {"source": "section", "fields": SECTION_SUMMARY_FIELDS},
+            ),
+        }
+        default_expand = ["student_detail"]
@@ -6,6 +6,12 @@ from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from core.mixins import (
+    ChangesFeedMixin,
+    ConditionalGetMixin,
+    ExpandableQuerysetMixin,
+    ReplicaReadMixin,
+)
 from sims_backend.common_permissions import IsAdminOrRegistrarReadOnlyFacultyStudent
 
 from .models import Attendance
@@ -17,7 +23,13 @@ from .utils import (
 )
 
 
-class AttendanceViewSet(viewsets.ModelViewSet):
+class AttendanceViewSet(
+    ReplicaReadMixin,
+    ChangesFeedMixin,
+    ConditionalGetMixin,
+    ExpandableQuerysetMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Attendance.objects.all()
     serializer_class = AttendanceSerializer
     permission_classes = [IsAuthenticated, IsAdminOrRegistrarReadOnlyFacultyStudent]
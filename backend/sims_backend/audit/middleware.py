@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from collections.abc import Iterable
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
@@ -13,10 +14,17 @@ class WriteAuditMiddleware:
 
     WRITE_METHODS: Iterable[str] = ("POST", "PUT", "PATCH", "DELETE")
 
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
         response = self.get_response(request)
         try:
             self._maybe_record(request, response)
@@ -24,6 +32,16 @@ class WriteAuditMiddleware:
             logger.exception("Failed to record audit log entry")
         return response
 
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if request.method.upper() not in self.WRITE_METHODS:
+            return response
+        try:
+            await sync_to_async(self._maybe_record)(request, response)
+        except Exception:  # pragma: no cover - audit failures must not break requests
+            logger.exception("Failed to record audit log entry")
+        return response
+
     def _maybe_record(self, request, response) -> None:
         method = request.method.upper()
         if method not in self.WRITE_METHODS:
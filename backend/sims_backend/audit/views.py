@@ -2,6 +2,8 @@ from django_filters import rest_framework as filters
 from rest_framework import viewsets
 from rest_framework.permissions import IsAdminUser
 
+from core.mixins import ReplicaReadMixin
+
 from .models import AuditLog
 from .serializers import AuditLogSerializer
 
@@ -20,7 +22,7 @@ class AuditLogFilter(filters.FilterSet):
         fields = ["actor", "entity", "date_from", "date_to", "method"]
 
 
-class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
+class AuditLogViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for viewing audit logs.
     Only admins can view audit logs.
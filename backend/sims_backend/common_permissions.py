@@ -8,6 +8,13 @@ def in_group(user, group_name: str) -> bool:
         return False
 
 
+def can_grade_section(user, section) -> bool:
+    """Admin/Registrar may grade any section, Faculty only their own."""
+    if user.is_superuser or in_group(user, "Admin") or in_group(user, "Registrar"):
+        return True
+    return in_group(user, "Faculty") and section.teacher_id == user.id
+
+
 class IsAdminOrRegistrarReadOnlyFacultyStudent(BasePermission):
     """
     Admin/Registrar: full access.
@@ -6,3 +6,6 @@ class EnrollmentConfig(AppConfig):
     name = "sims_backend.enrollment"
     label = "enrollment"
     verbose_name = "Enrollment"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -1,15 +1,28 @@
 from rest_framework import serializers
 
+from core.mixins import ExpandableFieldsMixin
 from sims_backend.academics.models import Term
+from sims_backend.academics.serializers import (
+    SECTION_SUMMARY_FIELDS,
+    SectionSerializer,
+)
+from sims_backend.admissions.serializers import StudentSerializer
 
 from .models import Enrollment
 
 
-class EnrollmentSerializer(serializers.ModelSerializer):
+class EnrollmentSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Enrollment
         fields = ["id", "student", "section", "term", "status", "enrolled_at"]
         read_only_fields = ["enrolled_at"]
+        expandable_fields = {
+            "student_detail": (StudentSerializer, {"source": "student"}),
+            "section_detail": (
+                SectionSerializer,
+                {"source": "section", "fields": SECTION_SUMMARY_FIELDS},
+            ),
+        }
 
     def validate(self, data):
         """Validate enrollment capacity and term status"""
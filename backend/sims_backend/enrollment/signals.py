@@ -0,0 +1,16 @@
+"""Keep section version stamps in step with their enrollments."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from sims_backend.academics.models import Section
+
+from .models import Enrollment
+
+
+@receiver(post_save, sender=Enrollment)
+@receiver(post_delete, sender=Enrollment)
+def touch_section(sender, instance, **kwargs):
+    """Bump the section's ``updated_at`` so its seat counts revalidate."""
+    Section.objects.filter(pk=instance.section_id).update(updated_at=timezone.now())
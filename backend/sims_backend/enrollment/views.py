@@ -4,6 +4,8 @@ from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from core.idempotency import idempotent
+from core.mixins import ExpandableQuerysetMixin, ReplicaReadMixin
 from sims_backend.academics.models import Section
 from sims_backend.admissions.models import Student
 from sims_backend.common_permissions import IsAdminOrRegistrarReadOnlyFacultyStudent
@@ -12,7 +14,9 @@ from .models import Enrollment
 from .serializers import EnrollmentSerializer
 
 
-class EnrollmentViewSet(viewsets.ModelViewSet):
+class EnrollmentViewSet(
+    ReplicaReadMixin, ExpandableQuerysetMixin, viewsets.ModelViewSet
+):
     queryset = Enrollment.objects.all()
     serializer_class = EnrollmentSerializer
     permission_classes = [IsAuthenticated, IsAdminOrRegistrarReadOnlyFacultyStudent]
@@ -24,6 +28,7 @@ class EnrollmentViewSet(viewsets.ModelViewSet):
 
 @api_view(["POST"])
 @permission_classes([IsAuthenticated, IsAdminOrRegistrarReadOnlyFacultyStudent])
+@idempotent
 def enroll_in_section(request, section_id):
     """Enroll a student in a specific section"""
     student_id = request.data.get("student_id")
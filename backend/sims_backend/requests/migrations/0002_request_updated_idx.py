@@ -0,0 +1,17 @@
+# Generated by Django 5.1.4 on 2026-10-19 17:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("admissions", "0005_student_updated_idx"),
+        ("requests", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="request",
+            index=models.Index(fields=["updated_at", "id"], name="request_updated_idx"),
+        ),
+    ]
@@ -28,3 +28,6 @@ class Request(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["updated_at", "id"], name="request_updated_idx"),
+        ]
@@ -1,9 +1,12 @@
 from rest_framework import serializers
 
+from core.mixins import ExpandableFieldsMixin
+from sims_backend.admissions.serializers import StudentSerializer
+
 from .models import Request
 
 
-class RequestSerializer(serializers.ModelSerializer):
+class RequestSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Request
         fields = [
@@ -17,3 +20,6 @@ class RequestSerializer(serializers.ModelSerializer):
             "processed_by",
         ]
         read_only_fields = ["created_at", "updated_at"]
+        expandable_fields = {
+            "student_detail": (StudentSerializer, {"source": "student"}),
+        }
@@ -5,13 +5,23 @@ from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from core.mixins import (
+    ChangesFeedMixin,
+    ConditionalGetMixin,
+    ExpandableQuerysetMixin,
+)
 from sims_backend.common_permissions import IsAdminOrRegistrarReadOnlyFacultyStudent
 
 from .models import Request
 from .serializers import RequestSerializer
 
 
-class RequestViewSet(viewsets.ModelViewSet):
+class RequestViewSet(
+    ChangesFeedMixin,
+    ConditionalGetMixin,
+    ExpandableQuerysetMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Request.objects.all()
     serializer_class = RequestSerializer
     permission_classes = [IsAuthenticated, IsAdminOrRegistrarReadOnlyFacultyStudent]
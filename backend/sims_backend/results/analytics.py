@@ -0,0 +1,197 @@
+"""
+Grade-distribution analytics for sections, courses and terms.
+
+For each section the enrolled students' weighted totals and the letter-grade
+counts of its results are loaded with a handful of set queries covering many
+sections at once, then cached per section until its results are published
+or recomputed. Summaries (mean, median, population standard deviation,
+percentiles and histograms) are derived from the cached columns, so a
+course- or term-wide report merges cached sections instead of re-reading
+scores.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from collections import Counter, defaultdict
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count
+
+logger = logging.getLogger(__name__)
+
+PERCENTILES = (10, 25, 50, 75, 90)
+HISTOGRAM_BINS = tuple(range(0, 101, 10))
+
+
+def _cache_key(section_id: int) -> str:
+    return f"results:analytics:section:{section_id}"
+
+
+def invalidate_section(section_id: int) -> None:
+    """
+    Drop the cached distribution of ``section_id`` once the current
+    transaction commits.
+
+    Dropping it earlier would let a concurrent read cache the rows being
+    replaced for ``ANALYTICS_CACHE_TIMEOUT`` seconds.
+    """
+
+    def _drop():
+        try:
+            cache.delete(_cache_key(section_id))
+        except Exception:
+            logger.exception("Failed to drop analytics cache of section %s", section_id)
+
+    transaction.on_commit(_drop)
+
+
+def _load_sections(section_ids: list[int]) -> dict[int, dict]:
+    """Read totals and grade counts of ``section_ids`` in four queries."""
+    from sims_backend.assessments.models import Assessment, AssessmentScore
+    from sims_backend.enrollment.models import Enrollment
+
+    from .models import Result
+
+    weights = {
+        assessment_id: (section_id, weight)
+        for assessment_id, section_id, weight in Assessment.objects.filter(
+            section_id__in=section_ids
+        ).values_list("id", "section_id", "weight")
+    }
+    # Enrolled students without scores count as zero, as in the gradebook.
+    totals: dict[int, dict[int, float]] = {section_id: {} for section_id in section_ids}
+    for section_id, student_id in Enrollment.objects.filter(
+        section_id__in=section_ids, status="enrolled"
+    ).values_list("section_id", "student_id"):
+        totals[section_id][student_id] = 0.0
+    for assessment_id, student_id, score, max_score in AssessmentScore.objects.filter(
+        assessment__section_id__in=section_ids
+    ).values_list("assessment_id", "student_id", "score", "max_score"):
+        section_id, weight = weights[assessment_id]
+        section_totals = totals[section_id]
+        if student_id in section_totals and max_score > 0:
+            section_totals[student_id] += (score / max_score) * weight
+
+    grades: defaultdict[int, dict[str, int]] = defaultdict(dict)
+    for section_id, grade, count in (
+        Result.objects.filter(section_id__in=section_ids)
+        .order_by()
+        .values("section_id", "final_grade")
+        .annotate(count=Count("id"))
+        .values_list("section_id", "final_grade", "count")
+    ):
+        grades[section_id][grade] = count
+
+    return {
+        section_id: {
+            "totals": sorted(round(total, 2) for total in totals[section_id].values()),
+            "grades": grades.get(section_id, {}),
+        }
+        for section_id in section_ids
+    }
+
+
+def get_section_columns(section_ids) -> dict[int, dict]:
+    """
+    Return ``{"totals": [...], "grades": {...}}`` per section, reading only
+    the sections missing from the cache.
+    """
+    section_ids = list(section_ids)
+    try:
+        columns = cache.get_many([_cache_key(section_id) for section_id in section_ids])
+    except Exception:
+        logger.exception("Analytics cache unavailable")
+        columns = {}
+    found = {
+        section_id: columns[_cache_key(section_id)]
+        for section_id in section_ids
+        if _cache_key(section_id) in columns
+    }
+    missing = [section_id for section_id in section_ids if section_id not in found]
+    if missing:
+        loaded = _load_sections(missing)
+        try:
+            cache.set_many(
+                {_cache_key(section_id): data for section_id, data in loaded.items()},
+                timeout=settings.ANALYTICS_CACHE_TIMEOUT,
+            )
+        except Exception:
+            logger.exception("Failed to store analytics cache entries")
+        found.update(loaded)
+    return found
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    # Linear interpolation between closest ranks, like percentile_cont.
+    position = (len(values) - 1) * fraction
+    lower = math.floor(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def summarize(totals: list[float], grades: dict[str, int]) -> dict:
+    """Describe sorted ``totals`` and letter-grade counts."""
+    count = len(totals)
+    histogram = [0] * (len(HISTOGRAM_BINS) - 1)
+    for total in totals:
+        # The last bin is closed so 100 lands in 90-100.
+        histogram[min(int(total // 10), len(histogram) - 1)] += 1
+
+    summary: dict[str, Any] = {
+        "count": count,
+        "mean": None,
+        "median": None,
+        "stddev": None,
+        "min": totals[0] if totals else None,
+        "max": totals[-1] if totals else None,
+        "percentiles": dict.fromkeys((f"p{p}" for p in PERCENTILES), None),
+        "histogram": {"bins": list(HISTOGRAM_BINS), "counts": histogram},
+        "grades": dict(sorted(grades.items())),
+    }
+    if count:
+        mean = math.fsum(totals) / count
+        summary["mean"] = round(mean, 2)
+        summary["median"] = round(_percentile(totals, 0.5), 2)
+        summary["stddev"] = round(
+            math.sqrt(math.fsum((total - mean) ** 2 for total in totals) / count), 2
+        )
+        summary["percentiles"] = {
+            f"p{p}": round(_percentile(totals, p / 100), 2) for p in PERCENTILES
+        }
+    return summary
+
+
+def distribution_report(sections) -> dict:
+    """
+    Summarize each of ``sections`` and all of them combined.
+
+    Args:
+        sections: Iterable of ``(id, course code, term)`` tuples
+    """
+    sections = list(sections)
+    columns = get_section_columns(section_id for section_id, _, _ in sections)
+
+    combined_totals: list[float] = []
+    combined_grades: Counter[str] = Counter()
+    per_section = []
+    for section_id, course_code, term in sections:
+        data = columns[section_id]
+        combined_totals.extend(data["totals"])
+        combined_grades.update(data["grades"])
+        per_section.append(
+            {
+                "section": section_id,
+                "course": course_code,
+                "term": term,
+                **summarize(data["totals"], data["grades"]),
+            }
+        )
+    return {
+        "overall": summarize(sorted(combined_totals), dict(combined_grades)),
+        "sections": per_section,
+    }
@@ -6,3 +6,6 @@ class ResultsConfig(AppConfig):
     name = "sims_backend.results"
     label = "results"
     verbose_name = "Results"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,113 @@
+"""
+Batch resolution of pending grade-change requests.
+
+All requested changes and every pending change on the same results are
+locked, checked and resolved in one transaction, with one bulk update for
+the results and one for the change records.
+"""
+
+from __future__ import annotations
+
+from django.db import transaction
+from django.utils import timezone
+
+from .analytics import invalidate_section
+from .models import PendingChange, Result
+from .standings import refresh_standings
+
+MAX_BATCH_SIZE = 1000
+
+
+@transaction.atomic
+def resolve_changes(decisions: list[tuple[int, bool]], approved_by: str) -> list[dict]:
+    """
+    Approve or reject many pending changes at once.
+
+    An approval conflicts when another pending change on the same result
+    stays pending after this batch, since either could overwrite the other;
+    rejecting the rival in the same batch resolves the conflict. Conflicting
+    approvals are left pending.
+
+    Args:
+        decisions: ``(change_id, approved)`` pairs
+        approved_by: Recorded on every resolved change
+
+    Returns:
+        One ``{"change_id", "status"[, "message"]}`` outcome per decision, in
+        order; ``status`` is ``approved``, ``rejected``, ``conflict``,
+        ``duplicate``, ``not_found`` or ``already_<status>``
+    """
+    change_ids = [change_id for change_id, _ in decisions]
+    changes = {
+        change.id: change
+        for change in PendingChange.objects.select_for_update()
+        .select_related("result")
+        .filter(id__in=change_ids)
+    }
+    result_ids = {change.result_id for change in changes.values()}
+    # Pending changes outside the batch that target the same results.
+    rivals = set(
+        PendingChange.objects.select_for_update()
+        .filter(result_id__in=result_ids, status="pending")
+        .exclude(id__in=change_ids)
+        .values_list("result_id", flat=True)
+    )
+
+    outcomes: list[dict | None] = []
+    seen = set()
+    valid = []
+    for change_id, approved in decisions:
+        change = changes.get(change_id)
+        if change_id in seen:
+            outcomes.append({"change_id": change_id, "status": "duplicate"})
+        elif change is None:
+            outcomes.append({"change_id": change_id, "status": "not_found"})
+        elif change.status != "pending":
+            outcomes.append(
+                {"change_id": change_id, "status": f"already_{change.status}"}
+            )
+        else:
+            outcomes.append(None)
+            valid.append((len(outcomes) - 1, change, approved))
+        seen.add(change_id)
+
+    approvals_per_result: dict[int, int] = {}
+    for _, change, approved in valid:
+        if approved:
+            approvals_per_result[change.result_id] = (
+                approvals_per_result.get(change.result_id, 0) + 1
+            )
+
+    now = timezone.now()
+    resolved, results = [], []
+    for position, change, approved in valid:
+        if approved and (
+            approvals_per_result[change.result_id] > 1 or change.result_id in rivals
+        ):
+            outcomes[position] = {
+                "change_id": change.id,
+                "status": "conflict",
+                "message": "Another pending change targets the same result",
+            }
+            continue
+        change.status = "approved" if approved else "rejected"
+        change.approved_by = approved_by
+        change.resolved_at = now
+        resolved.append(change)
+        if approved:
+            change.result.final_grade = change.new_grade
+            change.result.updated_at = now
+            results.append(change.result)
+        outcomes[position] = {"change_id": change.id, "status": change.status}
+
+    # bulk_update bypasses auto_now, so updated_at is stamped above.
+    Result.objects.bulk_update(results, ["final_grade", "updated_at"])
+    PendingChange.objects.bulk_update(
+        resolved, ["status", "approved_by", "resolved_at"]
+    )
+    if results:
+        refresh_standings(result.student_id for result in results)
+        for section_id in {result.section_id for result in results}:
+            invalidate_section(section_id)
+    # Every placeholder has been filled in by now.
+    return [outcome for outcome in outcomes if outcome is not None]
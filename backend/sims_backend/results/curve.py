@@ -0,0 +1,170 @@
+"""
+Relative grading ("curves") for sections that opt in with a CurvePolicy.
+
+A curve grades every enrolled student of a section against the others, so
+all weighted totals are loaded once and graded together:
+
+* ``zscore``: each total's z-score (population standard deviation) is
+  looked up in the bands, compiled like a grading scale, by binary search.
+* ``quota``: students are ranked by total and the best ``percent`` of the
+  section gets the first grade, the next ``percent`` the second, and so on.
+  Tied totals share the better grade.
+
+The resulting grades are written in one bulk update, or only summarized
+when previewing with ``dry_run``.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Callable
+
+from .grading import compile_scale
+from .utils import calculate_section_percentages, write_draft_grades
+
+METHODS = ("zscore", "quota")
+
+
+class CurveError(ValueError):
+    """Raised when a curve's method or bands are invalid."""
+
+
+def _zscore_grader(bands: list[dict]) -> Callable[[list[float]], list[str]]:
+    floors = [band for band in bands if band.get("min_z") is None]
+    if len(floors) != 1:
+        raise CurveError("Exactly one z-score band must have min_z null.")
+    try:
+        bounds = [
+            (float(band["min_z"]), band["grade"])
+            for band in bands
+            if band.get("min_z") is not None
+        ]
+    except (TypeError, ValueError):
+        raise CurveError("min_z must be a number or null.") from None
+    if len({bound for bound, _ in bounds}) != len(bounds):
+        raise CurveError("min_z values must be unique.")
+    # The floor band sits below every other bound.
+    scale = compile_scale([(-math.inf, floors[0]["grade"]), *bounds])
+
+    def grade(totals: list[float]) -> list[str]:
+        if not totals:
+            return []
+        mean = math.fsum(totals) / len(totals)
+        stddev = math.sqrt(math.fsum((t - mean) ** 2 for t in totals) / len(totals))
+        if stddev == 0:
+            return scale.grade_many([0.0] * len(totals))
+        return scale.grade_many((t - mean) / stddev for t in totals)
+
+    return grade
+
+
+def _quota_grader(bands: list[dict]) -> Callable[[list[float]], list[str]]:
+    try:
+        percents = [float(band["percent"]) for band in bands]
+    except (KeyError, TypeError, ValueError):
+        raise CurveError("Every quota band needs a numeric percent.") from None
+    if any(percent <= 0 for percent in percents):
+        raise CurveError("Quota percents must be positive.")
+    if not math.isclose(math.fsum(percents), 100):
+        raise CurveError("Quota percents must add up to 100.")
+    cutoffs, running = [], 0.0
+    for percent in percents:
+        running += percent
+        cutoffs.append(running)
+    grades = [band["grade"] for band in bands]
+
+    def grade(totals: list[float]) -> list[str]:
+        count = len(totals)
+        order = sorted(range(count), key=lambda i: totals[i], reverse=True)
+        result = [""] * count
+        better = 0
+        for position, index in enumerate(order):
+            if position and totals[index] != totals[order[position - 1]]:
+                better = position
+            # Share of the section ranked strictly above this student.
+            rank = better / count * 100
+            result[index] = grades[min(bisect_right(cutoffs, rank), len(grades) - 1)]
+        return result
+
+    return grade
+
+
+def compile_curve(method: str, bands) -> Callable[[list[float]], list[str]]:
+    """
+    Validate a curve and return a function grading a list of totals.
+
+    Raises:
+        CurveError: if the method or bands are invalid
+    """
+    if method not in METHODS:
+        raise CurveError(f"method must be one of: {', '.join(METHODS)}")
+    if not isinstance(bands, list) or not bands:
+        raise CurveError("bands must be a non-empty list.")
+    if not all(isinstance(band, dict) and band.get("grade") for band in bands):
+        raise CurveError("Every band needs a grade.")
+    grades = [band["grade"] for band in bands]
+    if len(set(grades)) != len(grades):
+        raise CurveError("Grades must be unique.")
+    if method == "zscore":
+        return _zscore_grader(bands)
+    return _quota_grader(bands)
+
+
+def apply_curve(section_id: int, method: str, bands, dry_run: bool = False) -> dict:
+    """
+    Grade every enrolled student of ``section_id`` on a curve.
+
+    Args:
+        section_id: Section ID
+        method: ``"zscore"`` or ``"quota"``
+        bands: Bands for ``method`` (see :class:`~.models.CurvePolicy`)
+        dry_run: Only return the preview, write nothing
+
+    Returns:
+        Dict with the grade ``distribution``, total statistics, per-student
+        ``students`` rows and, unless ``dry_run``, write ``counts``
+
+    Raises:
+        CurveError: if the method or bands are invalid
+    """
+    from sims_backend.enrollment.models import Enrollment
+
+    grader = compile_curve(method, bands)
+    student_ids = Enrollment.objects.filter(
+        section_id=section_id, status="enrolled"
+    ).values_list("student_id", flat=True)
+    # Curves rank the totals as shown, so students with equal displayed
+    # totals always tie.
+    percentages = {
+        student_id: round(total, 2)
+        for student_id, total in calculate_section_percentages(
+            section_id, list(student_ids)
+        ).items()
+    }
+    totals = list(percentages.values())
+    grades = dict(zip(percentages, grader(totals), strict=True))
+
+    mean = math.fsum(totals) / len(totals) if totals else None
+    distribution = Counter(grades.values())
+    preview = {
+        "section": section_id,
+        "method": method,
+        "dry_run": dry_run,
+        "count": len(totals),
+        "mean": round(mean, 2) if mean is not None else None,
+        "distribution": {
+            band["grade"]: distribution.get(band["grade"], 0) for band in bands
+        },
+        "students": [
+            {"student": student_id, "total": percentages[student_id], "grade": grade}
+            for student_id, grade in sorted(
+                grades.items(), key=lambda item: -percentages[item[0]]
+            )
+        ],
+        "counts": None,
+    }
+    if not dry_run:
+        preview["counts"] = write_draft_grades(section_id, grades)
+    return preview
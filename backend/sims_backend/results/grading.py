@@ -0,0 +1,178 @@
+"""
+Grading scales compiled for fast percentage-to-grade lookups.
+
+Scales are stored as :class:`~.models.GradingScale` rows with one
+:class:`~.models.GradeBoundary` per letter grade. Every scale is compiled once
+per process into a sorted array of lower bounds with a parallel array of
+grades, so a lookup is a single :func:`bisect.bisect_right`. The compiled
+scales are reloaded when the shared ``grading_scales`` cache version changes,
+which happens whenever a scale or boundary is edited. While the cache is
+unreachable the scales compiled last are kept.
+
+A scale applies to a (program, term) scope; a blank program or term matches
+any. For a section the most specific scale wins, falling back to the
+built-in :data:`DEFAULT_BOUNDARIES` when no scale matches.
+
+Each scale also maps its grades to GPA grade points; boundaries without
+explicit points use :data:`DEFAULT_GRADE_POINTS`.
+"""
+
+from __future__ import annotations
+
+import logging
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from core.cache import bump_namespaces, get_version
+
+logger = logging.getLogger(__name__)
+
+CACHE_NAMESPACE = "grading_scales"
+
+# (min_percentage, grade), used when no stored scale matches.
+DEFAULT_BOUNDARIES = (
+    (90, "A+"),
+    (85, "A"),
+    (80, "B+"),
+    (75, "B"),
+    (70, "C+"),
+    (65, "C"),
+    (60, "D"),
+    (0, "F"),
+)
+
+# Grade points for common letter grades. Grades without points (such as
+# incompletes) do not count towards GPA.
+DEFAULT_GRADE_POINTS = {
+    "A+": 4.0,
+    "A": 4.0,
+    "A-": 3.7,
+    "B+": 3.3,
+    "B": 3.0,
+    "B-": 2.7,
+    "C+": 2.3,
+    "C": 2.0,
+    "C-": 1.7,
+    "D": 1.0,
+    "F": 0.0,
+}
+
+
+@dataclass(frozen=True)
+class CompiledScale:
+    """Ascending lower ``bounds`` with the ``grades`` they start."""
+
+    bounds: tuple[float, ...]
+    grades: tuple[str, ...]
+    points: dict[str, float] = field(default_factory=dict)
+
+    def grade(self, percentage: float) -> str:
+        # Percentages below the lowest bound get the lowest grade.
+        return self.grades[max(bisect_right(self.bounds, percentage) - 1, 0)]
+
+    def grade_many(self, percentages: Iterable[float]) -> list[str]:
+        """Grade a whole vector of percentages."""
+        bounds, grades = self.bounds, self.grades
+        return [grades[max(bisect_right(bounds, p) - 1, 0)] for p in percentages]
+
+    def grade_points(self, grade: str) -> float | None:
+        """Return the GPA points for ``grade``, or ``None`` if it has none."""
+        points = self.points.get(grade)
+        return DEFAULT_GRADE_POINTS.get(grade) if points is None else points
+
+
+def compile_scale(
+    boundaries: Iterable[tuple[float, str]],
+    points: dict[str, float] | None = None,
+) -> CompiledScale:
+    """
+    Compile ``(min_percentage, grade)`` pairs into a :class:`CompiledScale`.
+
+    ``points`` overrides :data:`DEFAULT_GRADE_POINTS` for the given grades.
+    """
+    ordered = sorted(boundaries)
+    if not ordered:
+        raise ValueError("A grading scale needs at least one boundary")
+    return CompiledScale(
+        bounds=tuple(float(bound) for bound, _ in ordered),
+        grades=tuple(grade for _, grade in ordered),
+        points=dict(points or {}),
+    )
+
+
+DEFAULT_SCALE = compile_scale(DEFAULT_BOUNDARIES)
+
+# (cache version, {(program_id, term): CompiledScale}) for this process.
+_registry: tuple[int | None, dict] | None = None
+
+
+def _load_scales() -> dict[tuple[int | None, str], CompiledScale]:
+    from .models import GradeBoundary
+
+    boundaries: dict[tuple[int | None, str], list] = {}
+    points: dict[tuple[int | None, str], dict] = {}
+    rows = GradeBoundary.objects.order_by().values_list(
+        "scale__program_id", "scale__term", "min_percentage", "grade", "grade_points"
+    )
+    for program_id, term, min_percentage, grade, grade_points in rows:
+        boundaries.setdefault((program_id, term), []).append((min_percentage, grade))
+        if grade_points is not None:
+            points.setdefault((program_id, term), {})[grade] = grade_points
+    return {
+        scope: compile_scale(pairs, points.get(scope))
+        for scope, pairs in boundaries.items()
+    }
+
+
+def _current_version() -> int | None:
+    try:
+        return get_version(CACHE_NAMESPACE)
+    except Exception:
+        logger.exception("Grading scale cache version unavailable")
+        return None
+
+
+def _scales() -> dict[tuple[int | None, str], CompiledScale]:
+    global _registry
+    version = _current_version()
+    # Without a shared version, keep the scales compiled last: edits made in
+    # this process still drop them through ``invalidate``.
+    if _registry is not None and (version is None or _registry[0] == version):
+        return _registry[1]
+    _registry = (version, _load_scales())
+    return _registry[1]
+
+
+def invalidate() -> None:
+    """Drop compiled scales here and, after commit, in every process."""
+    global _registry
+    _registry = None
+    bump_namespaces(CACHE_NAMESPACE)
+
+
+def get_scale(program_id: int | None = None, term: str = "") -> CompiledScale:
+    """Return the most specific scale for ``program_id`` and ``term``."""
+    scales = _scales()
+    for scope in ((program_id, term), (program_id, ""), (None, term), (None, "")):
+        if scope in scales:
+            return scales[scope]
+    return DEFAULT_SCALE
+
+
+def scale_for_section(section) -> CompiledScale:
+    """Return the scale for a :class:`~academics.models.Section` or its ID."""
+    if isinstance(section, int):
+        from sims_backend.academics.models import Section
+
+        row = (
+            Section.objects.filter(pk=section)
+            .values_list("course__program_id", "term")
+            .first()
+        )
+        if row is None:
+            return get_scale()
+        program_id, term = row
+    else:
+        program_id, term = section.course.program_id, section.term
+    return get_scale(program_id, term)
@@ -0,0 +1,115 @@
+"""Background jobs for result computation"""
+
+import logging
+from typing import Any
+
+from .analytics import invalidate_section
+from .utils import recompute_results, recompute_uncurved_results
+
+logger = logging.getLogger(__name__)
+
+
+def recompute_section_results(
+    section_id: int, student_ids: list[int] | None = None
+) -> dict[str, Any]:
+    """
+    Background job to recompute draft results of a section.
+
+    Args:
+        section_id: ID of the section
+        student_ids: Students to recompute (default: all enrolled students)
+
+    Returns:
+        Dict with counts of created, updated and skipped results
+    """
+    counts = recompute_results(section_id, student_ids)
+    logger.info(f"Recomputed results for section {section_id}: {counts}")
+    return {"section_id": section_id, **counts}
+
+
+def process_dirty_results(section_id: int) -> dict[str, Any]:
+    """
+    Background job to recompute the section's results marked dirty.
+
+    Dirty rows are processed in batches of ``RESULT_RECOMPUTE_BATCH_SIZE``.
+    Each batch stays locked until it is recomputed and cleared, so a score
+    edited meanwhile re-marks its student once the batch commits and is
+    picked up by the next run. A curved section is regraded as a whole, so
+    its dirty rows are locked together and the curve is applied once.
+
+    Args:
+        section_id: ID of the section
+
+    Returns:
+        Dict with counts of created, updated and skipped results
+    """
+    from django.core.cache import cache
+
+    from .models import CurvePolicy
+    from .recompute import pending_key
+
+    # Clear the pending flag first so edits from now on schedule a new run.
+    cache.delete(pending_key(section_id))
+
+    policy = CurvePolicy.objects.filter(section_id=section_id).first()
+    if policy is not None:
+        totals = _regrade_curved_section(section_id, policy)
+    else:
+        totals = _recompute_dirty_batches(section_id)
+
+    # Scores changed, so the cached distribution is stale either way.
+    invalidate_section(section_id)
+    logger.info(f"Recomputed dirty results for section {section_id}: {totals}")
+    return {"section_id": section_id, **totals}
+
+
+def _regrade_curved_section(section_id: int, policy) -> dict[str, int]:
+    """Apply the section's curve once if any of its results are dirty."""
+    from django.db import transaction
+
+    from .curve import apply_curve
+    from .models import DirtyResult
+
+    with transaction.atomic():
+        dirty = list(
+            DirtyResult.objects.select_for_update(skip_locked=True)
+            .filter(section_id=section_id)
+            .values_list("id", flat=True)
+        )
+        if not dirty:
+            return {"created": 0, "updated": 0, "skipped": 0}
+        preview = apply_curve(section_id, policy.method, policy.bands)
+        DirtyResult.objects.filter(id__in=dirty).delete()
+    counts: dict[str, int] = preview["counts"]
+    return counts
+
+
+def _recompute_dirty_batches(section_id: int) -> dict[str, int]:
+    """Recompute the dirty students of an uncurved section batch by batch."""
+    from django.conf import settings
+    from django.db import transaction
+
+    from .models import DirtyResult
+
+    totals = {"created": 0, "updated": 0, "skipped": 0}
+    last_id = 0
+    while True:
+        with transaction.atomic():
+            batch = list(
+                DirtyResult.objects.select_for_update(skip_locked=True)
+                .filter(section_id=section_id, id__gt=last_id)
+                .order_by("id")
+                .values_list("id", "student_id")[
+                    : settings.RESULT_RECOMPUTE_BATCH_SIZE
+                ]
+            )
+            if not batch:
+                break
+            last_id = batch[-1][0]
+            counts = recompute_uncurved_results(
+                section_id, [student_id for _, student_id in batch]
+            )
+            for key, value in counts.items():
+                totals[key] += value
+            DirtyResult.objects.filter(id__in=[row_id for row_id, _ in batch]).delete()
+    return totals
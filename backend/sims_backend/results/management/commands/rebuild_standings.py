@@ -0,0 +1,43 @@
+"""
+Management command to rebuild materialized GPA/CGPA standings
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from sims_backend.admissions.models import Student
+from sims_backend.results.standings import refresh_standings
+
+
+class Command(BaseCommand):
+    """
+    Recompute every student's term GPAs and CGPA from their results.
+
+    Standings are kept up to date as results are published, frozen and
+    changed; run this after importing results or editing grading scales.
+    """
+
+    help = "Rebuild term GPA and CGPA standings from published results"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Students refreshed per batch (default: 1000)",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        if chunk_size < 1:
+            raise CommandError("--chunk-size must be positive")
+
+        student_ids = list(Student.objects.order_by("id").values_list("id", flat=True))
+        rows = 0
+        for start in range(0, len(student_ids), chunk_size):
+            rows += refresh_standings(student_ids[start : start + chunk_size])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt standings for {len(student_ids)} students ({rows} term GPAs)"
+            )
+        )
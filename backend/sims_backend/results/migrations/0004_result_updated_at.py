@@ -0,0 +1,21 @@
+# Generated by Django 5.1.4 on 2026-10-19 09:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("results", "0003_result_frozen_at_result_frozen_by_result_state_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="result",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-19 17:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("academics", "0007_updated_at_indexes"),
+        ("admissions", "0005_student_updated_idx"),
+        ("results", "0004_result_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="result",
+            index=models.Index(fields=["updated_at", "id"], name="result_updated_idx"),
+        ),
+    ]
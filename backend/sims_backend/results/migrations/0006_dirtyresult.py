@@ -0,0 +1,33 @@
+# Generated by Django 5.1.4 on 2026-10-19 09:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("results", "0005_result_updated_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DirtyResult",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("student_id", models.BigIntegerField()),
+                ("section_id", models.BigIntegerField(db_index=True)),
+                ("marked_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "unique_together": {("student_id", "section_id")},
+            },
+        ),
+    ]
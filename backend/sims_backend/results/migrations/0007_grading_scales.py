@@ -0,0 +1,86 @@
+# Generated by Django 5.1.4 on 2026-10-19 09:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("academics", "0008_trigram_search_indexes"),
+        ("results", "0006_dirtyresult"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GradingScale",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=128)),
+                ("term", models.CharField(blank=True, default="", max_length=32)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "program",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="grading_scales",
+                        to="academics.program",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="GradeBoundary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("grade", models.CharField(max_length=8)),
+                ("min_percentage", models.FloatField()),
+                (
+                    "scale",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="boundaries",
+                        to="results.gradingscale",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-min_percentage"],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="gradingscale",
+            constraint=models.UniqueConstraint(
+                fields=("program", "term"), name="grading_scale_scope_unique"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="gradingscale",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("program__isnull", True)),
+                fields=("term",),
+                name="grading_scale_term_unique",
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="gradeboundary",
+            unique_together={("scale", "grade"), ("scale", "min_percentage")},
+        ),
+    ]
@@ -0,0 +1,83 @@
+# Generated by Django 5.1.4 on 2026-10-19 09:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("admissions", "0006_trigram_search_indexes"),
+        ("results", "0007_grading_scales"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="gradeboundary",
+            name="grade_points",
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name="StudentCGPA",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("credits", models.PositiveIntegerField(default=0)),
+                ("quality_points", models.FloatField(default=0)),
+                ("cgpa", models.FloatField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "student",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="cgpa",
+                        to="admissions.student",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["-cgpa"], name="student_cgpa_rank_idx")
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="TermGPA",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("term", models.CharField(max_length=32)),
+                ("credits", models.PositiveIntegerField(default=0)),
+                ("quality_points", models.FloatField(default=0)),
+                ("gpa", models.FloatField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "student",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="term_gpas",
+                        to="admissions.student",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["term", "-gpa"], name="term_gpa_rank_idx")
+                ],
+                "unique_together": {("student", "term")},
+            },
+        ),
+    ]
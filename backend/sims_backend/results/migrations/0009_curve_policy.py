@@ -0,0 +1,48 @@
+# Generated by Django 5.1.4 on 2026-10-19 09:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("academics", "0008_trigram_search_indexes"),
+        ("results", "0008_gpa_standings"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CurvePolicy",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "method",
+                    models.CharField(
+                        choices=[
+                            ("zscore", "Z-score bands"),
+                            ("quota", "Percentile quotas"),
+                        ],
+                        max_length=16,
+                    ),
+                ),
+                ("bands", models.JSONField(default=list)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "section",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="curve_policy",
+                        to="academics.section",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 
 class Result(models.Model):
@@ -23,9 +24,13 @@ class Result(models.Model):
     published_by = models.CharField(max_length=128, blank=True, default="")
     frozen_at = models.DateTimeField(null=True, blank=True)
     frozen_by = models.CharField(max_length=128, blank=True, default="")
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         unique_together = ("student", "section")
+        indexes = [
+            models.Index(fields=["updated_at", "id"], name="result_updated_idx"),
+        ]
 
 
 class PendingChange(models.Model):
@@ -45,3 +50,127 @@ class PendingChange(models.Model):
     reason = models.TextField(blank=True, default="")
     requested_at = models.DateTimeField(auto_now_add=True)
     resolved_at = models.DateTimeField(null=True, blank=True)
+
+
+class DirtyResult(models.Model):
+    """A (student, section) pair whose draft result needs recomputing.
+
+    Plain IDs are stored instead of foreign keys so that rows marked while a
+    section or student is being deleted do not block the delete.
+    """
+
+    student_id = models.BigIntegerField()
+    section_id = models.BigIntegerField(db_index=True)
+    marked_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        unique_together = ("student_id", "section_id")
+
+
+class GradingScale(models.Model):
+    """Percentage-to-letter-grade scale for a program and/or term.
+
+    A blank ``program`` or ``term`` matches any; the most specific scale wins
+    (see ``results.grading``).
+    """
+
+    name = models.CharField(max_length=128)
+    program = models.ForeignKey(
+        "academics.Program",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="grading_scales",
+    )
+    term = models.CharField(max_length=32, blank=True, default="")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["program", "term"], name="grading_scale_scope_unique"
+            ),
+            models.UniqueConstraint(
+                fields=["term"],
+                condition=models.Q(program__isnull=True),
+                name="grading_scale_term_unique",
+            ),
+        ]
+
+    def __str__(self):
+        return self.name
+
+
+class GradeBoundary(models.Model):
+    """Lowest percentage that earns ``grade`` on a scale."""
+
+    scale = models.ForeignKey(
+        GradingScale, on_delete=models.CASCADE, related_name="boundaries"
+    )
+    grade = models.CharField(max_length=8)
+    min_percentage = models.FloatField()
+    # GPA points; blank uses the standard points for the grade.
+    grade_points = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-min_percentage"]
+        unique_together = [("scale", "grade"), ("scale", "min_percentage")]
+
+
+class TermGPA(models.Model):
+    """A student's GPA over their published results in one term.
+
+    Maintained by ``results.standings`` whenever a result is published,
+    frozen or changed, so rankings never aggregate raw results.
+    """
+
+    student = models.ForeignKey(
+        "admissions.Student", on_delete=models.CASCADE, related_name="term_gpas"
+    )
+    term = models.CharField(max_length=32)
+    credits = models.PositiveIntegerField(default=0)
+    quality_points = models.FloatField(default=0)
+    gpa = models.FloatField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ("student", "term")
+        indexes = [
+            models.Index(fields=["term", "-gpa"], name="term_gpa_rank_idx"),
+        ]
+
+
+class StudentCGPA(models.Model):
+    """A student's cumulative GPA across all terms."""
+
+    student = models.OneToOneField(
+        "admissions.Student", on_delete=models.CASCADE, related_name="cgpa"
+    )
+    credits = models.PositiveIntegerField(default=0)
+    quality_points = models.FloatField(default=0)
+    cgpa = models.FloatField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["-cgpa"], name="student_cgpa_rank_idx")]
+
+
+class CurvePolicy(models.Model):
+    """Opt-in relative grading for a section (see ``results.curve``).
+
+    ``bands`` lists grades best first: ``{"grade", "min_z"}`` for z-score
+    bands (the lowest band has ``min_z`` null) or ``{"grade", "percent"}``
+    for percentile quotas summing to 100.
+    """
+
+    METHOD_CHOICES = [
+        ("zscore", "Z-score bands"),
+        ("quota", "Percentile quotas"),
+    ]
+
+    section = models.OneToOneField(
+        "academics.Section", on_delete=models.CASCADE, related_name="curve_policy"
+    )
+    method = models.CharField(max_length=16, choices=METHOD_CHOICES)
+    bands = models.JSONField(default=list)
+    updated_at = models.DateTimeField(auto_now=True)
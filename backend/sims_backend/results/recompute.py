@@ -0,0 +1,88 @@
+"""
+Debounced recompute of draft results.
+
+Score and assessment writes call :func:`mark_dirty`, which records the
+affected (student, section) pairs in :class:`~.models.DirtyResult` and, once
+the transaction commits, schedules a single delayed job per section. Further
+edits to the same section while that job is pending only add rows, so a
+burst of edits collapses into one recompute of exactly the students touched.
+"""
+
+import logging
+from datetime import timedelta
+
+import django_rq
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from .models import DirtyResult
+
+logger = logging.getLogger(__name__)
+
+
+def pending_key(section_id: int) -> str:
+    """Cache key held while a recompute job for ``section_id`` is scheduled."""
+    return f"results:recompute:{section_id}"
+
+
+def mark_dirty(section_id: int, student_ids) -> None:
+    """Mark ``student_ids`` in ``section_id`` for recompute."""
+    now = timezone.now()
+    rows = [
+        DirtyResult(student_id=student_id, section_id=section_id, marked_at=now)
+        for student_id in set(student_ids)
+    ]
+    if not rows:
+        return
+    DirtyResult.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=["student_id", "section_id"],
+        update_fields=["marked_at"],
+    )
+    transaction.on_commit(lambda: schedule_recompute(section_id))
+
+
+def mark_section_dirty(section_id: int) -> None:
+    """Mark every student enrolled in ``section_id`` for recompute."""
+    from sims_backend.enrollment.models import Enrollment
+
+    mark_dirty(
+        section_id,
+        Enrollment.objects.filter(section_id=section_id, status="enrolled").values_list(
+            "student_id", flat=True
+        ),
+    )
+
+
+def schedule_recompute(section_id: int) -> None:
+    """
+    Schedule :func:`~.jobs.process_dirty_results` for ``section_id`` unless
+    one is already pending.
+
+    The job runs ``RESULT_RECOMPUTE_DELAY`` seconds later, so edits made in
+    the meantime are picked up by the same run.
+    """
+    from .jobs import process_dirty_results
+
+    delay = settings.RESULT_RECOMPUTE_DELAY
+    # The key outlives the delay so a slow worker does not cause a second
+    # job; the job clears it when it starts.
+    try:
+        if not cache.add(pending_key(section_id), 1, timeout=delay * 2 + 60):
+            return
+    except Exception:
+        # This runs after the scores have committed; the dirty rows wait for
+        # the next edit or a manual run.
+        logger.exception("Failed to schedule result recompute for %s", section_id)
+        return
+    try:
+        django_rq.get_queue("default").enqueue_in(
+            timedelta(seconds=delay), process_dirty_results, section_id
+        )
+    except Exception:
+        # Dirty rows are kept, so the next edit or a manual run picks them up.
+        cache.delete(pending_key(section_id))
+        logger.exception("Failed to schedule result recompute for %s", section_id)
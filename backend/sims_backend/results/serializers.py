@@ -1,9 +1,27 @@
+from django.db import transaction
 from rest_framework import serializers
 
-from .models import PendingChange, Result
+from core.mixins import ExpandableFieldsMixin
+from sims_backend.academics.serializers import (
+    SECTION_SUMMARY_FIELDS,
+    SectionSerializer,
+)
+from sims_backend.admissions.serializers import StudentSerializer
 
+from . import grading
+from .curve import CurveError, compile_curve
+from .models import (
+    CurvePolicy,
+    GradeBoundary,
+    GradingScale,
+    PendingChange,
+    Result,
+    StudentCGPA,
+    TermGPA,
+)
 
-class ResultSerializer(serializers.ModelSerializer):
+
+class ResultSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Result
         fields = [
@@ -18,6 +36,13 @@ class ResultSerializer(serializers.ModelSerializer):
             "frozen_at",
             "frozen_by",
         ]
+        expandable_fields = {
+            "student_detail": (StudentSerializer, {"source": "student"}),
+            "section_detail": (
+                SectionSerializer,
+                {"source": "section", "fields": SECTION_SUMMARY_FIELDS},
+            ),
+        }
         read_only_fields = [
             "state",
             "is_published",
@@ -28,7 +53,7 @@ class ResultSerializer(serializers.ModelSerializer):
         ]
 
 
-class PendingChangeSerializer(serializers.ModelSerializer):
+class PendingChangeSerializer(ExpandableFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = PendingChange
         fields = [
@@ -43,3 +68,109 @@ class PendingChangeSerializer(serializers.ModelSerializer):
             "resolved_at",
         ]
         read_only_fields = ["requested_at", "resolved_at", "status"]
+        expandable_fields = {
+            "result_detail": (ResultSerializer, {"source": "result"}),
+        }
+
+
+class GradeBoundarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = GradeBoundary
+        fields = ["grade", "min_percentage", "grade_points"]
+
+    def validate_min_percentage(self, value):
+        if not 0 <= value <= 100:
+            raise serializers.ValidationError("Must be between 0 and 100.")
+        return value
+
+
+class GradingScaleSerializer(serializers.ModelSerializer):
+    boundaries = GradeBoundarySerializer(many=True)
+
+    class Meta:
+        model = GradingScale
+        fields = ["id", "name", "program", "term", "boundaries", "updated_at"]
+        read_only_fields = ["updated_at"]
+
+    def validate_boundaries(self, value):
+        grades = [boundary["grade"] for boundary in value]
+        bounds = [boundary["min_percentage"] for boundary in value]
+        if not value:
+            raise serializers.ValidationError("At least one boundary is required.")
+        if len(set(grades)) != len(grades):
+            raise serializers.ValidationError("Grades must be unique.")
+        if len(set(bounds)) != len(bounds):
+            raise serializers.ValidationError("min_percentage values must be unique.")
+        if min(bounds) != 0:
+            raise serializers.ValidationError(
+                "The lowest boundary must start at 0 so every percentage is graded."
+            )
+        return value
+
+    def validate(self, attrs):
+        program = attrs.get("program", getattr(self.instance, "program", None))
+        term = attrs.get("term", getattr(self.instance, "term", ""))
+        clash = GradingScale.objects.filter(program=program, term=term)
+        if self.instance is not None:
+            clash = clash.exclude(pk=self.instance.pk)
+        if clash.exists():
+            raise serializers.ValidationError(
+                "A grading scale for this program and term already exists."
+            )
+        return attrs
+
+    @transaction.atomic
+    def create(self, validated_data):
+        boundaries = validated_data.pop("boundaries")
+        scale = GradingScale.objects.create(**validated_data)
+        self._save_boundaries(scale, boundaries)
+        return scale
+
+    @transaction.atomic
+    def update(self, instance, validated_data):
+        boundaries = validated_data.pop("boundaries", None)
+        instance = super().update(instance, validated_data)
+        if boundaries is not None:
+            instance.boundaries.all().delete()
+            self._save_boundaries(instance, boundaries)
+        return instance
+
+    @staticmethod
+    def _save_boundaries(scale, boundaries):
+        GradeBoundary.objects.bulk_create(
+            GradeBoundary(scale=scale, **boundary) for boundary in boundaries
+        )
+        # bulk_create sends no signals, so drop the compiled scales here.
+        grading.invalidate()
+
+
+class TermGPASerializer(serializers.ModelSerializer):
+    reg_no = serializers.CharField(source="student.reg_no", read_only=True)
+
+    class Meta:
+        model = TermGPA
+        fields = ["id", "student", "reg_no", "term", "credits", "gpa", "updated_at"]
+
+
+class StudentCGPASerializer(serializers.ModelSerializer):
+    reg_no = serializers.CharField(source="student.reg_no", read_only=True)
+
+    class Meta:
+        model = StudentCGPA
+        fields = ["id", "student", "reg_no", "credits", "cgpa", "updated_at"]
+
+
+class CurvePolicySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = CurvePolicy
+        fields = ["id", "section", "method", "bands", "updated_at"]
+        read_only_fields = ["updated_at"]
+
+    def validate(self, attrs):
+        method = attrs.get("method", getattr(self.instance, "method", None))
+        bands = attrs.get("bands", getattr(self.instance, "bands", None))
+        try:
+            compile_curve(method, bands)
+        except CurveError as exc:
+            raise serializers.ValidationError({"bands": str(exc)}) from None
+        return attrs
@@ -0,0 +1,45 @@
+"""Mark results dirty when their scores change and track grading scale edits."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from sims_backend.assessments.models import Assessment, AssessmentScore
+
+from . import grading
+from .models import CurvePolicy, GradeBoundary, GradingScale
+from .recompute import mark_dirty, mark_section_dirty
+
+
+@receiver(post_save, sender=AssessmentScore)
+@receiver(post_delete, sender=AssessmentScore)
+def score_changed(sender, instance, **kwargs):
+    """Recompute the student's result in the assessment's section."""
+    section_id = (
+        Assessment.objects.filter(pk=instance.assessment_id)
+        .values_list("section_id", flat=True)
+        .first()
+    )
+    if section_id is not None:
+        mark_dirty(section_id, [instance.student_id])
+
+
+@receiver(post_save, sender=Assessment)
+@receiver(post_delete, sender=Assessment)
+def assessment_changed(sender, instance, **kwargs):
+    """A weight change or removed assessment affects the whole section."""
+    mark_section_dirty(instance.section_id)
+
+
+@receiver(post_save, sender=GradingScale)
+@receiver(post_delete, sender=GradingScale)
+@receiver(post_save, sender=GradeBoundary)
+@receiver(post_delete, sender=GradeBoundary)
+def scale_changed(sender, **kwargs):
+    grading.invalidate()
+
+
+@receiver(post_save, sender=CurvePolicy)
+@receiver(post_delete, sender=CurvePolicy)
+def curve_changed(sender, instance, **kwargs):
+    """Regrade the section's drafts with (or without) the curve."""
+    mark_section_dirty(instance.section_id)
@@ -0,0 +1,116 @@
+"""
+Materialized GPA and CGPA standings.
+
+GPA is the credit-weighted mean of grade points over a student's published
+and frozen results. :func:`refresh_standings` recomputes the per-term
+:class:`~.models.TermGPA` rows and the cumulative
+:class:`~.models.StudentCGPA` row of the given students in a fixed number of
+queries, so it is called for just the affected student whenever a result is
+published, frozen or changed, and in chunks by ``rebuild_standings``.
+"""
+
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models import Q
+
+from .grading import CompiledScale, get_scale
+from .models import Result, StudentCGPA, TermGPA
+
+COUNTED = Q(state__in=["published", "frozen"]) | Q(is_published=True)
+
+
+def _gpa(quality_points: float, credits: int) -> float:
+    return round(quality_points / credits, 2) if credits else 0.0
+
+
+@transaction.atomic
+def refresh_standings(student_ids) -> int:
+    """
+    Recompute term GPAs and CGPA of ``student_ids`` from their results.
+
+    Results whose grade has no grade points (and courses without credits)
+    are left out. Students without counted results lose their standings.
+
+    Returns:
+        Number of term GPA rows written
+    """
+    student_ids = list(set(student_ids))
+    if not student_ids:
+        return 0
+
+    rows = (
+        Result.objects.filter(COUNTED, student_id__in=student_ids)
+        .order_by()
+        .values_list(
+            "student_id",
+            "section__term",
+            "section__course__program_id",
+            "section__course__credits",
+            "final_grade",
+        )
+    )
+    # Each scope's scale is resolved once, not once per result.
+    scales: dict[tuple[int | None, str], CompiledScale] = {}
+    # (student_id, term) -> [credits, quality points]
+    terms: dict[tuple[int, str], list] = {}
+    for student_id, term, program_id, credits, grade in rows:
+        scale = scales.get((program_id, term))
+        if scale is None:
+            scale = scales[program_id, term] = get_scale(program_id, term)
+        points = scale.grade_points(grade)
+        if points is None or not credits:
+            continue
+        totals = terms.setdefault((student_id, term), [0, 0.0])
+        totals[0] += credits
+        totals[1] += credits * points
+
+    term_gpas = [
+        TermGPA(
+            student_id=student_id,
+            term=term,
+            credits=credits,
+            quality_points=quality_points,
+            gpa=_gpa(quality_points, credits),
+        )
+        for (student_id, term), (credits, quality_points) in terms.items()
+    ]
+    TermGPA.objects.bulk_create(
+        term_gpas,
+        update_conflicts=True,
+        unique_fields=["student", "term"],
+        update_fields=["credits", "quality_points", "gpa", "updated_at"],
+    )
+    stale = [
+        pk
+        for pk, student_id, term in TermGPA.objects.filter(
+            student_id__in=student_ids
+        ).values_list("pk", "student_id", "term")
+        if (student_id, term) not in terms
+    ]
+    if stale:
+        TermGPA.objects.filter(pk__in=stale).delete()
+
+    cumulative: dict[int, list] = {}
+    for (student_id, _), (credits, quality_points) in terms.items():
+        totals = cumulative.setdefault(student_id, [0, 0.0])
+        totals[0] += credits
+        totals[1] += quality_points
+    StudentCGPA.objects.bulk_create(
+        [
+            StudentCGPA(
+                student_id=student_id,
+                credits=credits,
+                quality_points=quality_points,
+                cgpa=_gpa(quality_points, credits),
+            )
+            for student_id, (credits, quality_points) in cumulative.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["student"],
+        update_fields=["credits", "quality_points", "cgpa", "updated_at"],
+    )
+    StudentCGPA.objects.filter(student_id__in=student_ids).exclude(
+        student_id__in=list(cumulative)
+    ).delete()
+    return len(term_gpas)
@@ -1,9 +1,20 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import PendingChangeViewSet, ResultViewSet
+from .views import (
+    CurvePolicyViewSet,
+    GradingScaleViewSet,
+    PendingChangeViewSet,
+    ResultViewSet,
+    StudentCGPAViewSet,
+    TermGPAViewSet,
+)
 
 router = DefaultRouter()
 router.register(r"results", ResultViewSet, basename="result")
 router.register(r"pending-changes", PendingChangeViewSet, basename="pending-change")
+router.register(r"curve-policies", CurvePolicyViewSet, basename="curve-policy")
+router.register(r"grading-scales", GradingScaleViewSet, basename="grading-scale")
+router.register(r"standings/terms", TermGPAViewSet, basename="term-gpa")
+router.register(r"standings/cgpa", StudentCGPAViewSet, basename="student-cgpa")
 urlpatterns = [path("api/", include(router.urls))]
@@ -1,32 +1,22 @@
 """Utility functions for results and grading"""
 
+from django.utils import timezone
 
-def calculate_grade(percentage: float) -> str:
+from .grading import CompiledScale, get_scale, scale_for_section
+
+
+def calculate_grade(percentage: float, scale: CompiledScale | None = None) -> str:
     """
     Calculate letter grade based on percentage.
 
     Args:
         percentage: Score percentage (0-100)
+        scale: Grading scale to use (default: the institution-wide scale)
 
     Returns:
-        Letter grade (A+, A, B+, B, C+, C, D, F)
+        Letter grade from the scale (A+, A, B+, B, C+, C, D, F by default)
     """
-    if percentage >= 90:
-        return "A+"
-    elif percentage >= 85:
-        return "A"
-    elif percentage >= 80:
-        return "B+"
-    elif percentage >= 75:
-        return "B"
-    elif percentage >= 70:
-        return "C+"
-    elif percentage >= 65:
-        return "C"
-    elif percentage >= 60:
-        return "D"
-    else:
-        return "F"
+    return (scale or get_scale()).grade(percentage)
 
 
 def calculate_final_grade(student_id: int, section_id: int) -> dict:
@@ -92,7 +82,142 @@ def calculate_final_grade(student_id: int, section_id: int) -> dict:
 
     return {
         "percentage": round(final_percentage, 2),
-        "grade": calculate_grade(final_percentage),
+        "grade": calculate_grade(final_percentage, scale_for_section(section_id)),
         "components": components,
         "total_weight_assessed": total_weight,
     }
+
+
+def calculate_section_percentages(
+    section_id: int, student_ids=None
+) -> dict[int, float]:
+    """
+    Calculate weighted percentages for many students of a section at once.
+
+    Uses the same weighting as :func:`calculate_final_grade` but reads the
+    section's assessments and scores in two queries instead of one query per
+    assessment and student.
+
+    Args:
+        section_id: Section ID
+        student_ids: Students to include (default: everyone with a score)
+
+    Returns:
+        Dict mapping student ID to percentage, unrounded so that grades match
+        :func:`calculate_final_grade`; round only for display
+    """
+    from sims_backend.assessments.models import Assessment, AssessmentScore
+
+    weights = dict(
+        Assessment.objects.filter(section_id=section_id).values_list("id", "weight")
+    )
+    if not weights:
+        return {}
+    scores = AssessmentScore.objects.filter(assessment_id__in=list(weights))
+    if student_ids is not None:
+        scores = scores.filter(student_id__in=list(student_ids))
+
+    totals = dict.fromkeys(student_ids or (), 0.0)
+    for student_id, assessment_id, score, max_score in scores.values_list(
+        "student_id", "assessment_id", "score", "max_score"
+    ):
+        percentage = (score / max_score) * 100 if max_score > 0 else 0
+        totals[student_id] = (
+            totals.get(student_id, 0.0) + (percentage * weights[assessment_id]) / 100
+        )
+    return totals
+
+
+def recompute_results(section_id: int, student_ids=None) -> dict[str, int]:
+    """
+    Recompute ``final_grade`` of draft results from assessment scores.
+
+    Missing results are created as drafts; published and frozen results are
+    left untouched. Sections with a curve policy are regraded as a whole by
+    :func:`~.curve.apply_curve`, since every total shifts the curve.
+
+    Args:
+        section_id: Section ID
+        student_ids: Students to recompute (default: enrolled students);
+            students not enrolled in the section are ignored
+
+    Returns:
+        Dict with counts of created, updated and skipped results
+    """
+    from .curve import apply_curve
+    from .models import CurvePolicy
+
+    policy = CurvePolicy.objects.filter(section_id=section_id).first()
+    if policy is not None:
+        preview = apply_curve(section_id, policy.method, policy.bands)
+        counts: dict[str, int] = preview["counts"]
+        return counts
+    return recompute_uncurved_results(section_id, student_ids)
+
+
+def recompute_uncurved_results(section_id: int, student_ids=None) -> dict[str, int]:
+    """
+    Recompute draft results of ``student_ids`` on the section's grading scale.
+
+    Like :func:`recompute_results` but ignores any curve policy, so callers
+    that already know the section is not curved can recompute it in batches.
+
+    Returns:
+        Dict with counts of created, updated and skipped results
+    """
+    from sims_backend.enrollment.models import Enrollment
+
+    enrolled = Enrollment.objects.filter(section_id=section_id, status="enrolled")
+    if student_ids is not None:
+        enrolled = enrolled.filter(student_id__in=list(student_ids))
+    student_ids = set(enrolled.values_list("student_id", flat=True))
+
+    percentages = calculate_section_percentages(section_id, student_ids)
+    grades = dict(
+        zip(
+            percentages,
+            scale_for_section(section_id).grade_many(percentages.values()),
+            strict=True,
+        )
+    )
+    return write_draft_grades(section_id, grades)
+
+
+def write_draft_grades(section_id: int, grades: dict[int, str]) -> dict[str, int]:
+    """
+    Store ``grades`` (student ID to letter grade) as draft results.
+
+    Missing results are created; published and frozen results are skipped.
+
+    Returns:
+        Dict with counts of created, updated and skipped results
+    """
+    from .models import Result
+
+    existing = {
+        result.student_id: result
+        for result in Result.objects.filter(
+            section_id=section_id, student_id__in=list(grades)
+        )
+    }
+
+    to_create, to_update, skipped = [], [], 0
+    for student_id, grade in grades.items():
+        result = existing.get(student_id)
+        if result is None:
+            to_create.append(
+                Result(student_id=student_id, section_id=section_id, final_grade=grade)
+            )
+        elif result.state != "draft" or result.is_published:
+            skipped += 1
+        elif result.final_grade != grade:
+            result.final_grade = grade
+            to_update.append(result)
+
+    # bulk_update bypasses auto_now, so stamp updated_at explicitly.
+    now = timezone.now()
+    for result in to_update:
+        result.updated_at = now
+    Result.objects.bulk_create(to_create)
+    Result.objects.bulk_update(to_update, ["final_grade", "updated_at"])
+    return {"created": len(to_create), "updated": len(to_update), "skipped": skipped}
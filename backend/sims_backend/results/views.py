@@ -1,17 +1,56 @@
+from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from sims_backend.common_permissions import IsAdminOrRegistrarReadOnlyFacultyStudent
-
-from .models import PendingChange, Result
-from .serializers import PendingChangeSerializer, ResultSerializer
-
-
-class ResultViewSet(viewsets.ModelViewSet):
+from core.idempotency import idempotent
+from core.mixins import (
+    ChangesFeedMixin,
+    ConditionalGetMixin,
+    ExpandableQuerysetMixin,
+    ReplicaReadMixin,
+)
+from sims_backend.academics.models import Section
+from sims_backend.common_permissions import (
+    IsAdminOrRegistrarReadOnlyFacultyStudent,
+    can_grade_section,
+    in_group,
+)
+
+from .analytics import distribution_report, invalidate_section
+from .changes import MAX_BATCH_SIZE, resolve_changes
+from .curve import CurveError, apply_curve
+from .models import (
+    CurvePolicy,
+    GradingScale,
+    PendingChange,
+    Result,
+    StudentCGPA,
+    TermGPA,
+)
+from .serializers import (
+    CurvePolicySerializer,
+    GradingScaleSerializer,
+    PendingChangeSerializer,
+    ResultSerializer,
+    StudentCGPASerializer,
+    TermGPASerializer,
+)
+from .standings import refresh_standings
+
+
+class ResultViewSet(
+    ReplicaReadMixin,
+    ChangesFeedMixin,
+    ConditionalGetMixin,
+    ExpandableQuerysetMixin,
+    viewsets.ModelViewSet,
+):
     queryset = Result.objects.all()
     serializer_class = ResultSerializer
     permission_classes = [IsAuthenticated, IsAdminOrRegistrarReadOnlyFacultyStudent]
@@ -52,7 +91,120 @@ class ResultViewSet(viewsets.ModelViewSet):
             )
         return super().partial_update(request, *args, **kwargs)
 
+    @action(detail=False)
+    def analytics(self, request):
+        """
+        Grade distribution of a section, or of every section of a course
+        and/or term: ``?section=ID``, ``?course=ID``, ``?term=Fall2024``.
+        """
+        user = request.user
+        if not (
+            user.is_superuser
+            or any(
+                in_group(user, role)
+                for role in ("Admin", "Registrar", "ExamCell", "Faculty")
+            )
+        ):
+            return Response(
+                {"error": {"code": 403, "message": "Permission denied"}},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        filters = {}
+        params = request.query_params
+        try:
+            if params.get("section"):
+                filters["id"] = int(params["section"])
+            if params.get("course"):
+                filters["course_id"] = int(params["course"])
+        except ValueError:
+            return Response(
+                {"error": {"code": 400, "message": "section and course must be IDs"}},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if params.get("term"):
+            filters["term"] = params["term"]
+        if not filters:
+            return Response(
+                {
+                    "error": {
+                        "code": 400,
+                        "message": "One of section, course or term is required",
+                    }
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        sections = (
+            Section.objects.filter(**filters)
+            .order_by("term", "course__code", "id")
+            .values_list("id", "course__code", "term")
+        )
+        return Response(distribution_report(sections))
+
+    @action(detail=False, methods=["post"], permission_classes=[IsAuthenticated])
+    def curve(self, request):
+        """
+        Grade a section on a curve, or preview it.
+
+        Body: ``section``, ``dry_run`` (default true) and optionally
+        ``method`` and ``bands`` to try a curve other than the section's
+        saved policy. Applying them saves them as the section's policy so
+        later recomputes keep the curve.
+        """
+        section_id = request.data.get("section")
+        try:
+            section = Section.objects.get(id=section_id)
+        except (Section.DoesNotExist, ValueError, TypeError):
+            return Response(
+                {"error": {"code": 404, "message": "Section not found"}},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        if not can_grade_section(request.user, section):
+            return Response(
+                {"error": {"code": 403, "message": "Permission denied"}},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        method = request.data.get("method")
+        bands = request.data.get("bands")
+        adhoc = method is not None or bands is not None
+        if not adhoc:
+            policy = CurvePolicy.objects.filter(section=section).first()
+            if policy is None:
+                return Response(
+                    {
+                        "error": {
+                            "code": 400,
+                            "message": "Section has no curve policy; send method and bands",
+                        }
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            method, bands = policy.method, policy.bands
+
+        dry_run = str(request.data.get("dry_run", "true")).lower() not in (
+            "0",
+            "false",
+        )
+        try:
+            with transaction.atomic():
+                preview = apply_curve(section.id, method, bands, dry_run=dry_run)
+                if adhoc and not dry_run:
+                    CurvePolicy.objects.update_or_create(
+                        section=section, defaults={"method": method, "bands": bands}
+                    )
+        except CurveError as exc:
+            return Response(
+                {"error": {"code": 400, "message": str(exc)}},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if not dry_run:
+            invalidate_section(section.id)
+        return Response(preview)
+
     @action(detail=False, methods=["post"])
+    @idempotent
     def publish(self, request):
         """Publish a result (transition from draft to published)"""
         result_id = request.data.get("result_id")
@@ -90,6 +242,8 @@ class ResultViewSet(viewsets.ModelViewSet):
         result.published_at = timezone.now()
         result.published_by = published_by
         result.save()
+        refresh_standings([result.student_id])
+        invalidate_section(result.section_id)
 
         serializer = self.get_serializer(result)
         return Response(serializer.data)
@@ -136,11 +290,14 @@ class ResultViewSet(viewsets.ModelViewSet):
         result.frozen_at = timezone.now()
         result.frozen_by = frozen_by
         result.save()
+        refresh_standings([result.student_id])
+        invalidate_section(result.section_id)
 
         serializer = self.get_serializer(result)
         return Response(serializer.data)
 
     @action(detail=False, methods=["post"], url_path="change-request")
+    @idempotent
     def change_request(self, request):
         """Create a change request for a published result"""
         result_id = request.data.get("result_id")
@@ -188,6 +345,53 @@ class ResultViewSet(viewsets.ModelViewSet):
         serializer = PendingChangeSerializer(pending_change)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
+    @action(detail=False, methods=["post"], url_path="approve-changes")
+    def approve_changes(self, request):
+        """
+        Approve or reject many change requests in one transaction.
+
+        Body: ``{"changes": [{"change_id": 1, "approved": true}, ...],
+        "approved_by": "..."}``. Returns one outcome per item.
+        """
+        items = request.data.get("changes")
+        approved_by = request.data.get("approved_by", "")
+        if not isinstance(items, list) or not items:
+            return Response(
+                {"error": {"code": 400, "message": "changes must be a non-empty list"}},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(items) > MAX_BATCH_SIZE:
+            return Response(
+                {
+                    "error": {
+                        "code": 400,
+                        "message": f"At most {MAX_BATCH_SIZE} changes per request",
+                    }
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            decisions = [
+                (int(item["change_id"]), item.get("approved") in (True, "true", "1"))
+                for item in items
+            ]
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return Response(
+                {
+                    "error": {
+                        "code": 400,
+                        "message": "Each change needs an integer change_id",
+                    }
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        outcomes = resolve_changes(decisions, approved_by)
+        summary = {}
+        for outcome in outcomes:
+            summary[outcome["status"]] = summary.get(outcome["status"], 0) + 1
+        return Response({"summary": summary, "results": outcomes})
+
     @action(detail=False, methods=["post"], url_path="approve-change")
     def approve_change(self, request):
         """Approve or reject a change request"""
@@ -225,6 +429,8 @@ class ResultViewSet(viewsets.ModelViewSet):
             result = pending_change.result
             result.final_grade = pending_change.new_grade
             result.save()
+            refresh_standings([result.student_id])
+            invalidate_section(result.section_id)
 
             pending_change.status = "approved"
             pending_change.approved_by = approved_by
@@ -253,7 +459,7 @@ class ResultViewSet(viewsets.ModelViewSet):
             )
 
 
-class PendingChangeViewSet(viewsets.ReadOnlyModelViewSet):
+class PendingChangeViewSet(ExpandableQuerysetMixin, viewsets.ReadOnlyModelViewSet):
     queryset = PendingChange.objects.all()
     serializer_class = PendingChangeSerializer
     permission_classes = [IsAuthenticated, IsAdminOrRegistrarReadOnlyFacultyStudent]
@@ -261,3 +467,102 @@ class PendingChangeViewSet(viewsets.ReadOnlyModelViewSet):
     search_fields = ["result__student__reg_no", "status"]
     ordering_fields = ["id", "requested_at", "resolved_at"]
     ordering = ["id"]
+
+
+class GradingScaleViewSet(viewsets.ModelViewSet):
+    """Grading scales per program and/or term (Admin/Registrar manage them)."""
+
+    queryset = GradingScale.objects.prefetch_related("boundaries")
+    serializer_class = GradingScaleSerializer
+    permission_classes = [IsAuthenticated, IsAdminOrRegistrarReadOnlyFacultyStudent]
+    filter_backends = [OrderingFilter]
+    ordering_fields = ["id", "name"]
+    ordering = ["id"]
+
+
+class CurvePolicyViewSet(viewsets.ModelViewSet):
+    """Per-section curve policies (Admin/Registrar manage them)."""
+
+    queryset = CurvePolicy.objects.all()
+    serializer_class = CurvePolicySerializer
+    permission_classes = [IsAuthenticated, IsAdminOrRegistrarReadOnlyFacultyStudent]
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_fields = ["section", "method"]
+    ordering = ["id"]
+
+
+class OwnStandingsMixin:
+    """Students only see their own standings."""
+
+    def get_queryset(self):
+        queryset = super().get_queryset().select_related("student")
+        user = self.request.user
+        if in_group(user, "Student") and not (
+            user.is_superuser or in_group(user, "Admin") or in_group(user, "Registrar")
+        ):
+            return queryset.filter(student__reg_no=user.username)
+        return queryset
+
+
+class TermGPAViewSet(
+    ReplicaReadMixin, OwnStandingsMixin, viewsets.ReadOnlyModelViewSet
+):
+    """Per-term GPAs, rankable with ``?term=...&ordering=-gpa``."""
+
+    queryset = TermGPA.objects.all()
+    serializer_class = TermGPASerializer
+    permission_classes = [IsAuthenticated, IsAdminOrRegistrarReadOnlyFacultyStudent]
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_fields = {
+        "term": ["exact"],
+        "student": ["exact"],
+        "gpa": ["gte", "lte"],
+        "credits": ["gte"],
+    }
+    ordering_fields = ["gpa", "credits", "id"]
+    ordering = ["-gpa", "id"]
+
+    @action(detail=False, url_path="deans-list")
+    def deans_list(self, request):
+        """
+        Students of a term with at least ``DEANS_LIST_MIN_GPA`` over at least
+        ``DEANS_LIST_MIN_CREDITS`` credits, best GPA first.
+        """
+        term = request.query_params.get("term")
+        if not term:
+            return Response(
+                {"error": {"code": 400, "message": "term is required"}},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        queryset = (
+            self.get_queryset()
+            .filter(
+                term=term,
+                gpa__gte=settings.DEANS_LIST_MIN_GPA,
+                credits__gte=settings.DEANS_LIST_MIN_CREDITS,
+            )
+            .order_by("-gpa", "student__reg_no")
+        )
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
+        return Response(self.get_serializer(queryset, many=True).data)
+
+
+class StudentCGPAViewSet(
+    ReplicaReadMixin, OwnStandingsMixin, viewsets.ReadOnlyModelViewSet
+):
+    """Cumulative GPAs, rankable with ``?ordering=-cgpa``."""
+
+    queryset = StudentCGPA.objects.all()
+    serializer_class = StudentCGPASerializer
+    permission_classes = [IsAuthenticated, IsAdminOrRegistrarReadOnlyFacultyStudent]
+    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filterset_fields = {
+        "student": ["exact"],
+        "student__program": ["exact"],
+        "cgpa": ["gte", "lte"],
+        "credits": ["gte"],
+    }
+    ordering_fields = ["cgpa", "credits", "id"]
+    ordering = ["-cgpa", "id"]
@@ -14,6 +14,11 @@ import os
 from datetime import timedelta
 from pathlib import Path
 
+from corsheaders.defaults import default_headers
+from django.core.exceptions import ImproperlyConfigured
+
+from core.db import database_settings, replica_databases
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -83,9 +88,15 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "sims_backend.audit.middleware.WriteAuditMiddleware",
+    "core.replicas.ReplicaPinMiddleware",
     "simple_history.middleware.HistoryRequestMiddleware",
 ]
 
+# WhiteNoise is synchronous and would force every request under ASGI through
+# a thread; the ASGI profile sets SERVE_STATIC=False and lets nginx serve them.
+if os.getenv("SERVE_STATIC", "True").lower() != "true":
+    MIDDLEWARE.remove("whitenoise.middleware.WhiteNoiseMiddleware")
+
 ROOT_URLCONF = "sims_backend.urls"
 
 TEMPLATES = [
@@ -110,16 +121,16 @@ WSGI_APPLICATION = "sims_backend.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
-DATABASES = {
-    "default": {
-        "ENGINE": os.getenv("DB_ENGINE", "django.db.backends.postgresql"),
-        "NAME": os.getenv("DB_NAME", "sims_db"),
-        "USER": os.getenv("DB_USER", "sims_user"),
-        "PASSWORD": os.getenv("DB_PASSWORD", "sims_password"),
-        "HOST": os.getenv("DB_HOST", "localhost"),
-        "PORT": os.getenv("DB_PORT", "5432"),
-    }
-}
+# Connection reuse and pooling are selected by DB_POOL_MODE; see core.db.
+DATABASES = {"default": database_settings()}
+# Read replicas from DB_REPLICA_HOSTS; core.replicas decides which reads use them.
+DATABASES.update(replica_databases(DATABASES["default"]))
+DATABASE_ROUTERS = ["core.replicas.ReplicaRouter"]
+
+# Seconds a client reads from the primary after a write, and seconds an
+# unreachable replica is skipped before it is tried again.
+DB_REPLICA_PIN_SECONDS = int(os.getenv("DB_REPLICA_PIN_SECONDS", "10"))
+DB_REPLICA_RETRY_SECONDS = int(os.getenv("DB_REPLICA_RETRY_SECONDS", "30"))
 
 
 # Password validation
@@ -185,6 +196,24 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
+# JSON encoding: "stdlib" (DRF's json-based classes) or "orjson" (faster,
+# same output; needs the orjson package, else falls back to stdlib).
+API_JSON_BACKEND = os.getenv("API_JSON_BACKEND", "stdlib").lower()
+if API_JSON_BACKEND == "orjson":
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = (
+        "core.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    )
+    REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"] = (
+        "core.renderers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    )
+elif API_JSON_BACKEND != "stdlib":
+    raise ImproperlyConfigured(
+        f"API_JSON_BACKEND must be 'stdlib' or 'orjson', not {API_JSON_BACKEND!r}"
+    )
+
 # JWT Settings
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(
@@ -216,6 +245,8 @@ CORS_ALLOWED_ORIGINS = [
 ]
 
 CORS_ALLOW_CREDENTIALS = True
+CORS_ALLOW_HEADERS = (*default_headers, "idempotency-key")
+CORS_EXPOSE_HEADERS = ["Idempotent-Replayed"]
 
 # CSRF Settings
 CSRF_TRUSTED_ORIGINS = [
@@ -236,6 +267,51 @@ RQ_QUEUES = {
     },
 }
 
+# The default worker keeps its database connection between jobs; set
+# RQ_WORKER_CLASS=rq.Worker to fork a fresh process per job instead.
+RQ = {"WORKER_CLASS": os.getenv("RQ_WORKER_CLASS", "core.workers.DatabaseWorker")}
+
+# Cache Settings (reuses the Redis instance above, on a separate database)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": "redis://{}:{}/{}".format(
+            os.getenv("REDIS_HOST", "localhost"),
+            os.getenv("REDIS_PORT", "6379"),
+            os.getenv("REDIS_CACHE_DB", "1"),
+        ),
+        "KEY_PREFIX": "sims",
+    },
+}
+
+# Seconds a cached programs/courses/terms response may live; writes
+# invalidate entries immediately through versioned keys.
+REFERENCE_CACHE_TIMEOUT = int(os.getenv("REFERENCE_CACHE_TIMEOUT", "300"))
+
+# Score edits mark results dirty; a job recomputes them this many seconds
+# after the first edit, in batches of RESULT_RECOMPUTE_BATCH_SIZE students.
+RESULT_RECOMPUTE_DELAY = int(os.getenv("RESULT_RECOMPUTE_DELAY", "30"))
+RESULT_RECOMPUTE_BATCH_SIZE = int(os.getenv("RESULT_RECOMPUTE_BATCH_SIZE", "500"))
+
+# Dean's list thresholds for a term GPA.
+DEANS_LIST_MIN_GPA = float(os.getenv("DEANS_LIST_MIN_GPA", "3.5"))
+DEANS_LIST_MIN_CREDITS = int(os.getenv("DEANS_LIST_MIN_CREDITS", "12"))
+
+# Seconds a section's cached grade distribution may live; publishing and
+# recomputing the section's results drop it immediately.
+ANALYTICS_CACHE_TIMEOUT = int(os.getenv("ANALYTICS_CACHE_TIMEOUT", "3600"))
+
+# Idempotency-Key support (core.idempotency): seconds a response is replayed,
+# seconds a duplicate waits for the in-flight original, and seconds before
+# the claim of a request that never finished expires.
+IDEMPOTENCY_KEY_TTL = int(os.getenv("IDEMPOTENCY_KEY_TTL", "86400"))
+IDEMPOTENCY_WAIT_SECONDS = float(os.getenv("IDEMPOTENCY_WAIT_SECONDS", "10"))
+IDEMPOTENCY_LOCK_SECONDS = int(os.getenv("IDEMPOTENCY_LOCK_SECONDS", "60"))
+
+# Seconds a stored transcript render is reused while the results are
+# unchanged; keep it below the 48 hour lifetime of its QR token.
+TRANSCRIPT_RENDER_TTL = int(os.getenv("TRANSCRIPT_RENDER_TTL", "86400"))
+
 # Email Settings
 EMAIL_BACKEND = os.getenv(
     "EMAIL_BACKEND", "django.core.mail.backends.console.EmailBackend"
@@ -1,5 +1,7 @@
 """Test settings - use SQLite in-memory database for tests."""
 
+import tempfile
+
 from sims_backend import settings as base_settings
 
 # Import all uppercase settings from the base module without using wildcard imports
@@ -15,6 +17,16 @@ DATABASES = {
     }
 }
 
+# Local in-process cache instead of Redis
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# Stored files (transcript renders, import reports) stay out of the tree
+MEDIA_ROOT = tempfile.mkdtemp(prefix="sims-test-media-")
+
 # Faster password hashing for tests
 PASSWORD_HASHERS = [
     "django.contrib.auth.hashers.MD5PasswordHasher",
@@ -5,13 +5,15 @@ from typing import Any
 
 from django.core.mail import send_mail
 
+from core.replicas import replica_reads
 from sims_backend.admissions.models import Student
 
-from .views import generate_transcript_pdf
+from .views import render_transcript
 
 logger = logging.getLogger(__name__)
 
 
+@replica_reads
 def generate_and_email_transcript(
     student_id: int, recipient_email: str | None = None
 ) -> dict[str, Any]:
@@ -30,13 +32,10 @@ def generate_and_email_transcript(
         student = Student.objects.get(id=student_id)
         logger.info(f"Starting transcript generation for student {student.reg_no}")
 
-        # Generate PDF
-        generate_transcript_pdf(student)
+        # Render PDF and store it for later downloads and requests
+        render_transcript(student)
         logger.info(f"PDF generated successfully for student {student.reg_no}")
 
-        # Save to media (if needed for future reference)
-        # For now, just generate - in production you might want to save this
-
         # Send email if recipient provided
         if recipient_email:
             try:
@@ -75,6 +74,7 @@ def generate_and_email_transcript(
         return {"status": "error", "message": f"Transcript generation failed: {str(e)}"}
 
 
+@replica_reads
 def batch_generate_transcripts(student_ids: list[int]) -> dict[str, Any]:
     """
     Background job to generate transcripts for multiple students.
@@ -0,0 +1,80 @@
+"""
+Stored transcript renders and transcript job ids.
+
+A transcript only changes when the student or their published results do,
+so every render is stored under the student's *results version* and reused
+until one of them changes or the render is ``TRANSCRIPT_RENDER_TTL`` seconds
+old (the QR token printed on it expires after 48 hours). Background jobs get
+deterministic ids from the same version, so repeated requests attach to the
+job already queued instead of enqueueing another.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db.models import Count, Max
+from django.utils import timezone
+
+from sims_backend.admissions.models import Student
+from sims_backend.results.models import Result
+
+RENDER_DIR = "transcripts"
+
+
+def results_version(student: Student) -> str:
+    """
+    Fingerprint everything printed on the student's transcript.
+
+    Changes when the student, one of their published results or one of those
+    results' sections or courses is edited, or a result is published or
+    removed.
+    """
+    stats = Result.objects.filter(student=student, is_published=True).aggregate(
+        count=Count("id"),
+        results=Max("updated_at"),
+        sections=Max("section__updated_at"),
+        courses=Max("section__course__updated_at"),
+    )
+    raw = (
+        f"{student.updated_at.isoformat()}|{stats['count']}|{stats['results']}|"
+        f"{stats['sections']}|{stats['courses']}"
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+def transcript_job_id(student_id: int, version: str, email: str | None = None) -> str:
+    """RQ job id for rendering (and optionally emailing) one transcript version."""
+    job_id = f"transcript-{student_id}-{version}"
+    if email:
+        job_id += "-" + hashlib.sha256(email.lower().encode()).hexdigest()[:12]
+    return job_id
+
+
+def _render_path(student_id: int, version: str) -> str:
+    return f"{RENDER_DIR}/{student_id}/{version}.pdf"
+
+
+def open_render(student_id: int, version: str):
+    """Open the stored render of this version, or ``None`` if missing or stale."""
+    path = _render_path(student_id, version)
+    if not default_storage.exists(path):
+        return None
+    age = timezone.now() - default_storage.get_modified_time(path)
+    if age > timedelta(seconds=settings.TRANSCRIPT_RENDER_TTL):
+        return None
+    return default_storage.open(path, "rb")
+
+
+def save_render(student_id: int, version: str, pdf: io.BytesIO) -> None:
+    """Store a render, replacing the student's older ones."""
+    directory = f"{RENDER_DIR}/{student_id}"
+    if default_storage.exists(directory):
+        for name in default_storage.listdir(directory)[1]:
+            default_storage.delete(f"{directory}/{name}")
+    default_storage.save(_render_path(student_id, version), ContentFile(pdf.getvalue()))
@@ -1,9 +1,19 @@
 from django.urls import path
 
-from .views import enqueue_transcript_generation, get_transcript, verify_transcript
+from .views import (
+    enqueue_transcript_generation,
+    get_transcript,
+    transcript_job_status,
+    verify_transcript,
+)
 
 urlpatterns = [
     path("api/transcripts/<int:student_id>/", get_transcript, name="get-transcript"),
+    path(
+        "api/transcripts/<int:student_id>/job/",
+        transcript_job_status,
+        name="transcript-job-status",
+    ),
     path(
         "api/transcripts/verify/<str:token>/",
         verify_transcript,
@@ -1,25 +1,40 @@
 import io
+import logging
 
 import django_rq
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
 from django.core.signing import BadSignature, SignatureExpired, TimestampSigner
 from django.http import FileResponse
 from django.utils import timezone
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib.units import inch
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rq.job import JobStatus
 
+from core.async_api import APIJsonResponse, async_api_view, error_response, fetch_job
+from core.idempotency import idempotent
 from sims_backend.admissions.models import Student
 from sims_backend.results.models import Result
 
+from .renders import open_render, results_version, save_render, transcript_job_id
+
+logger = logging.getLogger(__name__)
+
 # Token expires after 48 hours
 TOKEN_MAX_AGE = 48 * 60 * 60
 signer = TimestampSigner()
 
+# Jobs in these states are attached to rather than enqueued again.
+PENDING_JOB_STATUSES = {
+    JobStatus.QUEUED,
+    JobStatus.STARTED,
+    JobStatus.DEFERRED,
+    JobStatus.SCHEDULED,
+}
+# Covers the gap between two requests' job lookup and enqueue.
+ENQUEUE_LOCK_SECONDS = 10
+
 
 def generate_qr_token(student_id: int) -> str:
     """Generate a signed token for QR code"""
@@ -46,6 +61,20 @@ def verify_qr_token(token: str) -> dict:
 
 def generate_transcript_pdf(student: Student) -> io.BytesIO:
     """Generate a PDF transcript for a student"""
+    # reportlab is imported on first render so workers that never render a
+    # PDF do not pay its import time and memory.
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import inch
+    from reportlab.platypus import (
+        Paragraph,
+        SimpleDocTemplate,
+        Spacer,
+        Table,
+        TableStyle,
+    )
+
     buffer = io.BytesIO()
     doc = SimpleDocTemplate(buffer, pagesize=letter)
     story = []
@@ -144,19 +173,28 @@ def generate_transcript_pdf(student: Student) -> io.BytesIO:
     return buffer
 
 
-@api_view(["GET"])
-@permission_classes([IsAuthenticated])
-def get_transcript(request, student_id: int):
+def render_transcript(student: Student) -> io.BytesIO:
+    """Return the student's transcript, reusing the stored render if up to date."""
+    version = results_version(student)
+    stored = open_render(student.id, version)
+    if stored is not None:
+        with stored:
+            return io.BytesIO(stored.read())
+    buffer = generate_transcript_pdf(student)
+    save_render(student.id, version, buffer)
+    return buffer
+
+
+@async_api_view
+async def get_transcript(request, student_id: int):
     """Generate and download transcript for a student"""
     try:
-        student = Student.objects.get(id=student_id)
+        student = await Student.objects.aget(id=student_id)
     except Student.DoesNotExist:
-        return Response(
-            {"error": {"code": 404, "message": "Student not found"}}, status=404
-        )
+        return error_response(404, "Student not found")
 
-    # Generate PDF
-    pdf_buffer = generate_transcript_pdf(student)
+    # Render PDF (storage and reportlab are synchronous)
+    pdf_buffer = await sync_to_async(render_transcript)(student)
 
     # Return PDF as download
     return FileResponse(
@@ -167,20 +205,49 @@ def get_transcript(request, student_id: int):
     )
 
 
-@api_view(["GET"])
-@permission_classes([IsAuthenticated])
-def verify_transcript(request, token: str):
+@async_api_view
+async def verify_transcript(request, token: str):
     """Verify a transcript QR token"""
     result = verify_qr_token(token)
-    return Response(result)
+    return APIJsonResponse(result)
+
+
+@async_api_view
+async def transcript_job_status(request, student_id: int):
+    """
+    Report the job rendering the student's current transcript.
+
+    Finds the job that ``enqueue_transcript_generation`` created (or attached
+    to) for the student's current results, without emailing.
+    """
+    try:
+        student = await Student.objects.aget(id=student_id)
+    except Student.DoesNotExist:
+        return error_response(404, "Student not found")
+
+    version = await sync_to_async(results_version)(student)
+    job_id = transcript_job_id(student.id, version)
+    try:
+        job = await fetch_job(job_id)
+    except Exception:
+        logger.exception("Failed to read job %s", job_id)
+        return error_response(503, "Job status is unavailable")
+    if job is None:
+        return error_response(404, "No transcript job for the current results")
+    return APIJsonResponse(job)
 
 
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
+@idempotent
 def enqueue_transcript_generation(request):
     """
     Enqueue transcript generation as a background job.
 
+    Jobs are deduplicated per student and results version: while one is
+    queued or running, requests get its ``job_id`` back, and without an
+    ``email`` an up-to-date stored render is returned without a job.
+
     Request body:
         {
             "student_id": int,
@@ -197,17 +264,62 @@ def enqueue_transcript_generation(request):
 
     # Check if student exists
     try:
-        Student.objects.get(id=student_id)
+        student = Student.objects.get(id=student_id)
     except Student.DoesNotExist:
         return Response(
             {"error": {"code": 404, "message": "Student not found"}}, status=404
         )
 
-    # Enqueue the job
-    queue = django_rq.get_queue("default")
-    from .jobs import generate_and_email_transcript
+    version = results_version(student)
+    job_id = transcript_job_id(student.id, version, email)
+    if not email:
+        stored = open_render(student.id, version)
+        if stored is not None:
+            stored.close()
+            return Response(
+                {
+                    "message": "Transcript is up to date",
+                    "job_id": job_id,
+                    "student_id": student_id,
+                    "download_url": f"/api/transcripts/{student.id}/",
+                },
+                status=200,
+            )
 
-    job = queue.enqueue(generate_and_email_transcript, student_id, email)
+    pending = {
+        "message": "Transcript generation job already in progress",
+        "job_id": job_id,
+        "student_id": student_id,
+    }
+    lock = f"transcript-enqueue:{job_id}"
+    try:
+        locked = cache.add(lock, True, timeout=ENQUEUE_LOCK_SECONDS)
+    except Exception:
+        logger.exception("Failed to lock transcript job %s", job_id)
+        locked = True
+    # Another request is enqueueing this very job id right now.
+    if not locked:
+        return Response(pending, status=202)
+
+    try:
+        queue = django_rq.get_queue("default")
+        existing = queue.fetch_job(job_id)
+        if existing is not None:
+            if existing.get_status() in PENDING_JOB_STATUSES:
+                return Response(pending, status=202)
+            # Finished or failed: drop it so the id can be enqueued again.
+            existing.delete()
+
+        from .jobs import generate_and_email_transcript
+
+        job = queue.enqueue(
+            generate_and_email_transcript, student.id, email, job_id=job_id
+        )
+    finally:
+        try:
+            cache.delete(lock)
+        except Exception:
+            logger.exception("Failed to unlock transcript job %s", job_id)
 
     return Response(
         {
@@ -1,48 +1,63 @@
-import django_rq
+import asyncio
+
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
 from django.http import JsonResponse
 from django.urls import include, path
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularRedocView,
-    SpectacularSwaggerView,
-)
+from drf_spectacular.views import SpectacularRedocView, SpectacularSwaggerView
 
+from core.async_api import get_redis
+from core.schema import CachedSchemaView
 from core.views import (
     EmailTokenObtainPairView,
     LogoutView,
     MeView,
     TokenRefreshView,
     UnifiedLoginView,
+    cache_stats,
     dashboard_stats,
+    database_stats,
+    job_status,
 )
 
 
-def health_check(request):
-    """Health check endpoint with service status"""
-    status = {"status": "ok", "service": "SIMS Backend", "components": {}}
+def _ping_database() -> None:
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1")
 
-    # Check database
-    try:
-        from django.db import connection
 
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT 1")
-        status["components"]["database"] = "ok"
+async def _check_database() -> str:
+    try:
+        await sync_to_async(_ping_database)()
     except Exception as e:
-        status["components"]["database"] = f"error: {str(e)}"
-        status["status"] = "degraded"
+        return f"error: {str(e)}"
+    return "ok"
 
-    # Check Redis/RQ
+
+async def _check_redis() -> str:
     try:
-        queue = django_rq.get_queue("default")
-        queue.connection.ping()
-        status["components"]["redis"] = "ok"
-        status["components"]["rq_queue"] = "ok"
+        async with get_redis() as redis:
+            await redis.ping()
     except Exception as e:
-        status["components"]["redis"] = f"error: {str(e)}"
+        return f"error: {str(e)}"
+    return "ok"
+
+
+async def health_check(request):
+    """Health check endpoint with service status"""
+    status = {"status": "ok", "service": "SIMS Backend", "components": {}}
+
+    # Check the database and Redis/RQ concurrently
+    database, redis = await asyncio.gather(_check_database(), _check_redis())
+    status["components"]["database"] = database
+    status["components"]["redis"] = redis
+    if redis == "ok":
+        status["components"]["rq_queue"] = "ok"
+    if database != "ok" or redis != "ok":
         status["status"] = "degraded"
 
     return JsonResponse(status)
@@ -67,7 +82,10 @@ urlpatterns = [
         name="token_refresh_legacy",
     ),
     path("api/dashboard/stats/", dashboard_stats, name="dashboard_stats"),
-    path("api/schema/", SpectacularAPIView.as_view(), name="api-schema"),
+    path("api/cache/stats/", cache_stats, name="cache_stats"),
+    path("api/db/stats/", database_stats, name="database_stats"),
+    path("api/jobs/<str:job_id>/", job_status, name="job_status"),
+    path("api/schema/", CachedSchemaView.as_view(), name="api-schema"),
     path(
         "api/docs/",
         SpectacularSwaggerView.as_view(url_name="api-schema"),
@@ -1,5 +1,6 @@
 import pytest
 from django.contrib.auth.models import Group, User
+from django.core.cache import cache
 from rest_framework.test import APIClient
 
 
@@ -11,6 +12,13 @@ def ensure_roles(django_db_setup, django_db_blocker):
     yield
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture()
 def api_client():
     return APIClient()
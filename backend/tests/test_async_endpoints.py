@@ -0,0 +1,174 @@
+"""Tests for the native async endpoints and the ASGI middleware chain"""
+
+from unittest import mock
+
+import pytest
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.utils.module_loading import import_string
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+from rq.results import Result
+
+from sims_backend.transcripts.views import generate_qr_token
+
+
+class FakeRedis:
+    def __init__(self, data=None, results=(), error=None):
+        self.data = data or {}
+        self.results = list(results)
+        self.error = error
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def ping(self):
+        if self.error:
+            raise self.error
+        return True
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def hgetall(self, key):
+        pass
+
+    def xrevrange(self, key, count=None):
+        pass
+
+    async def execute(self):
+        if self.redis.error:
+            raise self.redis.error
+        return [self.redis.data, self.redis.results]
+
+
+def _result(job_id, type, **kwargs):
+    payload = Result(job_id, type, connection=None, **kwargs).serialize()
+    return (
+        b"1700000000000-0",
+        {k.encode(): str(v).encode() for k, v in payload.items()},
+    )
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    user = User.objects.create_user(
+        username="testuser", password="testpass", is_staff=True, is_superuser=True
+    )
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.mark.django_db
+class TestHealthCheck:
+    def test_ok(self, client):
+        with mock.patch("sims_backend.urls.get_redis", return_value=FakeRedis()):
+            response = client.get("/health/")
+
+        assert response.json()["status"] == "ok"
+        assert response.json()["components"]["redis"] == "ok"
+
+    def test_redis_down_degrades(self, client):
+        redis = FakeRedis(error=ConnectionError("refused"))
+        with mock.patch("sims_backend.urls.get_redis", return_value=redis):
+            response = client.get("/health/")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "degraded"
+        assert response.json()["components"]["database"] == "ok"
+
+
+@pytest.mark.django_db
+class TestJobStatus:
+    def _get(self, client, redis, job_id="abc"):
+        with mock.patch("core.async_api.get_redis", return_value=redis):
+            return client.get(f"/api/jobs/{job_id}/")
+
+    def test_finished_job_returns_its_result(self, api_client):
+        redis = FakeRedis(
+            {b"status": b"finished", b"ended_at": b"2026-10-19T09:00:00Z"},
+            [
+                _result(
+                    "abc", Result.Type.SUCCESSFUL, return_value={"status": "success"}
+                )
+            ],
+        )
+
+        response = self._get(api_client, redis)
+
+        assert response.status_code == 200
+        assert response.data["status"] == "finished"
+        assert response.data["result"] == {"status": "success"}
+        assert response.data["error"] is None
+
+    def test_failed_job_reports_the_error(self, api_client):
+        redis = FakeRedis(
+            {b"status": b"failed"},
+            [
+                _result(
+                    "abc",
+                    Result.Type.FAILED,
+                    exc_string="Traceback...\nValueError: boom\n",
+                )
+            ],
+        )
+
+        assert self._get(api_client, redis).data["error"] == "ValueError: boom"
+
+    def test_unknown_job(self, api_client):
+        response = self._get(api_client, FakeRedis())
+        assert response.status_code == 404
+        assert response.data["error"]["message"] == "Job not found"
+
+    def test_redis_unavailable(self, api_client):
+        response = self._get(api_client, FakeRedis(error=ConnectionError("refused")))
+        assert response.status_code == 503
+
+    def test_requires_authentication(self, client):
+        response = self._get(client, FakeRedis())
+        assert response.status_code == 401
+
+    def test_read_only(self, api_client):
+        assert api_client.post("/api/jobs/abc/").status_code == 405
+
+
+@pytest.mark.django_db
+def test_async_views_accept_jwt():
+    user = User.objects.create_user(username="jwtuser", password="pass")
+    client = APIClient()
+    client.credentials(
+        HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(user).access_token}"
+    )
+
+    response = client.get(f"/api/transcripts/verify/{generate_qr_token(7)}/")
+
+    assert response.status_code == 200
+    assert response.json()["student_id"] == 7
+
+    client.credentials(HTTP_AUTHORIZATION="Bearer not-a-token")
+    assert client.get("/api/transcripts/verify/x/").status_code == 401
+
+
+def test_middleware_chain_is_async_capable_without_whitenoise():
+    # WhiteNoise is sync-only; the ASGI profile drops it with SERVE_STATIC=False.
+    sync_only = [
+        path
+        for path in settings.MIDDLEWARE
+        if not getattr(import_string(path), "async_capable", False)
+    ]
+    assert sync_only in ([], ["whitenoise.middleware.WhiteNoiseMiddleware"])
@@ -0,0 +1,160 @@
+"""Tests for batch approval of pending grade changes"""
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from sims_backend.academics.models import Course, Program, Section
+from sims_backend.admissions.models import Student
+from sims_backend.results.models import PendingChange, Result, StudentCGPA
+
+URL = "/api/results/approve-changes/"
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    user = User.objects.create_user(
+        username="testuser", password="testpass", is_staff=True, is_superuser=True
+    )
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def results():
+    program = Program.objects.create(name="Computer Science")
+    course = Course.objects.create(
+        code="CS101", title="Intro to CS", credits=3, program=program
+    )
+    section = Section.objects.create(course=course, term="Fall2024", teacher=None)
+    results = []
+    for i in range(3):
+        student = Student.objects.create(
+            reg_no=f"2024{i:03d}", name=f"Student {i}", program="CS", status="active"
+        )
+        results.append(
+            Result.objects.create(
+                student=student,
+                section=section,
+                final_grade="C",
+                state="published",
+                is_published=True,
+            )
+        )
+    return results
+
+
+def _change(result, grade):
+    return PendingChange.objects.create(
+        result=result, new_grade=grade, requested_by="faculty"
+    )
+
+
+def _post(client, *decisions):
+    return client.post(
+        URL,
+        {
+            "changes": [
+                {"change_id": change_id, "approved": approved}
+                for change_id, approved in decisions
+            ],
+            "approved_by": "registrar",
+        },
+        format="json",
+    )
+
+
+@pytest.mark.django_db
+class TestBatchApproval:
+    def test_approves_and_rejects(self, api_client, results):
+        first = _change(results[0], "A")
+        second = _change(results[1], "B")
+
+        response = _post(api_client, (first.id, True), (second.id, False))
+
+        assert response.status_code == 200
+        assert response.data["summary"] == {"approved": 1, "rejected": 1}
+        assert [r["status"] for r in response.data["results"]] == [
+            "approved",
+            "rejected",
+        ]
+        results[0].refresh_from_db()
+        results[1].refresh_from_db()
+        assert (results[0].final_grade, results[1].final_grade) == ("A", "C")
+        first.refresh_from_db()
+        assert (first.status, first.approved_by) == ("approved", "registrar")
+        assert first.resolved_at is not None
+        assert StudentCGPA.objects.get(student=results[0].student).cgpa == 4.0
+
+    def test_conflicting_approvals_stay_pending(self, api_client, results):
+        first = _change(results[0], "A")
+        second = _change(results[0], "B")
+        outside = _change(results[1], "A")
+        rival = _change(results[1], "B")
+
+        response = _post(
+            api_client, (first.id, True), (second.id, True), (outside.id, True)
+        )
+
+        assert [r["status"] for r in response.data["results"]] == ["conflict"] * 3
+        assert set(
+            PendingChange.objects.filter(status="pending").values_list("id", flat=True)
+        ) == {first.id, second.id, outside.id, rival.id}
+        results[0].refresh_from_db()
+        assert results[0].final_grade == "C"
+
+    def test_rejecting_the_rival_resolves_the_conflict(self, api_client, results):
+        keep = _change(results[0], "A")
+        drop = _change(results[0], "B")
+
+        response = _post(api_client, (keep.id, True), (drop.id, False))
+
+        assert response.data["summary"] == {"approved": 1, "rejected": 1}
+        results[0].refresh_from_db()
+        assert results[0].final_grade == "A"
+
+    def test_per_item_errors(self, api_client, results):
+        change = _change(results[0], "A")
+        done = _change(results[1], "B")
+        done.status = "rejected"
+        done.save()
+
+        response = _post(
+            api_client,
+            (change.id, True),
+            (change.id, True),
+            (done.id, True),
+            (999, True),
+        )
+
+        assert [r["status"] for r in response.data["results"]] == [
+            "approved",
+            "duplicate",
+            "already_rejected",
+            "not_found",
+        ]
+
+    def test_writes_are_batched(self, api_client, results):
+        changes = [_change(result, "A") for result in results]
+
+        with CaptureQueriesContext(connection) as ctx:
+            _post(api_client, *[(change.id, True) for change in changes])
+
+        updates = [
+            q
+            for q in ctx.captured_queries
+            if q["sql"].startswith("UPDATE") and "results_result" in q["sql"]
+        ]
+        assert len(updates) == 1
+        assert set(Result.objects.values_list("final_grade", flat=True)) == {"A"}
+
+    @pytest.mark.parametrize(
+        "payload",
+        [{}, {"changes": []}, {"changes": [{"approved": True}]}, {"changes": "1"}],
+    )
+    def test_invalid_payload(self, api_client, payload):
+        response = api_client.post(URL, payload, format="json")
+        assert response.status_code == 400
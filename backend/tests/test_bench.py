@@ -0,0 +1,103 @@
+"""Tests for the API benchmark command"""
+
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from core.bench import SCENARIO_NAMES, compare_reports, percentile
+
+
+def _bench(*args):
+    out = StringIO()
+    call_command("bench", "--current-db", "--json", *args, stdout=out)
+    return json.loads(out.getvalue())
+
+
+@pytest.fixture
+def dataset(db):
+    call_command(
+        "seed_demo", "--scale", "--students", "12", "--days", "3", stdout=StringIO()
+    )
+
+
+def test_percentile_uses_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([4.0], 95) == 4.0
+
+
+@pytest.mark.django_db
+def test_reports_every_hot_path(dataset, tmp_path):
+    output = tmp_path / "bench.json"
+
+    report = _bench("--requests", "3", "--warmup", "1", "--output", str(output))
+
+    assert list(report["scenarios"]) == SCENARIO_NAMES
+    for name, row in report["scenarios"].items():
+        assert row["errors"] == 0, name
+        assert row["p50_ms"] <= row["p95_ms"] <= row["p99_ms"]
+        assert row["queries_per_request"] > 0
+        assert row["throughput_rps"] > 0
+    assert report["meta"]["mode"] == "in-process"
+    assert json.loads(output.read_text())["scenarios"] == report["scenarios"]
+
+
+@pytest.mark.django_db
+def test_compares_with_a_saved_run(dataset, tmp_path):
+    baseline = tmp_path / "baseline.json"
+    _bench("--scenarios", "section_list", "--requests", "2", "--output", str(baseline))
+
+    report = _bench(
+        "--scenarios", "section_list", "--requests", "2", "--compare", str(baseline)
+    )
+
+    [row] = report["comparison"]
+    assert row["scenario"] == "section_list"
+    assert row["p50_ms"]["baseline"] > 0
+    assert row["queries_per_request"]["change_pct"] == 0
+
+
+def test_compare_reports_skips_missing_scenarios():
+    before = {"scenarios": {"login": {"p50_ms": 10.0}, "dashboard": {"p50_ms": 4.0}}}
+    after = {"scenarios": {"login": {"p50_ms": 12.0}}}
+
+    [row] = compare_reports(before, after)
+
+    assert row["p50_ms"]["change_pct"] == 20.0
+    assert row["throughput_rps"]["change_pct"] is None
+
+
+@pytest.mark.django_db(transaction=True)
+def test_http_mode(live_server):
+    call_command("seed_demo", "--students", "3", stdout=StringIO())
+
+    report = _bench(
+        "--url",
+        live_server.url,
+        "--scenarios",
+        "login,section_list",
+        "--requests",
+        "2",
+        "--concurrency",
+        "2",
+    )
+
+    assert report["meta"]["mode"] == "http"
+    assert report["scenarios"]["section_list"]["errors"] == 0
+    assert report["scenarios"]["section_list"]["queries_per_request"] is None
+
+
+@pytest.mark.django_db
+def test_rejects_unknown_scenarios():
+    with pytest.raises(CommandError, match="Unknown scenarios: nope"):
+        _bench("--scenarios", "login,nope")
+
+
+@pytest.mark.django_db
+def test_requires_data():
+    with pytest.raises(CommandError, match="seed"):
+        _bench()
@@ -0,0 +1,174 @@
+"""Tests for the updated_since changes feed"""
+
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth.models import User
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core.models import Tombstone
+from sims_backend.academics.models import Course, Program, Section
+from sims_backend.admissions.models import Student
+from sims_backend.results.models import Result
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    user = User.objects.create_user(
+        username="testuser", password="testpass", is_staff=True, is_superuser=True
+    )
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def students():
+    return [
+        Student.objects.create(
+            reg_no=f"2024{i:03d}", name=f"Student {i}", program="CS", status="active"
+        )
+        for i in range(5)
+    ]
+
+
+def _iso(value):
+    return value.isoformat().replace("+00:00", "Z")
+
+
+@pytest.mark.django_db
+class TestChangesFeed:
+    def test_full_sync_returns_all_rows_in_order(self, api_client, students):
+        response = api_client.get("/api/students/changes/")
+
+        assert response.status_code == 200
+        ids = [row["id"] for row in response.data["results"]]
+        assert ids == [student.id for student in students]
+        assert response.data["deleted"] == []
+        assert response.data["has_more"] is False
+        assert response.data["next_cursor"]
+
+    def test_updated_since_returns_only_later_rows(self, api_client, students):
+        since = timezone.now()
+        Student.objects.update(updated_at=since - timedelta(days=1))
+        Student.objects.filter(pk=students[1].pk).update(
+            updated_at=since + timedelta(seconds=1)
+        )
+
+        response = api_client.get(
+            "/api/students/changes/", {"updated_since": _iso(since)}
+        )
+
+        assert [row["id"] for row in response.data["results"]] == [students[1].id]
+
+    def test_cursor_pages_through_rows_sharing_a_timestamp(
+        self, api_client, students
+    ):
+        Student.objects.update(updated_at=timezone.now())
+
+        seen = []
+        response = api_client.get("/api/students/changes/", {"limit": 2})
+        while True:
+            seen.extend(row["id"] for row in response.data["results"])
+            if not response.data["has_more"]:
+                break
+            response = api_client.get(
+                "/api/students/changes/",
+                {"cursor": response.data["next_cursor"], "limit": 2},
+            )
+
+        assert seen == [student.id for student in students]
+
+    def test_cursor_picks_up_later_updates(self, api_client, students):
+        cursor = api_client.get("/api/students/changes/").data["next_cursor"]
+
+        student = students[2]
+        student.name = "Renamed"
+        student.save()
+
+        response = api_client.get("/api/students/changes/", {"cursor": cursor})
+        assert [row["name"] for row in response.data["results"]] == ["Renamed"]
+
+    def test_deletions_are_reported_as_tombstones(self, api_client, students):
+        cursor = api_client.get("/api/students/changes/").data["next_cursor"]
+
+        deleted_id = students[0].id
+        students[0].delete()
+
+        response = api_client.get("/api/students/changes/", {"cursor": cursor})
+        assert response.data["results"] == []
+        assert response.data["deleted"] == [str(deleted_id)]
+
+        cursor = response.data["next_cursor"]
+        response = api_client.get("/api/students/changes/", {"cursor": cursor})
+        assert response.data["deleted"] == []
+
+    def test_tombstones_are_scoped_to_model(self, api_client, students):
+        program = Program.objects.create(name="Computer Science")
+        course = Course.objects.create(
+            code="CS101", title="Intro to CS", credits=3, program=program
+        )
+        section = Section.objects.create(course=course, term="Fall2024", teacher=None)
+        result = Result.objects.create(
+            student=students[0], section=section, final_grade="B"
+        )
+        cursor = api_client.get("/api/results/changes/").data["next_cursor"]
+
+        result_id = result.id
+        result.delete()
+        assert Tombstone.objects.filter(model="results.Result").count() == 1
+
+        response = api_client.get("/api/students/changes/", {"cursor": cursor})
+        assert response.data["deleted"] == []
+        response = api_client.get("/api/results/changes/", {"cursor": cursor})
+        assert response.data["deleted"] == [str(result_id)]
+
+    def test_scoped_users_do_not_see_other_deletions(self, student_user, students):
+        client = APIClient()
+        client.force_authenticate(user=student_user)
+        own = Student.objects.create(
+            reg_no=student_user.username, name="Me", program="CS", status="active"
+        )
+        cursor = client.get("/api/students/changes/").data["next_cursor"]
+
+        students[0].delete()
+
+        response = client.get("/api/students/changes/", {"cursor": cursor})
+        assert response.status_code == 200
+        assert response.data["deleted"] == []
+        assert [
+            row["id"] for row in client.get("/api/students/changes/").data["results"]
+        ] == [own.id]
+
+    def test_registrar_sees_deletions(self, registrar_user, students):
+        client = APIClient()
+        client.force_authenticate(user=registrar_user)
+        cursor = client.get("/api/students/changes/").data["next_cursor"]
+
+        deleted_id = students[0].id
+        students[0].delete()
+
+        response = client.get("/api/students/changes/", {"cursor": cursor})
+        assert response.data["deleted"] == [str(deleted_id)]
+
+    def test_filters_still_apply(self, api_client, students):
+        students[3].status = "graduated"
+        students[3].save()
+
+        response = api_client.get("/api/students/changes/", {"status": "graduated"})
+        assert [row["id"] for row in response.data["results"]] == [students[3].id]
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"updated_since": "yesterday"},
+            {"cursor": "not-a-cursor"},
+            {"limit": "0"},
+            {"limit": "many"},
+        ],
+    )
+    def test_invalid_parameters_are_rejected(self, api_client, params):
+        response = api_client.get("/api/students/changes/", params)
+        assert response.status_code == 400
+        assert response.data["error"]["code"] == 400
@@ -0,0 +1,159 @@
+"""Tests for ETag/Last-Modified conditional GET support"""
+
+from datetime import date
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from sims_backend.academics.models import Course, Program, Section
+from sims_backend.admissions.models import Student
+from sims_backend.attendance.models import Attendance
+from sims_backend.enrollment.models import Enrollment
+from sims_backend.results.models import Result
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    user = User.objects.create_user(
+        username="testuser", password="testpass", is_staff=True, is_superuser=True
+    )
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def sample_data():
+    program = Program.objects.create(name="Computer Science")
+    course = Course.objects.create(
+        code="CS101", title="Intro to CS", credits=3, program=program
+    )
+    section = Section.objects.create(
+        course=course, term="Fall2024", teacher=None, teacher_name="Dr. Smith"
+    )
+    student = Student.objects.create(
+        reg_no="2024001", name="John Doe", program="CS", status="active"
+    )
+    result = Result.objects.create(student=student, section=section, final_grade="B")
+    attendance = Attendance.objects.create(
+        section=section, student=student, date=date(2024, 9, 2)
+    )
+    return {
+        "course": course,
+        "section": section,
+        "student": student,
+        "result": result,
+        "attendance": attendance,
+    }
+
+
+@pytest.mark.django_db
+class TestConditionalList:
+    @pytest.mark.parametrize(
+        "url",
+        ["/api/students/", "/api/sections/", "/api/results/", "/api/attendance/"],
+    )
+    def test_list_returns_validators_and_304(self, api_client, sample_data, url):
+        response = api_client.get(url)
+        assert response.status_code == 200
+        etag = response["ETag"]
+        assert etag.startswith('W/"')
+        assert "Last-Modified" in response
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+        assert not response.content
+
+    def test_unchanged_poll_skips_serialization(self, api_client, sample_data):
+        etag = api_client.get("/api/results/")["ETag"]
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.get("/api/results/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        result_queries = [
+            q for q in ctx.captured_queries if "results_result" in q["sql"]
+        ]
+        assert len(result_queries) == 1
+        assert "MAX" in result_queries[0]["sql"].upper()
+
+    def test_update_changes_etag(self, api_client, sample_data):
+        etag = api_client.get("/api/results/")["ETag"]
+
+        result = sample_data["result"]
+        result.final_grade = "A"
+        result.save()
+
+        response = api_client.get("/api/results/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+
+    def test_delete_changes_etag(self, api_client, sample_data):
+        etag = api_client.get("/api/attendance/")["ETag"]
+
+        sample_data["attendance"].delete()
+
+        response = api_client.get("/api/attendance/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+
+    def test_query_string_changes_etag(self, api_client, sample_data):
+        etag = api_client.get("/api/students/")["ETag"]
+        other = api_client.get("/api/students/?fields=id")["ETag"]
+        assert etag != other
+
+    def test_embedded_change_changes_etag(self, api_client, sample_data):
+        etag = api_client.get("/api/sections/")["ETag"]
+
+        course = sample_data["course"]
+        course.title = "Renamed"
+        course.save()
+
+        response = api_client.get("/api/sections/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response.data["results"][0]["course_detail"]["title"] == "Renamed"
+
+    def test_enrollment_changes_section_etag(self, api_client, sample_data):
+        etag = api_client.get("/api/sections/")["ETag"]
+
+        Enrollment.objects.create(
+            student=sample_data["student"], section=sample_data["section"]
+        )
+
+        response = api_client.get("/api/sections/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response.data["results"][0]["enrolled_count"] == 1
+
+    def test_if_modified_since(self, api_client, sample_data):
+        last_modified = api_client.get("/api/students/")["Last-Modified"]
+        response = api_client.get(
+            "/api/students/", HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+        assert response.status_code == 304
+
+
+@pytest.mark.django_db
+class TestConditionalDetail:
+    def test_detail_returns_304(self, api_client, sample_data):
+        url = f"/api/students/{sample_data['student'].id}/"
+        etag = api_client.get(url)["ETag"]
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+
+    def test_detail_changes_after_write(self, api_client, sample_data):
+        url = f"/api/results/{sample_data['result'].id}/"
+        etag = api_client.get(url)["ETag"]
+
+        api_client.patch(url, {"final_grade": "A"}, format="json")
+
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response.data["final_grade"] == "A"
+
+    def test_missing_detail_is_404(self, api_client, sample_data):
+        response = api_client.get("/api/results/999999/")
+        assert response.status_code == 404
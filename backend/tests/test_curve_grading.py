@@ -0,0 +1,232 @@
+"""Tests for relative (curve) grading"""
+
+import pytest
+from django.contrib.auth.models import Group, User
+from rest_framework.test import APIClient
+
+from sims_backend.academics.models import Course, Program, Section
+from sims_backend.admissions.models import Student
+from sims_backend.assessments.models import Assessment, AssessmentScore
+from sims_backend.enrollment.models import Enrollment
+from sims_backend.results.curve import CurveError, compile_curve
+from sims_backend.results.models import CurvePolicy, Result
+from sims_backend.results.utils import recompute_results
+
+URL = "/api/results/curve/"
+
+QUOTAS = [
+    {"grade": "A", "percent": 20},
+    {"grade": "B", "percent": 30},
+    {"grade": "C", "percent": 50},
+]
+Z_BANDS = [
+    {"grade": "A", "min_z": 1},
+    {"grade": "B", "min_z": -1},
+    {"grade": "C", "min_z": None},
+]
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    user = User.objects.create_user(
+        username="testuser", password="testpass", is_staff=True, is_superuser=True
+    )
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def section():
+    program = Program.objects.create(name="Computer Science")
+    course = Course.objects.create(
+        code="CS101", title="Intro to CS", credits=3, program=program
+    )
+    section = Section.objects.create(course=course, term="Fall2024", teacher=None)
+    assessment = Assessment.objects.create(section=section, type="Final", weight=100)
+    for i, score in enumerate([95, 90, 80, 70, 70, 60, 55, 50, 40, 10]):
+        student = Student.objects.create(
+            reg_no=f"2024{i:03d}", name=f"Student {i}", program="CS", status="active"
+        )
+        Enrollment.objects.create(student=student, section=section)
+        AssessmentScore.objects.create(
+            assessment=assessment, student=student, score=score
+        )
+    return section
+
+
+def _grades(section):
+    return dict(
+        Result.objects.filter(section=section).values_list(
+            "student__reg_no", "final_grade"
+        )
+    )
+
+
+class TestCompileCurve:
+    def test_quota_ties_share_the_better_grade(self):
+        grade = compile_curve("quota", QUOTAS)
+        assert grade([90, 80, 70, 70, 60, 50, 50, 40, 30, 20]) == [
+            "A",
+            "A",
+            "B",
+            "B",
+            "B",
+            "C",
+            "C",
+            "C",
+            "C",
+            "C",
+        ]
+
+    def test_zscore_bands(self):
+        grade = compile_curve("zscore", Z_BANDS)
+        assert grade([100, 50, 50, 50, 0]) == ["A", "B", "B", "B", "C"]
+        # No spread means everyone sits at z = 0.
+        assert grade([70, 70]) == ["B", "B"]
+
+    @pytest.mark.parametrize(
+        ("method", "bands"),
+        [
+            ("linear", QUOTAS),
+            ("quota", []),
+            ("quota", [{"grade": "A", "percent": 50}]),
+            ("quota", [{"grade": "A", "percent": 50}, {"grade": "A", "percent": 50}]),
+            ("zscore", [{"grade": "A", "min_z": 1}]),
+            ("zscore", [{"grade": "A", "min_z": "x"}, {"grade": "F", "min_z": None}]),
+        ],
+    )
+    def test_invalid_curves(self, method, bands):
+        with pytest.raises(CurveError):
+            compile_curve(method, bands)
+
+
+@pytest.mark.django_db
+class TestCurveEndpoint:
+    def test_dry_run_previews_without_writing(self, api_client, section):
+        response = api_client.post(
+            URL,
+            {"section": section.id, "method": "quota", "bands": QUOTAS},
+            format="json",
+        )
+
+        assert response.status_code == 200
+        assert response.data["dry_run"] is True
+        assert response.data["distribution"] == {"A": 2, "B": 3, "C": 5}
+        assert response.data["students"][0]["total"] == 95.0
+        assert response.data["counts"] is None
+        assert not Result.objects.exists()
+
+    def test_apply_writes_drafts_only(self, api_client, section):
+        published = Student.objects.get(reg_no="2024000")
+        Result.objects.create(
+            student=published,
+            section=section,
+            final_grade="D",
+            state="published",
+            is_published=True,
+        )
+
+        response = api_client.post(
+            URL,
+            {
+                "section": section.id,
+                "method": "quota",
+                "bands": QUOTAS,
+                "dry_run": False,
+            },
+            format="json",
+        )
+
+        assert response.data["counts"] == {"created": 9, "updated": 0, "skipped": 1}
+        grades = _grades(section)
+        assert grades["2024000"] == "D"
+        assert grades["2024001"] == "A"
+        assert grades["2024009"] == "C"
+
+    def test_apply_saves_the_curve_as_policy(self, api_client, section):
+        body = {"section": section.id, "method": "quota", "bands": QUOTAS}
+        api_client.post(URL, body, format="json")
+        assert not CurvePolicy.objects.exists()
+
+        api_client.post(URL, {**body, "dry_run": False}, format="json")
+
+        policy = CurvePolicy.objects.get(section=section)
+        assert (policy.method, policy.bands) == ("quota", QUOTAS)
+        recompute_results(section.id, [])
+        assert list(_grades(section).values()).count("A") == 2
+
+    def test_uses_saved_policy(self, api_client, section):
+        CurvePolicy.objects.create(section=section, method="zscore", bands=Z_BANDS)
+
+        response = api_client.post(URL, {"section": section.id}, format="json")
+
+        assert response.data["method"] == "zscore"
+        assert sum(response.data["distribution"].values()) == 10
+
+    def test_requires_policy_or_bands(self, api_client, section):
+        response = api_client.post(URL, {"section": section.id}, format="json")
+        assert response.status_code == 400
+
+    def test_invalid_bands(self, api_client, section):
+        response = api_client.post(
+            URL,
+            {"section": section.id, "method": "quota", "bands": QUOTAS[:1]},
+            format="json",
+        )
+        assert response.status_code == 400
+
+    def test_teacher_can_curve_own_section(self, section):
+        user = User.objects.create_user(username="teacher", password="pass")
+        user.groups.add(Group.objects.get_or_create(name="Faculty")[0])
+        section.teacher = user
+        section.save()
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.post(
+            URL,
+            {"section": section.id, "method": "quota", "bands": QUOTAS},
+            format="json",
+        )
+        assert response.status_code == 200
+
+    def test_other_faculty_cannot_curve(self, section):
+        user = User.objects.create_user(username="other", password="pass")
+        user.groups.add(Group.objects.get_or_create(name="Faculty")[0])
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.post(
+            URL,
+            {"section": section.id, "method": "quota", "bands": QUOTAS},
+            format="json",
+        )
+        assert response.status_code == 403
+
+
+@pytest.mark.django_db
+class TestCurvePolicy:
+    def test_recompute_follows_policy(self, section):
+        CurvePolicy.objects.create(section=section, method="quota", bands=QUOTAS)
+
+        counts = recompute_results(section.id, [])
+
+        # A curve regrades the whole section, not just the given students.
+        assert counts["created"] == 10
+        assert list(_grades(section).values()).count("A") == 2
+
+    def test_policy_endpoint_validates_bands(self, api_client, section):
+        response = api_client.post(
+            "/api/curve-policies/",
+            {"section": section.id, "method": "zscore", "bands": QUOTAS},
+            format="json",
+        )
+        assert response.status_code == 400
+
+        response = api_client.post(
+            "/api/curve-policies/",
+            {"section": section.id, "method": "zscore", "bands": Z_BANDS},
+            format="json",
+        )
+        assert response.status_code == 201
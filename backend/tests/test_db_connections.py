@@ -0,0 +1,89 @@
+"""Tests for database connection settings, metrics and the RQ worker"""
+
+from unittest import mock
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework.test import APIClient
+
+from core.db import database_settings
+from core.workers import DatabaseWorker
+
+URL = "/api/db/stats/"
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    user = User.objects.create_user(
+        username="testuser", password="testpass", is_staff=True, is_superuser=True
+    )
+    client.force_authenticate(user=user)
+    return client
+
+
+class TestDatabaseSettings:
+    def test_persistent_by_default(self):
+        database = database_settings({})
+
+        assert database["CONN_MAX_AGE"] == 60
+        assert database["CONN_HEALTH_CHECKS"] is True
+        assert database["OPTIONS"] == {}
+
+    def test_psycopg_pool(self):
+        database = database_settings(
+            {"DB_POOL_MODE": "psycopg", "DB_POOL_MAX_SIZE": "20"}
+        )
+
+        assert database["CONN_MAX_AGE"] == 0
+        assert database["OPTIONS"]["pool"] == {
+            "min_size": 2,
+            "max_size": 20,
+            "timeout": 10.0,
+        }
+
+    def test_pgbouncer_disables_server_side_cursors(self):
+        database = database_settings(
+            {"DB_POOL_MODE": "pgbouncer", "DB_CONN_HEALTH_CHECKS": "false"}
+        )
+
+        assert database["DISABLE_SERVER_SIDE_CURSORS"] is True
+        assert database["CONN_HEALTH_CHECKS"] is False
+
+    def test_unknown_mode(self):
+        with pytest.raises(ImproperlyConfigured):
+            database_settings({"DB_POOL_MODE": "session"})
+
+
+@pytest.mark.django_db
+class TestDatabaseStats:
+    def test_reports_mode(self, api_client):
+        response = api_client.get(URL)
+
+        assert response.status_code == 200
+        assert response.data["mode"] == "persistent"
+        assert response.data["pool"] is None
+
+    def test_admin_only(self):
+        client = APIClient()
+        client.force_authenticate(User.objects.create_user(username="u", password="p"))
+        assert client.get(URL).status_code == 403
+
+
+def test_worker_recycles_connections_around_jobs():
+    worker = object.__new__(DatabaseWorker)
+    calls = []
+    with (
+        mock.patch(
+            "core.workers.close_old_connections",
+            side_effect=lambda: calls.append("close"),
+        ),
+        mock.patch(
+            "rq.worker.SimpleWorker.perform_job",
+            side_effect=lambda job, queue: calls.append("job") or True,
+        ),
+    ):
+        assert worker.perform_job(mock.Mock(), mock.Mock()) is True
+
+    assert calls == ["close", "job", "close"]
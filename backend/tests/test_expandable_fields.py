@@ -0,0 +1,141 @@
+"""Tests for sparse fieldsets and opt-in expansion"""
+
+from datetime import date
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.mixins import parse_csv_param
+from sims_backend.academics.models import Course, Program, Section
+from sims_backend.admissions.models import Student
+from sims_backend.attendance.models import Attendance
+from sims_backend.enrollment.models import Enrollment
+from sims_backend.results.models import Result
+from sims_backend.results.serializers import ResultSerializer
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    user = User.objects.create_user(
+        username="testuser", password="testpass", is_staff=True, is_superuser=True
+    )
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def sample_data():
+    program = Program.objects.create(name="Computer Science")
+    course = Course.objects.create(
+        code="CS101", title="Intro to CS", credits=3, program=program
+    )
+    section = Section.objects.create(
+        course=course, term="Fall2024", teacher=None, teacher_name="Dr. Smith"
+    )
+    students = [
+        Student.objects.create(
+            reg_no=f"2024{i:03d}", name=f"Student {i}", program="CS", status="active"
+        )
+        for i in range(3)
+    ]
+    for student in students:
+        Enrollment.objects.create(student=student, section=section)
+        Attendance.objects.create(
+            section=section, student=student, date=date(2024, 9, 2)
+        )
+        Result.objects.create(student=student, section=section, final_grade="B")
+    return {"course": course, "section": section, "students": students}
+
+
+def test_parse_csv_param():
+    assert parse_csv_param(None) == []
+    assert parse_csv_param("id, name,,status ") == ["id", "name", "status"]
+
+
+@pytest.mark.django_db
+class TestSparseFieldsets:
+    def test_default_payload_keeps_existing_embeds(self, api_client, sample_data):
+        response = api_client.get("/api/attendance/")
+        row = response.data["results"][0]
+        assert row["student_detail"]["reg_no"] == "2024000"
+
+        response = api_client.get("/api/sections/")
+        assert response.data["results"][0]["course_detail"]["code"] == "CS101"
+
+    def test_fields_trims_output(self, api_client, sample_data):
+        response = api_client.get("/api/attendance/?fields=id,student,present")
+        row = response.data["results"][0]
+        assert set(row) == {"id", "student", "present"}
+
+    def test_fields_applies_to_detail(self, api_client, sample_data):
+        section = sample_data["section"]
+        response = api_client.get(f"/api/sections/{section.id}/?fields=id,term")
+        assert response.data == {"id": section.id, "term": "Fall2024"}
+
+    def test_fields_ignored_on_write(self, api_client, sample_data):
+        student = sample_data["students"][0]
+        response = api_client.patch(
+            f"/api/students/{student.id}/?fields=id", {"name": "Renamed"}, format="json"
+        )
+        assert response.status_code == 200
+        assert response.data["name"] == "Renamed"
+
+    def test_trimmed_embed_skips_join(self, api_client, sample_data):
+        with CaptureQueriesContext(connection) as ctx:
+            api_client.get("/api/attendance/?fields=id,student")
+        assert not any(
+            "admissions_student" in query["sql"] for query in ctx.captured_queries
+        )
+
+
+@pytest.mark.django_db
+class TestExpansion:
+    def test_expand_is_opt_in(self, api_client, sample_data):
+        response = api_client.get("/api/results/")
+        assert "student_detail" not in response.data["results"][0]
+
+        response = api_client.get("/api/results/?expand=student_detail")
+        assert response.data["results"][0]["student_detail"]["name"] == "Student 0"
+
+    def test_dotted_expand(self, api_client, sample_data):
+        response = api_client.get("/api/enrollments/?expand=section_detail.course_detail")
+        section_detail = response.data["results"][0]["section_detail"]
+        assert section_detail["course_detail"]["code"] == "CS101"
+        assert "enrolled_count" not in section_detail
+
+    def test_expand_combined_with_fields(self, api_client, sample_data):
+        response = api_client.get("/api/results/?fields=id&expand=student_detail")
+        assert set(response.data["results"][0]) == {"id", "student_detail"}
+
+    def test_unknown_expand_is_ignored(self, api_client, sample_data):
+        response = api_client.get("/api/results/?expand=nope")
+        assert response.status_code == 200
+
+    def test_expansion_query_count_is_constant(self, api_client, sample_data):
+        url = "/api/enrollments/?expand=student_detail,section_detail"
+        with CaptureQueriesContext(connection) as small:
+            api_client.get(url)
+
+        section = sample_data["section"]
+        for i in range(3, 20):
+            student = Student.objects.create(
+                reg_no=f"2024{i:03d}", name=f"Student {i}", program="CS", status="a"
+            )
+            Enrollment.objects.create(student=student, section=section)
+
+        with CaptureQueriesContext(connection) as large:
+            response = api_client.get(url)
+
+        assert len(response.data["results"]) == 20
+        assert len(large.captured_queries) == len(small.captured_queries)
+
+    def test_related_lookups(self):
+        select, prefetch = ResultSerializer.get_related_lookups(
+            expand=["student_detail", "section_detail"]
+        )
+        assert select == ["student", "section", "section__course"]
+        assert prefetch == []
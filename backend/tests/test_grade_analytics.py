@@ -0,0 +1,199 @@
+"""Tests for grade-distribution analytics"""
+
+from unittest import mock
+
+import pytest
+from django.contrib.auth.models import Group, User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from sims_backend.academics.models import Course, Program, Section
+from sims_backend.admissions.models import Student
+from sims_backend.assessments.models import Assessment, AssessmentScore
+from sims_backend.enrollment.models import Enrollment
+from sims_backend.results.analytics import (
+    get_section_columns,
+    invalidate_section,
+    summarize,
+)
+from sims_backend.results.models import Result
+
+URL = "/api/results/analytics/"
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    user = User.objects.create_user(
+        username="testuser", password="testpass", is_staff=True, is_superuser=True
+    )
+    client.force_authenticate(user=user)
+    return client
+
+
+def _section(course, term, scores):
+    section = Section.objects.create(course=course, term=term, teacher=None)
+    assessment = Assessment.objects.create(section=section, type="Final", weight=100)
+    for i, score in enumerate(scores):
+        student = Student.objects.create(
+            reg_no=f"{term}-{course.code}-{i}",
+            name=f"Student {i}",
+            program="CS",
+            status="active",
+        )
+        Enrollment.objects.create(student=student, section=section)
+        if score is not None:
+            AssessmentScore.objects.create(
+                assessment=assessment, student=student, score=score
+            )
+            Result.objects.create(
+                student=student, section=section, final_grade="A" if score > 80 else "C"
+            )
+    return section
+
+
+@pytest.fixture
+def sections():
+    program = Program.objects.create(name="Computer Science")
+    cs101 = Course.objects.create(
+        code="CS101", title="Intro", credits=3, program=program
+    )
+    cs102 = Course.objects.create(
+        code="CS102", title="Data", credits=3, program=program
+    )
+    return {
+        "fall_101": _section(cs101, "Fall2024", [90, 70, 50, None]),
+        "fall_102": _section(cs102, "Fall2024", [100, 85]),
+        "spring_101": _section(cs101, "Spring2025", [60]),
+    }
+
+
+class TestSummarize:
+    def test_statistics(self):
+        summary = summarize([0.0, 50.0, 70.0, 90.0], {"A": 1, "C": 2})
+
+        assert summary["count"] == 4
+        assert summary["mean"] == 52.5
+        assert summary["median"] == 60.0
+        assert summary["stddev"] == 33.45
+        assert summary["percentiles"]["p25"] == 37.5
+        assert summary["histogram"]["counts"] == [1, 0, 0, 0, 0, 1, 0, 1, 0, 1]
+
+    def test_full_marks_land_in_last_bin(self):
+        assert summarize([100.0], {})["histogram"]["counts"][-1] == 1
+
+    def test_empty(self):
+        summary = summarize([], {})
+        assert summary["count"] == 0
+        assert summary["mean"] is None
+
+
+@pytest.mark.django_db
+class TestAnalyticsEndpoint:
+    def test_section_distribution(self, api_client, sections):
+        response = api_client.get(f"{URL}?section={sections['fall_101'].id}")
+
+        assert response.status_code == 200
+        section = response.data["sections"][0]
+        # The unscored enrolled student counts as zero.
+        assert section["count"] == 4
+        assert section["median"] == 60.0
+        assert section["grades"] == {"A": 1, "C": 2}
+        assert response.data["overall"]["count"] == 4
+
+    def test_term_report_merges_sections(self, api_client, sections):
+        response = api_client.get(f"{URL}?term=Fall2024")
+
+        assert [s["course"] for s in response.data["sections"]] == ["CS101", "CS102"]
+        overall = response.data["overall"]
+        assert overall["count"] == 6
+        assert overall["max"] == 100.0
+        assert overall["grades"] == {"A": 3, "C": 2}
+
+    def test_course_across_terms(self, api_client, sections):
+        course = sections["fall_101"].course.id
+        response = api_client.get(f"{URL}?course={course}")
+        assert [s["term"] for s in response.data["sections"]] == [
+            "Fall2024",
+            "Spring2025",
+        ]
+
+    def test_cached_until_publish(
+        self, api_client, sections, django_capture_on_commit_callbacks
+    ):
+        section = sections["fall_101"]
+        api_client.get(f"{URL}?term=Fall2024")
+
+        with CaptureQueriesContext(connection) as ctx:
+            api_client.get(f"{URL}?term=Fall2024")
+        section_reads = [q for q in ctx.captured_queries if "assessments_" in q["sql"]]
+        assert section_reads == []
+
+        result = Result.objects.filter(section=section).first()
+        Result.objects.filter(pk=result.pk).update(final_grade="B")
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.post("/api/results/publish/", {"result_id": result.id})
+
+        response = api_client.get(f"{URL}?section={section.id}")
+        assert response.data["sections"][0]["grades"]["B"] == 1
+
+    def test_invalidated_only_after_commit(
+        self, api_client, sections, django_capture_on_commit_callbacks
+    ):
+        section = sections["fall_101"]
+        get_section_columns([section.id])
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            invalidate_section(section.id)
+            # Still cached while the writing transaction is open.
+            assert cache.get(f"results:analytics:section:{section.id}") is not None
+        for callback in callbacks:
+            callback()
+        assert cache.get(f"results:analytics:section:{section.id}") is None
+
+    def test_cache_outage_does_not_fail_requests(
+        self, api_client, sections, django_capture_on_commit_callbacks
+    ):
+        section = sections["fall_101"]
+        result = Result.objects.filter(section=section).first()
+        with (
+            mock.patch.object(cache, "get_many", side_effect=ConnectionError),
+            mock.patch.object(cache, "set_many", side_effect=ConnectionError),
+            mock.patch.object(cache, "delete", side_effect=ConnectionError),
+        ):
+            assert api_client.get(f"{URL}?term=Fall2024").status_code == 200
+            with django_capture_on_commit_callbacks(execute=True):
+                response = api_client.post(
+                    "/api/results/publish/", {"result_id": result.id}
+                )
+        assert response.status_code == 200
+
+    def test_query_count_does_not_grow_with_sections(self, api_client, sections):
+        with CaptureQueriesContext(connection) as ctx:
+            api_client.get(f"{URL}?term=Fall2024")
+        reads = len(ctx.captured_queries)
+
+        course = sections["fall_101"].course
+        for i in range(5):
+            other = Course.objects.create(
+                code=f"CS2{i:02d}", title="More", credits=3, program=course.program
+            )
+            _section(other, "Fall2024", [40, 80])
+        with CaptureQueriesContext(connection) as ctx:
+            api_client.get(f"{URL}?term=Fall2024")
+        assert len(ctx.captured_queries) <= reads
+
+    def test_requires_a_filter(self, api_client):
+        assert api_client.get(URL).status_code == 400
+        assert api_client.get(f"{URL}?section=abc").status_code == 400
+
+    def test_students_cannot_view(self, sections):
+        user = User.objects.create_user(username="2024001", password="pass")
+        user.groups.add(Group.objects.get(name="Student"))
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.get(f"{URL}?term=Fall2024")
+        assert response.status_code == 403
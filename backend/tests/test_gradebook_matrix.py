@@ -0,0 +1,166 @@
+"""Tests for the section gradebook matrix"""
+
+import pytest
+from django.contrib.auth.models import Group, User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from sims_backend.academics.models import Course, Program, Section
+from sims_backend.admissions.models import Student
+from sims_backend.assessments.gradebook import build_gradebook
+from sims_backend.assessments.models import Assessment, AssessmentScore
+from sims_backend.enrollment.models import Enrollment
+from sims_backend.results.grading import scale_for_section
+from sims_backend.results.models import Result
+from sims_backend.results.utils import calculate_final_grade
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    user = User.objects.create_user(
+        username="testuser", password="testpass", is_staff=True, is_superuser=True
+    )
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def faculty():
+    user = User.objects.create_user(username="faculty", password="pass")
+    user.groups.add(Group.objects.get_or_create(name="Faculty")[0])
+    return user
+
+
+@pytest.fixture
+def section(faculty):
+    program = Program.objects.create(name="Computer Science")
+    course = Course.objects.create(
+        code="CS101", title="Intro to CS", credits=3, program=program
+    )
+    section = Section.objects.create(course=course, term="Fall2024", teacher=faculty)
+    other = Section.objects.create(course=course, term="Spring2025", teacher=None)
+
+    midterm = Assessment.objects.create(section=section, type="Midterm", weight=40)
+    final = Assessment.objects.create(section=section, type="Final", weight=60)
+    elsewhere = Assessment.objects.create(section=other, type="Quiz", weight=10)
+
+    alice = Student.objects.create(
+        reg_no="2024001", name="Alice", program="CS", status="active"
+    )
+    bob = Student.objects.create(
+        reg_no="2024002", name="Bob", program="CS", status="active"
+    )
+    dropped = Student.objects.create(
+        reg_no="2024003", name="Dropped", program="CS", status="active"
+    )
+    Enrollment.objects.create(student=alice, section=section)
+    Enrollment.objects.create(student=bob, section=section)
+    Enrollment.objects.create(student=dropped, section=section, status="dropped")
+    Enrollment.objects.create(student=alice, section=other)
+
+    AssessmentScore.objects.create(
+        assessment=midterm, student=alice, score=18, max_score=20
+    )
+    AssessmentScore.objects.create(assessment=final, student=alice, score=90)
+    AssessmentScore.objects.create(assessment=final, student=bob, score=50)
+    AssessmentScore.objects.create(assessment=elsewhere, student=alice, score=1)
+    Result.objects.create(student=alice, section=section, final_grade="A+")
+    return section
+
+
+@pytest.mark.django_db
+class TestGradebookMatrix:
+    def test_matrix_layout(self, api_client, section):
+        response = api_client.get(f"/api/sections/{section.id}/gradebook/")
+
+        assert response.status_code == 200
+        data = response.data
+        assert data["assessments"]["type"] == ["Midterm", "Final"]
+        assert data["assessments"]["weight"] == [40, 60]
+        assert data["students"]["reg_no"] == ["2024001", "2024002"]
+        assert data["scores"] == [[18, 90], [None, 50]]
+        assert data["max_scores"] == [[20, 100], [None, 100]]
+        assert data["total"] == [90.0, 30.0]
+        assert data["grade"] == ["A+", "F"]
+        assert data["final_grade"] == ["A+", None]
+        assert data["result_state"] == ["draft", None]
+
+    def test_totals_match_single_student_calculation(self, section):
+        gradebook = build_gradebook(section)
+        for student_id, total in zip(
+            gradebook["students"]["id"], gradebook["total"], strict=True
+        ):
+            expected = calculate_final_grade(student_id, section.id)["percentage"]
+            assert total == expected
+
+    def test_grades_match_single_student_calculation(self, section):
+        alice = Student.objects.get(reg_no="2024001")
+        AssessmentScore.objects.filter(student=alice).update(score=0)
+        AssessmentScore.objects.filter(student=alice, max_score=100).update(
+            score=89.996
+        )
+        AssessmentScore.objects.filter(student=alice, max_score=20).update(
+            score=17.9992
+        )
+
+        gradebook = build_gradebook(section)
+
+        expected = calculate_final_grade(alice.id, section.id)
+        assert gradebook["total"][0] == expected["percentage"] == 90.0
+        assert gradebook["grade"][0] == expected["grade"] == "A"
+
+    def test_matrix_uses_two_queries(self, section):
+        for i in range(20):
+            student = Student.objects.create(
+                reg_no=f"2025{i:03d}", name=f"Student {i}", program="CS", status="a"
+            )
+            Enrollment.objects.create(student=student, section=section)
+        # Grading scales are compiled once per process, not per request.
+        scale_for_section(section)
+
+        with CaptureQueriesContext(connection) as ctx:
+            gradebook = build_gradebook(section)
+
+        assert len(gradebook["students"]["id"]) == 22
+        assert len(ctx.captured_queries) == 2
+
+    def test_empty_section(self, api_client, section):
+        empty = Section.objects.create(
+            course=section.course, term="Summer2025", teacher=None
+        )
+        response = api_client.get(f"/api/sections/{empty.id}/gradebook/")
+        assert response.data["scores"] == []
+        assert response.data["assessments"]["id"] == []
+
+    def test_enrolled_students_without_assessments(self, section):
+        empty = Section.objects.create(
+            course=section.course, term="Summer2025", teacher=None
+        )
+        student = Student.objects.get(reg_no="2024001")
+        Enrollment.objects.create(student=student, section=empty)
+
+        gradebook = build_gradebook(empty)
+
+        assert gradebook["students"]["id"] == [student.id]
+        assert gradebook["scores"] == [[]]
+        assert gradebook["total"] == [0.0]
+
+
+@pytest.mark.django_db
+class TestGradebookPermissions:
+    def test_teacher_can_view(self, faculty, section):
+        client = APIClient()
+        client.force_authenticate(user=faculty)
+        response = client.get(f"/api/sections/{section.id}/gradebook/")
+        assert response.status_code == 200
+
+    def test_students_cannot_view(self, section):
+        user = User.objects.create_user(username="2024001", password="pass")
+        user.groups.add(Group.objects.get(name="Student"))
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.get(f"/api/sections/{section.id}/gradebook/")
+        assert response.status_code == 403
@@ -0,0 +1,286 @@
+"""Tests for bulk assessment score upload and result recompute"""
+
+from unittest import mock
+
+import pytest
+from django.contrib.auth.models import Group, User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from sims_backend.academics.models import Course, Program, Section
+from sims_backend.admissions.models import Student
+from sims_backend.assessments.models import Assessment, AssessmentScore
+from sims_backend.enrollment.models import Enrollment
+from sims_backend.results.models import DirtyResult, Result
+from sims_backend.results.utils import recompute_results
+
+URL = "/api/assessment-scores/bulk/"
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    user = User.objects.create_user(
+        username="testuser", password="testpass", is_staff=True, is_superuser=True
+    )
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def faculty():
+    user = User.objects.create_user(username="faculty", password="pass")
+    user.groups.add(Group.objects.get_or_create(name="Faculty")[0])
+    return user
+
+
+@pytest.fixture
+def gradebook(faculty):
+    program = Program.objects.create(name="Computer Science")
+    course = Course.objects.create(
+        code="CS101", title="Intro to CS", credits=3, program=program
+    )
+    section = Section.objects.create(course=course, term="Fall2024", teacher=faculty)
+    other = Section.objects.create(course=course, term="Spring2025", teacher=None)
+    students = []
+    for i in range(3):
+        student = Student.objects.create(
+            reg_no=f"2024{i:03d}", name=f"Student {i}", program="CS", status="active"
+        )
+        Enrollment.objects.create(student=student, section=section)
+        students.append(student)
+    midterm = Assessment.objects.create(section=section, type="Midterm", weight=40)
+    final = Assessment.objects.create(section=section, type="Final", weight=60)
+    foreign = Assessment.objects.create(section=other, type="Quiz", weight=10)
+    return {
+        "section": section,
+        "students": students,
+        "midterm": midterm,
+        "final": final,
+        "foreign": foreign,
+    }
+
+
+def _matrix(gradebook, scores, **extra):
+    return {
+        "section": gradebook["section"].id,
+        "assessments": [gradebook["midterm"].id, gradebook["final"].id],
+        "students": [student.id for student in gradebook["students"]],
+        "scores": scores,
+        **extra,
+    }
+
+
+@pytest.mark.django_db
+class TestJsonUpload:
+    def test_upserts_matrix(self, api_client, gradebook):
+        midterm = gradebook["midterm"]
+        first = gradebook["students"][0]
+        AssessmentScore.objects.create(
+            assessment=midterm, student=first, score=5, max_score=50
+        )
+
+        response = api_client.post(
+            URL,
+            _matrix(gradebook, [[45, 80], [30, None], [None, None]]),
+            format="json",
+        )
+
+        assert response.status_code == 200
+        assert response.data["students"] == 2
+        assert AssessmentScore.objects.count() == 3
+        updated = AssessmentScore.objects.get(assessment=midterm, student=first)
+        # The stored max score is kept when none is sent.
+        assert (updated.score, updated.max_score) == (45, 50)
+
+    def test_max_scores_apply_per_column(self, api_client, gradebook):
+        response = api_client.post(
+            URL,
+            _matrix(gradebook, [[18, 27], [20, 30], [0, 0]], max_scores=[20, 30]),
+            format="json",
+        )
+
+        assert response.status_code == 200
+        assert set(
+            AssessmentScore.objects.filter(assessment=gradebook["final"]).values_list(
+                "max_score", flat=True
+            )
+        ) == {30}
+
+    def test_invalid_cells_reject_whole_upload(self, api_client, gradebook):
+        response = api_client.post(
+            URL, _matrix(gradebook, [[45, 80], [130, 50], [-1, 50]]), format="json"
+        )
+
+        assert response.status_code == 400
+        details = response.data["error"]["details"]
+        assert [(d["row"], d["column"]) for d in details] == [(1, 0), (2, 0)]
+        assert AssessmentScore.objects.count() == 0
+
+    def test_rejects_unenrolled_students_and_foreign_assessments(
+        self, api_client, gradebook
+    ):
+        outsider = Student.objects.create(
+            reg_no="2024999", name="Outsider", program="CS", status="active"
+        )
+        payload = {
+            "section": gradebook["section"].id,
+            "assessments": [gradebook["midterm"].id, gradebook["foreign"].id],
+            "students": [gradebook["students"][0].id, outsider.id],
+            "scores": [[10, 10], [10, 10]],
+        }
+
+        response = api_client.post(URL, payload, format="json")
+
+        assert response.status_code == 400
+        errors = [d["error"] for d in response.data["error"]["details"]]
+        assert "Assessment does not belong to this section." in errors
+        assert "Student is not enrolled in this section." in errors
+        assert AssessmentScore.objects.count() == 0
+
+    def test_malformed_matrix(self, api_client, gradebook):
+        response = api_client.post(URL, _matrix(gradebook, [[1, 2]]), format="json")
+        assert response.status_code == 400
+        assert response.data["error"]["message"] == (
+            "scores must have one row per student."
+        )
+
+    def test_query_count_does_not_grow_with_rows(self, api_client, gradebook):
+        section = gradebook["section"]
+        for i in range(3, 30):
+            student = Student.objects.create(
+                reg_no=f"2024{i:03d}", name=f"Student {i}", program="CS", status="a"
+            )
+            Enrollment.objects.create(student=student, section=section)
+        students = list(Student.objects.order_by("id"))
+        payload = {
+            "section": section.id,
+            "assessments": [gradebook["midterm"].id, gradebook["final"].id],
+            "students": [student.id for student in students],
+            "scores": [[50, 50]] * len(students),
+        }
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.post(URL, payload, format="json")
+
+        assert response.status_code == 200
+        assert AssessmentScore.objects.count() == 2 * len(students)
+        score_writes = [
+            q
+            for q in ctx.captured_queries
+            if q["sql"].startswith("INSERT")
+            and "assessments_assessmentscore" in q["sql"]
+        ]
+        assert len(score_writes) == 1
+
+
+@pytest.mark.django_db
+class TestCsvUpload:
+    def test_csv_by_reg_no(self, api_client, gradebook):
+        midterm, final = gradebook["midterm"].id, gradebook["final"].id
+        content = f"reg_no,{midterm},{final}\n2024000,18,\n2024001,20,25\n"
+        upload = SimpleUploadedFile("marks.csv", content.encode(), "text/csv")
+
+        response = api_client.post(
+            URL,
+            {"section": gradebook["section"].id, "file": upload, "max_scores": "20,30"},
+            format="multipart",
+        )
+
+        assert response.status_code == 200
+        assert AssessmentScore.objects.count() == 3
+        assert (
+            AssessmentScore.objects.get(
+                assessment_id=final, student__reg_no="2024001"
+            ).max_score
+            == 30
+        )
+
+    def test_csv_requires_reg_no_column(self, api_client, gradebook):
+        upload = SimpleUploadedFile("marks.csv", b"id,1\n1,2\n", "text/csv")
+        response = api_client.post(
+            URL,
+            {"section": gradebook["section"].id, "file": upload},
+            format="multipart",
+        )
+        assert response.status_code == 400
+
+
+@pytest.mark.django_db
+class TestUploadPermissions:
+    def test_section_teacher_can_upload(self, faculty, gradebook):
+        client = APIClient()
+        client.force_authenticate(user=faculty)
+        response = client.post(
+            URL, _matrix(gradebook, [[1, 1], [1, 1], [1, 1]]), format="json"
+        )
+        assert response.status_code == 200
+
+    def test_other_faculty_cannot_upload(self, gradebook):
+        other = User.objects.create_user(username="other", password="pass")
+        other.groups.add(Group.objects.get_or_create(name="Faculty")[0])
+        client = APIClient()
+        client.force_authenticate(user=other)
+
+        response = client.post(
+            URL, _matrix(gradebook, [[1, 1], [1, 1], [1, 1]]), format="json"
+        )
+        assert response.status_code == 403
+
+    def test_missing_section(self, api_client):
+        response = api_client.post(URL, {"section": 999999}, format="json")
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+class TestRecompute:
+    def test_upload_enqueues_recompute(self, api_client, gradebook):
+        DirtyResult.objects.all().delete()
+        queue = mock.Mock()
+        queue.enqueue.return_value.id = "job-1"
+        with mock.patch("django_rq.get_queue", return_value=queue):
+            response = api_client.post(
+                URL,
+                _matrix(
+                    gradebook, [[40, 60], [None, None], [None, None]], recompute=True
+                ),
+                format="json",
+            )
+
+        assert response.data["recompute_job_id"] == "job-1"
+        _, section_id = queue.enqueue.call_args.args
+        assert section_id == gradebook["section"].id
+        assert list(DirtyResult.objects.values_list("student_id", flat=True)) == [
+            gradebook["students"][0].id
+        ]
+
+    def test_recompute_updates_drafts_only(self, gradebook):
+        first, second, third = gradebook["students"]
+        section = gradebook["section"]
+        for student in (first, second, third):
+            AssessmentScore.objects.create(
+                assessment=gradebook["midterm"], student=student, score=100
+            )
+            AssessmentScore.objects.create(
+                assessment=gradebook["final"], student=student, score=90
+            )
+        Result.objects.create(student=first, section=section, final_grade="F")
+        Result.objects.create(
+            student=second,
+            section=section,
+            final_grade="C",
+            state="published",
+            is_published=True,
+        )
+
+        counts = recompute_results(section.id)
+
+        assert counts == {"created": 1, "updated": 1, "skipped": 1}
+        grades = dict(
+            Result.objects.filter(section=section).values_list(
+                "student_id", "final_grade"
+            )
+        )
+        assert grades == {first.id: "A+", second.id: "C", third.id: "A+"}
@@ -0,0 +1,204 @@
+"""Tests for configurable grading scales"""
+
+from unittest import mock
+
+import pytest
+from django.contrib.auth.models import Group, User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from sims_backend.academics.models import Course, Program, Section
+from sims_backend.admissions.models import Student
+from sims_backend.assessments.models import Assessment, AssessmentScore
+from sims_backend.enrollment.models import Enrollment
+from sims_backend.results.grading import (
+    DEFAULT_SCALE,
+    compile_scale,
+    get_scale,
+    scale_for_section,
+)
+from sims_backend.results.models import GradeBoundary, GradingScale, Result
+from sims_backend.results.utils import calculate_grade, recompute_results
+
+URL = "/api/grading-scales/"
+
+PASS_FAIL = [
+    {"grade": "P", "min_percentage": 50},
+    {"grade": "F", "min_percentage": 0},
+]
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    user = User.objects.create_user(
+        username="testuser", password="testpass", is_staff=True, is_superuser=True
+    )
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def program():
+    return Program.objects.create(name="Computer Science")
+
+
+def _create_scale(name, boundaries, program=None, term=""):
+    scale = GradingScale.objects.create(name=name, program=program, term=term)
+    for boundary in boundaries:
+        GradeBoundary.objects.create(scale=scale, **boundary)
+    return scale
+
+
+class TestCompiledScale:
+    @pytest.mark.parametrize(
+        ("percentage", "grade"),
+        [(100, "A+"), (90, "A+"), (89.99, "A"), (60, "D"), (59.9, "F"), (0, "F")],
+    )
+    def test_default_scale_matches_previous_ladder(self, percentage, grade):
+        assert DEFAULT_SCALE.grade(percentage) == grade
+
+    def test_grade_many(self):
+        scale = compile_scale([(0, "F"), (50, "P")])
+        assert scale.grade_many([10, 50, 75.5, -1]) == ["F", "P", "P", "F"]
+
+    def test_empty_scale_is_rejected(self):
+        with pytest.raises(ValueError):
+            compile_scale([])
+
+
+@pytest.mark.django_db
+class TestScaleResolution:
+    def test_falls_back_to_default(self, program):
+        assert get_scale(program.id, "Fall2024") is DEFAULT_SCALE
+        assert calculate_grade(95) == "A+"
+
+    def test_most_specific_scale_wins(self, program):
+        _create_scale("Institution", PASS_FAIL)
+        _create_scale(
+            "CS",
+            [{"grade": "S", "min_percentage": 40}, {"grade": "U", "min_percentage": 0}],
+            program=program,
+        )
+        _create_scale(
+            "CS Fall",
+            [{"grade": "H", "min_percentage": 80}, {"grade": "N", "min_percentage": 0}],
+            program=program,
+            term="Fall2024",
+        )
+
+        assert get_scale(program.id, "Fall2024").grade(85) == "H"
+        assert get_scale(program.id, "Spring2025").grade(45) == "S"
+        assert get_scale(None, "Fall2024").grade(55) == "P"
+        assert calculate_grade(55) == "P"
+
+    def test_compiled_once_and_invalidated_on_edit(self, program):
+        scale = _create_scale("CS", PASS_FAIL, program=program)
+        get_scale(program.id)
+
+        with CaptureQueriesContext(connection) as ctx:
+            for _ in range(10):
+                get_scale(program.id)
+        assert len(ctx.captured_queries) == 0
+
+        boundary = GradeBoundary.objects.get(scale=scale, grade="P")
+        boundary.min_percentage = 70
+        boundary.save()
+        assert get_scale(program.id).grade(60) == "F"
+
+    def test_cache_outage_keeps_compiled_scales(self, program):
+        _create_scale("CS", PASS_FAIL, program=program)
+        get_scale(program.id)
+
+        with (
+            mock.patch.object(cache, "get_or_set", side_effect=ConnectionError),
+            CaptureQueriesContext(connection) as ctx,
+        ):
+            for _ in range(10):
+                assert get_scale(program.id).grade(55) == "P"
+        assert len(ctx.captured_queries) == 0
+
+    def test_recompute_uses_section_scale(self, program):
+        course = Course.objects.create(
+            code="CS101", title="Intro", credits=3, program=program
+        )
+        section = Section.objects.create(course=course, term="Fall2024", teacher=None)
+        assessment = Assessment.objects.create(
+            section=section, type="Final", weight=100
+        )
+        student = Student.objects.create(
+            reg_no="2024001", name="Alice", program="CS", status="active"
+        )
+        Enrollment.objects.create(student=student, section=section)
+        AssessmentScore.objects.create(assessment=assessment, student=student, score=55)
+        _create_scale("CS", PASS_FAIL, program=program)
+
+        recompute_results(section.id)
+
+        assert scale_for_section(section.id).grade(55) == "P"
+        assert Result.objects.get(student=student).final_grade == "P"
+
+
+@pytest.mark.django_db
+class TestGradingScaleEndpoint:
+    def test_create_and_update(self, api_client, program):
+        response = api_client.post(
+            URL,
+            {"name": "CS", "program": program.id, "boundaries": PASS_FAIL},
+            format="json",
+        )
+        assert response.status_code == 201
+        assert get_scale(program.id).grade(50) == "P"
+
+        response = api_client.patch(
+            f"{URL}{response.data['id']}/",
+            {
+                "boundaries": [
+                    {"grade": "P", "min_percentage": 60},
+                    {"grade": "F", "min_percentage": 0},
+                ]
+            },
+            format="json",
+        )
+        assert response.status_code == 200
+        assert get_scale(program.id).grade(50) == "F"
+
+    @pytest.mark.parametrize(
+        "boundaries",
+        [
+            [],
+            [{"grade": "P", "min_percentage": 50}],
+            [{"grade": "P", "min_percentage": 0}, {"grade": "P", "min_percentage": 50}],
+            [
+                {"grade": "F", "min_percentage": 0},
+                {"grade": "P", "min_percentage": 150},
+            ],
+        ],
+    )
+    def test_rejects_invalid_boundaries(self, api_client, boundaries):
+        response = api_client.post(
+            URL, {"name": "Bad", "boundaries": boundaries}, format="json"
+        )
+        assert response.status_code == 400
+
+    def test_rejects_duplicate_scope(self, api_client, program):
+        _create_scale("CS", PASS_FAIL, program=program)
+        response = api_client.post(
+            URL,
+            {"name": "CS 2", "program": program.id, "boundaries": PASS_FAIL},
+            format="json",
+        )
+        assert response.status_code == 400
+
+    def test_students_cannot_edit(self):
+        user = User.objects.create_user(username="2024001", password="pass")
+        user.groups.add(Group.objects.get(name="Student"))
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.post(
+            URL, {"name": "Mine", "boundaries": PASS_FAIL}, format="json"
+        )
+        assert response.status_code == 403
@@ -0,0 +1,251 @@
+"""Tests for Idempotency-Key handling on retried POST endpoints"""
+
+import threading
+from unittest import mock
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core import idempotency
+from sims_backend.academics.models import Course, Program, Section
+from sims_backend.admissions.models import Student
+from sims_backend.enrollment.models import Enrollment
+from sims_backend.results.models import PendingChange, Result
+
+
+def _client(username):
+    client = APIClient()
+    user = User.objects.create_user(
+        username=username, password="testpass", is_staff=True, is_superuser=True
+    )
+    client.force_authenticate(user=user)
+    client.user = user
+    return client
+
+
+@pytest.fixture
+def api_client(db):
+    return _client("testuser")
+
+
+@pytest.fixture
+def sample_data(db):
+    program = Program.objects.create(name="Computer Science")
+    course = Course.objects.create(
+        code="CS101", title="Intro to CS", credits=3, program=program
+    )
+    section = Section.objects.create(
+        course=course, term="Fall2024", teacher=None, teacher_name="Dr. Smith"
+    )
+    student = Student.objects.create(
+        reg_no="2024001", name="John Doe", program="CS", status="active"
+    )
+    return {"section": section, "student": student}
+
+
+def _enroll(client, sample_data, key=None, student_id=None):
+    headers = {"Idempotency-Key": key} if key else {}
+    return client.post(
+        f"/api/sections/{sample_data['section'].id}/enroll/",
+        {"student_id": student_id or sample_data["student"].id},
+        format="json",
+        headers=headers,
+    )
+
+
+def _enqueue(client, student, key, queue):
+    with mock.patch("django_rq.get_queue", return_value=queue):
+        return client.post(
+            "/api/transcripts/enqueue/",
+            {"student_id": student.id},
+            format="json",
+            headers={"Idempotency-Key": key},
+        )
+
+
+def _queue():
+    queue = mock.Mock()
+    queue.enqueue.side_effect = [mock.Mock(id=f"job-{i}") for i in range(5)]
+    return queue
+
+
+@pytest.mark.django_db
+class TestIdempotentEnrollment:
+    def test_retry_replays_the_first_response(self, api_client, sample_data):
+        first = _enroll(api_client, sample_data, key="abc")
+        retry = _enroll(api_client, sample_data, key="abc")
+
+        assert first.status_code == 201
+        assert retry.status_code == 201
+        assert retry.data == first.data
+        assert retry["Idempotent-Replayed"] == "true"
+        assert not first.has_header("Idempotent-Replayed")
+        assert Enrollment.objects.count() == 1
+
+    def test_without_key_a_retry_conflicts(self, api_client, sample_data):
+        assert _enroll(api_client, sample_data).status_code == 201
+        assert _enroll(api_client, sample_data).status_code == 409
+
+    def test_key_reused_for_another_body_is_rejected(self, api_client, sample_data):
+        other = Student.objects.create(
+            reg_no="2024002", name="Jane Doe", program="CS", status="active"
+        )
+        _enroll(api_client, sample_data, key="abc")
+        response = _enroll(api_client, sample_data, key="abc", student_id=other.id)
+
+        assert response.status_code == 422
+        assert response.data["error"]["code"] == 422
+        assert Enrollment.objects.count() == 1
+
+    def test_overlong_key_is_rejected(self, api_client, sample_data):
+        response = _enroll(api_client, sample_data, key="k" * 256)
+
+        assert response.status_code == 400
+        assert Enrollment.objects.count() == 0
+
+    def test_client_errors_are_replayed(self, api_client, sample_data):
+        first = _enroll(api_client, sample_data, key="abc", student_id=99999)
+        Student.objects.create(
+            id=99999, reg_no="2024009", name="Late", program="CS", status="active"
+        )
+        retry = _enroll(api_client, sample_data, key="abc", student_id=99999)
+
+        assert first.status_code == retry.status_code == 404
+        assert Enrollment.objects.count() == 0
+
+    def test_cache_outage_runs_the_view(self, api_client, sample_data):
+        with mock.patch.object(cache, "add", side_effect=ConnectionError):
+            response = _enroll(api_client, sample_data, key="abc")
+
+        assert response.status_code == 201
+        assert Enrollment.objects.count() == 1
+
+
+@pytest.mark.django_db
+class TestIdempotentTranscriptJobs:
+    def test_retry_does_not_enqueue_twice(self, api_client, sample_data):
+        queue = _queue()
+        first = _enqueue(api_client, sample_data["student"], "abc", queue)
+        retry = _enqueue(api_client, sample_data["student"], "abc", queue)
+
+        assert first.status_code == retry.status_code == 202
+        assert retry.data["job_id"] == first.data["job_id"] == "job-0"
+        assert queue.enqueue.call_count == 1
+
+    def test_keys_are_scoped_to_the_user(self, api_client, sample_data):
+        queue = _queue()
+        _enqueue(api_client, sample_data["student"], "abc", queue)
+        other = _enqueue(_client("other"), sample_data["student"], "abc", queue)
+
+        assert other.data["job_id"] == "job-1"
+        assert not other.has_header("Idempotent-Replayed")
+
+    def test_failed_request_releases_the_key(self, api_client, sample_data):
+        queue = mock.Mock()
+        queue.enqueue.side_effect = [RuntimeError("redis down"), mock.Mock(id="job-1")]
+        api_client.raise_request_exception = False
+
+        failed = _enqueue(api_client, sample_data["student"], "abc", queue)
+        retry = _enqueue(api_client, sample_data["student"], "abc", queue)
+
+        assert failed.status_code == 500
+        assert retry.status_code == 202
+        assert retry.data["job_id"] == "job-1"
+
+    def test_duplicate_waits_for_the_request_in_flight(
+        self, api_client, sample_data, settings
+    ):
+        settings.IDEMPOTENCY_WAIT_SECONDS = 5
+        student = sample_data["student"]
+        key = idempotency.cache_key(
+            api_client.user.pk, "enqueue_transcript_generation", "abc"
+        )
+        fingerprint = idempotency.fingerprint(
+            "/api/transcripts/enqueue/", {"student_id": student.id}
+        )
+        cache.set(key, {"state": idempotency.IN_FLIGHT, "fingerprint": fingerprint})
+        done = {
+            "state": "done",
+            "fingerprint": fingerprint,
+            "status": 202,
+            "data": {"job_id": "job-first"},
+        }
+        timer = threading.Timer(0.2, cache.set, (key, done))
+        timer.start()
+
+        queue = _queue()
+        response = _enqueue(api_client, student, "abc", queue)
+        timer.join()
+
+        assert response.status_code == 202
+        assert response.data == {"job_id": "job-first"}
+        assert queue.enqueue.call_count == 0
+
+    def test_duplicate_gives_up_waiting(self, api_client, sample_data, settings):
+        settings.IDEMPOTENCY_WAIT_SECONDS = 0.1
+        student = sample_data["student"]
+        key = idempotency.cache_key(
+            api_client.user.pk, "enqueue_transcript_generation", "abc"
+        )
+        fingerprint = idempotency.fingerprint(
+            "/api/transcripts/enqueue/", {"student_id": student.id}
+        )
+        cache.set(key, {"state": idempotency.IN_FLIGHT, "fingerprint": fingerprint})
+
+        queue = _queue()
+        response = _enqueue(api_client, student, "abc", queue)
+
+        assert response.status_code == 409
+        assert response["Retry-After"] == "1"
+        assert queue.enqueue.call_count == 0
+
+
+@pytest.mark.django_db
+class TestIdempotentResultActions:
+    def test_publish_retry_replays_success(self, api_client, sample_data):
+        result = Result.objects.create(
+            student=sample_data["student"],
+            section=sample_data["section"],
+            final_grade="B+",
+        )
+        body = {"result_id": result.id, "published_by": "registrar@university.edu"}
+
+        first = api_client.post(
+            "/api/results/publish/",
+            body,
+            format="json",
+            headers={"Idempotency-Key": "abc"},
+        )
+        retry = api_client.post(
+            "/api/results/publish/",
+            body,
+            format="json",
+            headers={"Idempotency-Key": "abc"},
+        )
+
+        assert first.status_code == retry.status_code == 200
+        assert retry["Idempotent-Replayed"] == "true"
+
+    def test_change_request_retry_creates_one_change(self, api_client, sample_data):
+        result = Result.objects.create(
+            student=sample_data["student"],
+            section=sample_data["section"],
+            final_grade="B+",
+            is_published=True,
+            published_at=timezone.now(),
+        )
+        body = {"result_id": result.id, "new_grade": "A-", "reason": "Regrade"}
+
+        for _ in range(2):
+            response = api_client.post(
+                "/api/results/change-request/",
+                body,
+                format="json",
+                headers={"Idempotency-Key": "abc"},
+            )
+            assert response.status_code == 201
+
+        assert PendingChange.objects.count() == 1
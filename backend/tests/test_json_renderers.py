@@ -0,0 +1,138 @@
+"""Tests for the orjson renderer/parser pair and the JSON benchmark"""
+
+import datetime
+import decimal
+import io
+import json
+import os
+import subprocess
+import sys
+import uuid
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.conf import settings as django_settings
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+from core.renderers import ORJSONParser, ORJSONRenderer
+
+PAYLOAD = ReturnDict(
+    {
+        "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "timestamp": datetime.datetime(2026, 10, 19, 9, 30, 5, 123456, datetime.UTC),
+        "local": datetime.datetime(
+            2026, 10, 19, 9, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=5))
+        ),
+        "naive": datetime.datetime(2026, 10, 19, 9, 30),
+        "date": datetime.date(2026, 10, 19),
+        "time": datetime.time(8, 15, 0, 500),
+        "duration": datetime.timedelta(minutes=90),
+        "gpa": decimal.Decimal("3.75"),
+        "grade_points": "3.70",
+        "label": gettext_lazy("Present"),
+        "name": "Zaïnab\u2028Ahmed",
+        "scores": ReturnList([1, 2.5, None, True], serializer=None),
+        "by_id": {1: "a", 2: "b"},
+    },
+    serializer=None,
+)
+
+
+def test_renderer_output_matches_drf():
+    assert ORJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+
+
+def test_renderer_escapes_line_separators():
+    assert b"\\u2028" in ORJSONRenderer().render(PAYLOAD)
+
+
+def test_renderer_indents_like_drf():
+    rendered = ORJSONRenderer().render(PAYLOAD, "application/json; indent=4")
+    assert rendered == JSONRenderer().render(PAYLOAD, "application/json; indent=4")
+    assert ORJSONRenderer().render(None) == b""
+
+
+def test_renderer_falls_back_for_wide_integers():
+    data = {"big": 2**70}
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_without_orjson_behaves_like_drf():
+    with mock.patch("core.renderers.orjson", None):
+        assert ORJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+        assert ORJSONParser().parse(io.BytesIO(b'{"a": [1]}')) == {"a": [1]}
+
+
+def test_parser_round_trip():
+    content = JSONRenderer().render(PAYLOAD)
+    parsed = ORJSONParser().parse(io.BytesIO(content))
+    assert parsed == JSONParser().parse(io.BytesIO(content))
+    assert parsed["by_id"] == {"1": "a", "2": "b"}
+
+
+@pytest.mark.parametrize("content", [b'{"a": ', b'{"a": NaN}', b"\xff"])
+def test_parser_errors_match_drf(content):
+    with pytest.raises(ParseError) as expected:
+        JSONParser().parse(io.BytesIO(content))
+    with pytest.raises(ParseError) as actual:
+        ORJSONParser().parse(io.BytesIO(content))
+    assert str(actual.value.detail) == str(expected.value.detail)
+
+
+def _rest_framework_classes(backend):
+    code = (
+        "import django; django.setup()\n"
+        "from rest_framework.settings import api_settings as s\n"
+        "print(s.DEFAULT_RENDERER_CLASSES[0].__name__,"
+        " s.DEFAULT_PARSER_CLASSES[0].__name__)"
+    )
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": django_settings.SETTINGS_MODULE,
+        "API_JSON_BACKEND": backend,
+    }
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=django_settings.BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_api_json_backend_setting():
+    assert _rest_framework_classes("orjson").stdout.split() == [
+        "ORJSONRenderer",
+        "ORJSONParser",
+    ]
+    assert _rest_framework_classes("stdlib").stdout.split() == [
+        "JSONRenderer",
+        "JSONParser",
+    ]
+    assert "ImproperlyConfigured" in _rest_framework_classes("ujson").stderr
+
+
+@pytest.mark.django_db
+def test_bench_json_command():
+    call_command("seed_demo", "--students", "5", stdout=StringIO())
+    out = StringIO()
+    call_command("bench_json", "--rows", "20", "--repeat", "1", "--json", stdout=out)
+
+    report = json.loads(out.getvalue())
+    payloads = {row["payload"]: row for row in report["payloads"]}
+    assert {"attendance", "gradebook"} <= payloads.keys()
+    assert all(row["identical"] for row in report["payloads"])
+    assert all(row["render_orjson"] > 0 for row in report["payloads"])
+
+
+@pytest.mark.django_db
+def test_bench_json_requires_data():
+    with pytest.raises(CommandError):
+        call_command("bench_json", stdout=StringIO())
@@ -0,0 +1,110 @@
+"""Tests for read-replica routing and read-your-writes pinning"""
+
+from unittest import mock
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import OperationalError, transaction
+from django.test import RequestFactory
+from rest_framework.test import APIClient
+
+from core import replicas
+from core.db import replica_databases
+from core.replicas import PIN_COOKIE, ReplicaRouter, is_pinned, use_replica
+from sims_backend.admissions.models import Student
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    user = User.objects.create_user(
+        username="testuser", password="testpass", is_staff=True, is_superuser=True
+    )
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def reset_replica_health():
+    replicas._unavailable.clear()
+    yield
+    replicas._unavailable.clear()
+
+
+def test_replica_databases_copy_the_primary():
+    default = {"HOST": "db", "PORT": "5432", "NAME": "sims_db", "OPTIONS": {}}
+
+    databases = replica_databases(
+        default, {"DB_REPLICA_HOSTS": "replica-a, replica-b:6432"}
+    )
+
+    assert list(databases) == ["replica_1", "replica_2"]
+    assert databases["replica_1"]["HOST"] == "replica-a"
+    assert databases["replica_1"]["NAME"] == "sims_db"
+    assert databases["replica_2"]["PORT"] == "6432"
+    assert databases["replica_2"]["OPTIONS"] is not default["OPTIONS"]
+    assert replica_databases(default, {}) == {}
+
+
+class TestRouter:
+    def test_reads_use_the_active_replica(self):
+        router = ReplicaRouter()
+        with mock.patch("core.replicas.pick_replica", return_value="replica_1"):
+            with use_replica():
+                assert router.db_for_read(Student) == "replica_1"
+                assert router.db_for_write(Student) == "default"
+        assert router.db_for_read(Student) is None
+
+    @pytest.mark.django_db
+    def test_transactions_read_the_primary(self):
+        with mock.patch("core.replicas.pick_replica", return_value="replica_1"):
+            with use_replica(), transaction.atomic():
+                assert ReplicaRouter().db_for_read(Student) is None
+
+    def test_unsafe_and_pinned_requests_stay_on_the_primary(self):
+        factory = RequestFactory()
+        pinned = factory.get("/")
+        pinned.COOKIES[PIN_COOKIE] = "1"
+        with mock.patch("core.replicas.pick_replica", return_value="replica_1"):
+            for request in (factory.post("/"), pinned):
+                with use_replica(request) as alias:
+                    assert alias is None
+
+    def test_unreachable_replica_falls_back_to_the_primary(self):
+        replica = mock.Mock()
+        replica.ensure_connection.side_effect = OperationalError
+        with (
+            mock.patch("core.replicas.replica_aliases", return_value=["replica_1"]),
+            mock.patch("core.replicas.connections", {"replica_1": replica}),
+        ):
+            assert replicas.pick_replica() is None
+            assert replicas.pick_replica() is None
+
+        # The failed replica is not retried until the retry window passes.
+        assert replica.ensure_connection.call_count == 1
+
+
+@pytest.mark.django_db
+class TestPinning:
+    def test_write_pins_the_client(self, api_client):
+        with mock.patch("core.replicas.replica_aliases", return_value=["replica_1"]):
+            response = api_client.post("/api/programs/", {"name": "Physics"})
+
+        assert response.status_code == 201
+        assert PIN_COOKIE in response.cookies
+        request = RequestFactory().get("/")
+        request.user = User.objects.get(username="testuser")
+        assert is_pinned(request)
+
+    def test_no_pin_without_replicas(self, api_client):
+        response = api_client.post("/api/programs/", {"name": "Physics"})
+        assert PIN_COOKIE not in response.cookies
+
+    def test_designated_viewsets_read_from_replicas(self, api_client):
+        with mock.patch("core.replicas.pick_replica", return_value=None) as pick:
+            api_client.get("/api/students/")
+            assert pick.call_count == 1
+
+            api_client.cookies[PIN_COOKIE] = "1"
+            api_client.get("/api/students/")
+            assert pick.call_count == 1
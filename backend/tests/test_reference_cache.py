@@ -0,0 +1,168 @@
+"""Tests for the versioned reference-data cache"""
+
+from datetime import date
+
+import pytest
+from django.contrib.auth.models import Group, User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.cache import get_stats, get_version
+from sims_backend.academics.models import Course, Program, Term
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    user = User.objects.create_user(
+        username="testuser", password="testpass", is_staff=True, is_superuser=True
+    )
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def student_client():
+    client = APIClient()
+    user = User.objects.create_user(username="STU-0001", password="pass")
+    user.groups.add(Group.objects.get(name="Student"))
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def catalog(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        program = Program.objects.create(name="Computer Science")
+        course = Course.objects.create(
+            code="CS101", title="Intro to CS", credits=3, program=program
+        )
+        term = Term.objects.create(
+            name="Fall2024", start_date=date(2024, 9, 1), end_date=date(2024, 12, 31)
+        )
+    return {"program": program, "course": course, "term": term}
+
+
+def _catalog_queries(ctx):
+    return [
+        q
+        for q in ctx.captured_queries
+        if "academics_program" in q["sql"]
+        or "academics_course" in q["sql"]
+        or "academics_term" in q["sql"]
+    ]
+
+
+@pytest.mark.django_db
+class TestReferenceCache:
+    @pytest.mark.parametrize("url", ["/api/programs/", "/api/courses/", "/api/terms/"])
+    def test_second_read_is_served_from_cache(self, api_client, catalog, url):
+        first = api_client.get(url)
+        assert first.status_code == 200
+
+        with CaptureQueriesContext(connection) as ctx:
+            second = api_client.get(url)
+
+        assert second.status_code == 200
+        assert second.json() == first.json()
+        assert _catalog_queries(ctx) == []
+
+    def test_write_invalidates_cache(
+        self, api_client, catalog, django_capture_on_commit_callbacks
+    ):
+        api_client.get("/api/courses/")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.patch(
+                f"/api/courses/{catalog['course'].id}/",
+                {"title": "Programming I"},
+                format="json",
+            )
+        assert response.status_code == 200
+
+        response = api_client.get("/api/courses/")
+        assert response.data["results"][0]["title"] == "Programming I"
+
+    def test_program_write_invalidates_courses(
+        self, api_client, catalog, django_capture_on_commit_callbacks
+    ):
+        url = "/api/courses/?expand=program_detail"
+        api_client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            program = catalog["program"]
+            program.name = "Software Engineering"
+            program.save()
+
+        response = api_client.get(url)
+        assert response.data["results"][0]["program_detail"]["name"] == (
+            "Software Engineering"
+        )
+
+    def test_delete_invalidates_cache(
+        self, api_client, catalog, django_capture_on_commit_callbacks
+    ):
+        api_client.get("/api/terms/")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            catalog["term"].delete()
+
+        response = api_client.get("/api/terms/")
+        assert response.data["results"] == []
+
+    def test_cache_is_keyed_by_query_string(self, api_client, catalog):
+        api_client.get("/api/courses/")
+        response = api_client.get("/api/courses/?fields=id")
+        assert set(response.data["results"][0]) == {"id"}
+
+    def test_cache_is_keyed_by_role(self, api_client, student_client, catalog):
+        api_client.get("/api/programs/")
+        student_client.get("/api/programs/")
+
+        stats = get_stats(["programs"])["programs"]
+        assert stats["misses"] == 2
+        assert stats["hits"] == 0
+
+    def test_cached_etag_answers_304(self, api_client, catalog):
+        etag = api_client.get("/api/programs/")["ETag"]
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.get("/api/programs/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+        assert _catalog_queries(ctx) == []
+
+    def test_errors_are_not_cached(self, api_client, catalog):
+        assert api_client.get("/api/courses/999999/").status_code == 404
+        assert get_stats(["courses"])["courses"]["misses"] == 1
+        assert api_client.get("/api/courses/999999/").status_code == 404
+        assert get_stats(["courses"])["courses"]["misses"] == 2
+
+
+@pytest.mark.django_db
+class TestCacheStats:
+    def test_stats_report_hit_ratio(self, api_client, catalog):
+        api_client.get("/api/terms/")
+        api_client.get("/api/terms/")
+        api_client.get("/api/terms/")
+
+        response = api_client.get("/api/cache/stats/")
+
+        assert response.status_code == 200
+        assert response.data["terms"] == {"hits": 2, "misses": 1, "hit_ratio": 0.6667}
+
+    def test_stats_require_admin(self, student_client):
+        response = student_client.get("/api/cache/stats/")
+        assert response.status_code == 403
+
+
+def test_missing_version_value_starts_a_fresh_version():
+    cache.set("refdata:courses:version", None, timeout=None)
+
+    version = get_version("courses")
+
+    assert isinstance(version, int)
+    assert get_version("courses") == version
@@ -0,0 +1,202 @@
+"""Tests for dirty-marking and the debounced result recompute"""
+
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+
+from sims_backend.academics.models import Course, Program, Section
+from sims_backend.admissions.models import Student
+from sims_backend.assessments.models import Assessment, AssessmentScore
+from sims_backend.enrollment.models import Enrollment
+from sims_backend.results import curve
+from sims_backend.results.jobs import process_dirty_results
+from sims_backend.results.models import CurvePolicy, DirtyResult, Result
+from sims_backend.results.recompute import mark_dirty
+from sims_backend.results.utils import calculate_final_grade
+
+
+@pytest.fixture
+def section():
+    program = Program.objects.create(name="Computer Science")
+    course = Course.objects.create(
+        code="CS101", title="Intro to CS", credits=3, program=program
+    )
+    section = Section.objects.create(course=course, term="Fall2024", teacher=None)
+    for i in range(3):
+        student = Student.objects.create(
+            reg_no=f"2024{i:03d}", name=f"Student {i}", program="CS", status="active"
+        )
+        Enrollment.objects.create(student=student, section=section)
+    return section
+
+
+def _dirty(section):
+    return set(
+        DirtyResult.objects.filter(section_id=section.id).values_list(
+            "student_id", flat=True
+        )
+    )
+
+
+@pytest.mark.django_db
+class TestDirtyMarking:
+    def test_score_write_marks_student(self, section):
+        assessment = Assessment.objects.create(
+            section=section, type="Final", weight=100
+        )
+        DirtyResult.objects.all().delete()
+        student = Student.objects.get(reg_no="2024001")
+
+        score = AssessmentScore.objects.create(
+            assessment=assessment, student=student, score=80
+        )
+        assert _dirty(section) == {student.id}
+
+        DirtyResult.objects.all().delete()
+        score.delete()
+        assert _dirty(section) == {student.id}
+
+    def test_assessment_write_marks_section(self, section):
+        Assessment.objects.create(section=section, type="Final", weight=100)
+        assert len(_dirty(section)) == 3
+
+    def test_repeated_edits_schedule_one_job(
+        self, section, django_capture_on_commit_callbacks
+    ):
+        queue = mock.Mock()
+        with mock.patch("django_rq.get_queue", return_value=queue):
+            with django_capture_on_commit_callbacks(execute=True):
+                assessment = Assessment.objects.create(
+                    section=section, type="Final", weight=100
+                )
+                for student in Student.objects.all():
+                    AssessmentScore.objects.create(
+                        assessment=assessment, student=student, score=70
+                    )
+
+        assert queue.enqueue_in.call_count == 1
+        delay, job, section_id = queue.enqueue_in.call_args.args
+        assert delay.total_seconds() == 30
+        assert job is process_dirty_results
+        assert section_id == section.id
+        assert DirtyResult.objects.count() == 3
+
+    def test_failed_schedule_can_be_retried(
+        self, section, django_capture_on_commit_callbacks
+    ):
+        with mock.patch("django_rq.get_queue", side_effect=ConnectionError):
+            with django_capture_on_commit_callbacks(execute=True):
+                mark_dirty(section.id, [1])
+
+        queue = mock.Mock()
+        with mock.patch("django_rq.get_queue", return_value=queue):
+            with django_capture_on_commit_callbacks(execute=True):
+                mark_dirty(section.id, [1])
+        assert queue.enqueue_in.call_count == 1
+
+    def test_cache_outage_does_not_fail_the_write(
+        self, section, django_capture_on_commit_callbacks
+    ):
+        queue = mock.Mock()
+        with (
+            mock.patch("django_rq.get_queue", return_value=queue),
+            mock.patch.object(cache, "add", side_effect=ConnectionError),
+        ):
+            with django_capture_on_commit_callbacks(execute=True):
+                mark_dirty(section.id, [1])
+
+        queue.enqueue_in.assert_not_called()
+        assert DirtyResult.objects.count() == 1
+
+
+@pytest.mark.django_db
+class TestProcessDirtyResults:
+    def test_recomputes_only_dirty_students(self, section, settings):
+        settings.RESULT_RECOMPUTE_BATCH_SIZE = 1
+        assessment = Assessment.objects.create(
+            section=section, type="Final", weight=100
+        )
+        first, second, third = Student.objects.order_by("reg_no")
+        for student in (first, second, third):
+            AssessmentScore.objects.create(
+                assessment=assessment, student=student, score=95
+            )
+        DirtyResult.objects.all().delete()
+        mark_dirty(section.id, [first.id, second.id])
+
+        summary = process_dirty_results(section.id)
+
+        assert summary["created"] == 2
+        assert set(
+            Result.objects.filter(section=section).values_list("student_id", flat=True)
+        ) == {first.id, second.id}
+        assert DirtyResult.objects.count() == 0
+
+    def test_published_results_are_left_alone(self, section):
+        assessment = Assessment.objects.create(
+            section=section, type="Final", weight=100
+        )
+        student = Student.objects.get(reg_no="2024000")
+        Result.objects.create(
+            student=student,
+            section=section,
+            final_grade="C",
+            state="published",
+            is_published=True,
+        )
+        AssessmentScore.objects.create(assessment=assessment, student=student, score=95)
+
+        summary = process_dirty_results(section.id)
+
+        assert summary["skipped"] == 1
+        assert Result.objects.get(student=student, section=section).final_grade == "C"
+
+    def test_ignores_students_no_longer_enrolled(self, section):
+        Assessment.objects.create(section=section, type="Final", weight=100)
+        Enrollment.objects.filter(student__reg_no="2024002").update(status="dropped")
+
+        summary = process_dirty_results(section.id)
+
+        assert summary["created"] == 2
+        assert DirtyResult.objects.count() == 0
+
+    def test_grades_the_unrounded_total(self, section):
+        assessment = Assessment.objects.create(
+            section=section, type="Final", weight=100
+        )
+        student = Student.objects.get(reg_no="2024000")
+        AssessmentScore.objects.create(
+            assessment=assessment, student=student, score=89.996
+        )
+
+        process_dirty_results(section.id)
+
+        expected = calculate_final_grade(student.id, section.id)
+        assert expected["percentage"] == 90.0
+        assert expected["grade"] == "A"
+        assert Result.objects.get(student=student).final_grade == "A"
+
+    def test_curved_section_is_regraded_once(self, section, settings):
+        settings.RESULT_RECOMPUTE_BATCH_SIZE = 1
+        assessment = Assessment.objects.create(
+            section=section, type="Final", weight=100
+        )
+        for i, student in enumerate(Student.objects.order_by("reg_no")):
+            AssessmentScore.objects.create(
+                assessment=assessment, student=student, score=50 + i * 10
+            )
+        CurvePolicy.objects.create(
+            section=section,
+            method="quota",
+            bands=[{"grade": "A", "percent": 50}, {"grade": "B", "percent": 50}],
+        )
+
+        with mock.patch.object(
+            curve, "write_draft_grades", wraps=curve.write_draft_grades
+        ) as write:
+            summary = process_dirty_results(section.id)
+
+        assert write.call_count == 1
+        assert summary["created"] == 3
+        assert DirtyResult.objects.count() == 0
@@ -0,0 +1,93 @@
+"""Tests for the prebuilt, cached OpenAPI schema"""
+
+import gzip
+from unittest import mock
+
+import pytest
+from drf_spectacular.generators import SchemaGenerator
+from rest_framework.test import APIClient
+
+from core import schema
+
+URL = "/api/schema/"
+
+
+@pytest.fixture(autouse=True)
+def clear_schemas():
+    schema._schemas.clear()
+    yield
+    schema._schemas.clear()
+
+
+@pytest.fixture
+def generate():
+    with mock.patch.object(
+        SchemaGenerator,
+        "get_schema",
+        autospec=True,
+        side_effect=SchemaGenerator.get_schema,
+    ) as get_schema:
+        yield get_schema
+
+
+@pytest.mark.django_db
+class TestSchemaCache:
+    def test_generated_once(self, generate):
+        client = APIClient()
+        first = client.get(URL)
+        second = client.get(URL)
+
+        assert first.status_code == second.status_code == 200
+        assert first.content == second.content
+        assert b"openapi" in first.content
+        assert generate.call_count == 1
+
+    def test_shared_between_workers(self, generate):
+        APIClient().get(URL)
+        # Another worker starts with an empty process cache.
+        schema._schemas.clear()
+        APIClient().get(URL)
+        assert generate.call_count == 1
+
+    def test_new_code_version_regenerates(self, generate):
+        APIClient().get(URL)
+        with mock.patch("core.schema.code_version", return_value="next"):
+            APIClient().get(URL)
+        assert generate.call_count == 2
+
+    def test_formats_are_cached_separately(self, generate):
+        client = APIClient()
+        yaml = client.get(URL)
+        json = client.get(f"{URL}?format=json")
+
+        assert json["Content-Type"].startswith("application/vnd.oai.openapi+json")
+        assert yaml.content != json.content
+        assert generate.call_count == 2
+
+    def test_etag_revalidation(self):
+        client = APIClient()
+        etag = client.get(URL)["ETag"]
+
+        response = client.get(URL, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_gzip(self):
+        client = APIClient()
+        plain = client.get(URL)
+        compressed = client.get(URL, HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+        assert compressed["Content-Encoding"] == "gzip"
+        assert gzip.decompress(compressed.content) == plain.content
+        assert len(compressed.content) < len(plain.content)
+        assert "Accept-Encoding" in compressed["Vary"]
+
+
+def test_code_version_prefers_environment(monkeypatch):
+    schema.code_version.cache_clear()
+    monkeypatch.setenv("CODE_VERSION", "abc123")
+    try:
+        assert schema.code_version() == "abc123"
+    finally:
+        schema.code_version.cache_clear()
@@ -0,0 +1,108 @@
+"""Tests for ranked ?search= on students, courses and sections"""
+
+import pytest
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+
+from sims_backend.academics.models import Course, Program, Section
+from sims_backend.admissions.models import Student
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    user = User.objects.create_user(
+        username="testuser", password="testpass", is_staff=True, is_superuser=True
+    )
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def students():
+    names = ["Maria Khan", "Ali Mariam", "Khan", "Omar Farooq"]
+    return [
+        Student.objects.create(
+            reg_no=f"2024{i:03d}", name=name, program="CS", status="active"
+        )
+        for i, name in enumerate(names)
+    ]
+
+
+@pytest.fixture
+def sections():
+    program = Program.objects.create(name="Computer Science")
+    algorithms = Course.objects.create(
+        code="CS201", title="Algorithms", credits=3, program=program
+    )
+    intro = Course.objects.create(
+        code="CS101", title="Intro to CS", credits=3, program=program
+    )
+    teacher = User.objects.create_user(
+        username="tsmith", first_name="Tom", last_name="Smithson"
+    )
+    return [
+        Section.objects.create(course=algorithms, term="Fall2024", teacher=teacher),
+        Section.objects.create(
+            course=intro, term="Fall2024", teacher=None, teacher_name="Dr. Smith"
+        ),
+    ]
+
+
+def _names(response):
+    return [row["name"] for row in response.data["results"]]
+
+
+@pytest.mark.django_db
+class TestStudentSearch:
+    def test_matches_substrings_across_fields(self, api_client, students):
+        response = api_client.get("/api/students/", {"search": "khan"})
+        assert sorted(_names(response)) == ["Khan", "Maria Khan"]
+
+        response = api_client.get("/api/students/", {"search": "2024003"})
+        assert _names(response) == ["Omar Farooq"]
+
+    def test_all_terms_must_match(self, api_client, students):
+        response = api_client.get("/api/students/", {"search": "maria khan"})
+        assert _names(response) == ["Maria Khan"]
+
+    def test_exact_then_prefix_matches_rank_first(self, api_client, students):
+        response = api_client.get("/api/students/", {"search": "khan"})
+        assert _names(response)[0] == "Khan"
+
+        response = api_client.get("/api/students/", {"search": "mari"})
+        assert _names(response) == ["Maria Khan", "Ali Mariam"]
+
+    def test_explicit_ordering_wins(self, api_client, students):
+        response = api_client.get(
+            "/api/students/", {"search": "mari", "ordering": "-name"}
+        )
+        assert _names(response) == ["Maria Khan", "Ali Mariam"]
+
+        response = api_client.get(
+            "/api/students/", {"search": "mari", "ordering": "name"}
+        )
+        assert _names(response) == ["Ali Mariam", "Maria Khan"]
+
+    def test_no_search_keeps_default_order(self, api_client, students):
+        response = api_client.get("/api/students/")
+        assert len(response.data["results"]) == len(students)
+
+
+@pytest.mark.django_db
+class TestCourseAndSectionSearch:
+    def test_course_search(self, api_client, sections):
+        response = api_client.get("/api/courses/", {"search": "algo"})
+        assert [row["code"] for row in response.data["results"]] == ["CS201"]
+
+    def test_section_search_covers_teacher_fields(self, api_client, sections):
+        response = api_client.get("/api/sections/", {"search": "smith"})
+        ids = [row["id"] for row in response.data["results"]]
+        assert sorted(ids) == sorted(section.id for section in sections)
+
+        response = api_client.get("/api/sections/", {"search": "tsmith"})
+        assert [row["id"] for row in response.data["results"]] == [sections[0].id]
+
+    def test_section_search_keeps_seat_counts(self, api_client, sections):
+        response = api_client.get("/api/sections/", {"search": "CS101"})
+        assert response.data["results"][0]["enrolled_count"] == 0
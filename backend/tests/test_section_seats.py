@@ -0,0 +1,126 @@
+"""Tests for section seat availability annotations"""
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from sims_backend.academics.models import Course, Program, Section
+from sims_backend.admissions.models import Student
+from sims_backend.enrollment.models import Enrollment
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    user = User.objects.create_user(
+        username="testuser", password="testpass", is_staff=True, is_superuser=True
+    )
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def course():
+    program = Program.objects.create(name="Computer Science")
+    return Course.objects.create(
+        code="CS101", title="Intro to CS", credits=3, program=program
+    )
+
+
+def _make_sections(course, count, capacity=2):
+    offset = Section.objects.count()
+    faculty = [
+        User.objects.create_user(username=f"faculty-{offset + i}", password="pass")
+        for i in range(count)
+    ]
+    return [
+        Section.objects.create(
+            course=course, term="Fall2024", teacher=teacher, capacity=capacity
+        )
+        for teacher in faculty
+    ]
+
+
+def _make_students(count):
+    return [
+        Student.objects.create(
+            reg_no=f"2024{i:03d}", name=f"Student {i}", program="CS", status="active"
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.django_db
+class TestSectionSeats:
+    def test_list_includes_seat_counts(self, api_client, course):
+        section = _make_sections(course, 1, capacity=3)[0]
+        students = _make_students(3)
+        Enrollment.objects.create(student=students[0], section=section)
+        Enrollment.objects.create(student=students[1], section=section)
+        Enrollment.objects.create(
+            student=students[2], section=section, status="waitlisted"
+        )
+
+        response = api_client.get("/api/sections/")
+
+        assert response.status_code == 200
+        data = response.data["results"][0]
+        assert data["capacity"] == 3
+        assert data["enrolled_count"] == 2
+        assert data["waitlist_count"] == 1
+        assert data["seats_remaining"] == 1
+
+    def test_detail_includes_seat_counts(self, api_client, course):
+        section = _make_sections(course, 1, capacity=1)[0]
+        student = _make_students(1)[0]
+        Enrollment.objects.create(student=student, section=section)
+
+        response = api_client.get(f"/api/sections/{section.id}/")
+
+        assert response.status_code == 200
+        assert response.data["enrolled_count"] == 1
+        assert response.data["seats_remaining"] == 0
+
+    def test_create_response_includes_seat_counts(self, api_client, course):
+        response = api_client.post(
+            "/api/sections/",
+            {"course": course.id, "term": "Fall2024", "teacher": None, "capacity": 5},
+            format="json",
+        )
+
+        assert response.status_code == 201
+        assert response.data["enrolled_count"] == 0
+        assert response.data["seats_remaining"] == 5
+
+    def test_filter_has_open_seats(self, api_client, course):
+        full, open_section = _make_sections(course, 2, capacity=1)
+        student = _make_students(1)[0]
+        Enrollment.objects.create(student=student, section=full)
+
+        response = api_client.get("/api/sections/?has_open_seats=true")
+        ids = [row["id"] for row in response.data["results"]]
+        assert ids == [open_section.id]
+
+        response = api_client.get("/api/sections/?has_open_seats=false")
+        ids = [row["id"] for row in response.data["results"]]
+        assert ids == [full.id]
+
+    def test_list_query_count_is_constant(self, api_client, course):
+        students = _make_students(2)
+        for section in _make_sections(course, 2):
+            Enrollment.objects.create(student=students[0], section=section)
+
+        with CaptureQueriesContext(connection) as small:
+            api_client.get("/api/sections/")
+
+        for section in _make_sections(course, 20):
+            for student in students:
+                Enrollment.objects.create(student=student, section=section)
+
+        with CaptureQueriesContext(connection) as large:
+            response = api_client.get("/api/sections/")
+
+        assert len(response.data["results"]) == 22
+        assert len(large.captured_queries) == len(small.captured_queries)
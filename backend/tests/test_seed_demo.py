@@ -0,0 +1,107 @@
+"""Tests for the seed_demo command's deterministic and --scale modes"""
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from sims_backend.academics.models import Section, Term
+from sims_backend.admissions.models import Student
+from sims_backend.assessments.models import Assessment, AssessmentScore
+from sims_backend.attendance.models import Attendance
+from sims_backend.enrollment.models import Enrollment
+from sims_backend.results.models import Result
+
+
+def _seed(*args):
+    call_command("seed_demo", *args, stdout=StringIO())
+
+
+def _snapshot():
+    return {
+        "students": list(
+            Student.objects.order_by("reg_no").values_list("reg_no", "name")
+        ),
+        "enrollments": sorted(
+            Enrollment.objects.values_list("student__reg_no", "section__course__code")
+        ),
+        "attendance": sorted(
+            Attendance.objects.values_list("student__reg_no", "date", "present")
+        ),
+        "scores": sorted(
+            AssessmentScore.objects.values_list("student__reg_no", "score")
+        ),
+        "grades": sorted(Result.objects.values_list("student__reg_no", "final_grade")),
+    }
+
+
+@pytest.mark.django_db
+class TestDeterministicSeeding:
+    def test_same_seed_same_data(self):
+        _seed("--students", "6", "--seed", "7")
+        first = _snapshot()
+        _seed("--clear", "--students", "6", "--seed", "7")
+
+        assert _snapshot() == first
+
+    def test_attendance_does_not_query_terms_per_enrollment(self):
+        with CaptureQueriesContext(connection) as queries:
+            _seed("--students", "4")
+
+        term_queries = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith("SELECT")
+            and 'FROM "academics_term"' in query["sql"]
+        ]
+        assert len(term_queries) < Enrollment.objects.count()
+
+
+@pytest.mark.django_db
+class TestScaleSeeding:
+    def test_generates_the_requested_shape(self):
+        _seed(
+            "--scale",
+            "--students",
+            "30",
+            "--terms",
+            "3",
+            "--sections",
+            "6",
+            "--days",
+            "5",
+            "--chunk-size",
+            "7",
+        )
+
+        assert Student.objects.count() == 30
+        assert Term.objects.count() == 3
+        assert Term.objects.filter(status="open").count() == 1
+        assert Section.objects.count() == 18
+        enrollments = Enrollment.objects.count()
+        assert 30 * 3 * 4 <= enrollments <= 30 * 3 * 5
+        assert Attendance.objects.count() == enrollments * 5
+        assert Assessment.objects.count() == 18 * 4
+        assert AssessmentScore.objects.count() == enrollments * 4
+        assert Result.objects.count() == enrollments
+        # Every section fits its students.
+        for section in Section.objects.all():
+            assert section.enrollments.count() <= section.capacity
+        assert set(Section.objects.values_list("teacher_name", flat=True)) != {""}
+
+    def test_is_reproducible(self):
+        args = ("--scale", "--students", "12", "--days", "3", "--seed", "3")
+        _seed(*args)
+        first = _snapshot()
+        _seed("--clear", *args)
+
+        assert _snapshot() == first
+
+    def test_requires_an_empty_database(self):
+        _seed("--students", "2")
+
+        with pytest.raises(CommandError, match="--clear"):
+            _seed("--scale", "--students", "2")
@@ -0,0 +1,217 @@
+"""Tests for materialized GPA/CGPA standings"""
+
+import io
+from unittest import mock
+
+import pytest
+from django.contrib.auth.models import Group, User
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+from sims_backend.academics.models import Course, Program, Section
+from sims_backend.admissions.models import Student
+from sims_backend.results.grading import get_scale
+from sims_backend.results.models import (
+    GradeBoundary,
+    GradingScale,
+    PendingChange,
+    Result,
+    StudentCGPA,
+    TermGPA,
+)
+from sims_backend.results.standings import refresh_standings
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    user = User.objects.create_user(
+        username="testuser", password="testpass", is_staff=True, is_superuser=True
+    )
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def catalog():
+    program = Program.objects.create(name="Computer Science")
+    courses = [
+        Course.objects.create(
+            code=f"CS10{i}", title=f"Course {i}", credits=credits, program=program
+        )
+        for i, credits in enumerate((3, 4, 2))
+    ]
+    return {
+        "program": program,
+        "fall": [Section.objects.create(course=c, term="Fall2024") for c in courses],
+        "spring": Section.objects.create(course=courses[0], term="Spring2025"),
+    }
+
+
+def _student(reg_no):
+    return Student.objects.create(
+        reg_no=reg_no, name=reg_no, program="CS", status="active"
+    )
+
+
+def _published(student, section, grade, state="published"):
+    return Result.objects.create(
+        student=student,
+        section=section,
+        final_grade=grade,
+        state=state,
+        is_published=True,
+    )
+
+
+@pytest.mark.django_db
+class TestRefreshStandings:
+    def test_credit_weighted_gpa_and_cgpa(self, catalog):
+        student = _student("2024001")
+        cs100, cs101, cs102 = catalog["fall"]
+        _published(student, cs100, "A")  # 3 credits x 4.0
+        _published(student, cs101, "B")  # 4 credits x 3.0
+        _published(student, cs102, "F", state="frozen")  # 2 credits x 0.0
+        Result.objects.create(
+            student=student, section=catalog["spring"], final_grade="A"
+        )
+        _published(_student("2024002"), cs100, "C")
+
+        refresh_standings([student.id])
+
+        fall = TermGPA.objects.get(student=student, term="Fall2024")
+        assert (fall.credits, fall.gpa) == (9, round(24 / 9, 2))
+        # Drafts do not count and other students are untouched.
+        assert TermGPA.objects.count() == 1
+        assert StudentCGPA.objects.get(student=student).cgpa == round(24 / 9, 2)
+
+    def test_scale_is_resolved_once_per_scope(self, catalog):
+        for i in range(4):
+            student = _student(f"2024{i:03d}")
+            for section in catalog["fall"]:
+                _published(student, section, "B")
+            _published(student, catalog["spring"], "A")
+
+        with mock.patch(
+            "sims_backend.results.standings.get_scale", wraps=get_scale
+        ) as lookup:
+            refresh_standings(Student.objects.values_list("id", flat=True))
+
+        assert lookup.call_count == 2
+
+    def test_grades_without_points_are_skipped(self, catalog):
+        student = _student("2024001")
+        _published(student, catalog["fall"][0], "A")
+        _published(student, catalog["fall"][1], "I")
+
+        refresh_standings([student.id])
+
+        assert TermGPA.objects.get(student=student).credits == 3
+
+    def test_scale_grade_points_override_defaults(self, catalog):
+        scale = GradingScale.objects.create(name="CS", program=catalog["program"])
+        GradeBoundary.objects.create(
+            scale=scale, grade="A", min_percentage=80, grade_points=5
+        )
+        GradeBoundary.objects.create(scale=scale, grade="F", min_percentage=0)
+        student = _student("2024001")
+        _published(student, catalog["fall"][0], "A")
+
+        refresh_standings([student.id])
+
+        assert StudentCGPA.objects.get(student=student).cgpa == 5.0
+
+    def test_stale_terms_are_removed(self, catalog):
+        student = _student("2024001")
+        result = _published(student, catalog["spring"], "A")
+        refresh_standings([student.id])
+
+        result.delete()
+        refresh_standings([student.id])
+
+        assert not TermGPA.objects.filter(student=student).exists()
+        assert not StudentCGPA.objects.filter(student=student).exists()
+
+    def test_rebuild_command(self, catalog):
+        for i in range(3):
+            _published(_student(f"2024{i:03d}"), catalog["spring"], "B")
+        out = io.StringIO()
+
+        call_command("rebuild_standings", "--chunk-size", "2", stdout=out)
+
+        assert "3 students (3 term GPAs)" in out.getvalue()
+        assert set(StudentCGPA.objects.values_list("cgpa", flat=True)) == {3.0}
+
+
+@pytest.mark.django_db
+class TestWorkflowUpdates:
+    def test_publish_freeze_and_change_update_standings(self, api_client, catalog):
+        student = _student("2024001")
+        result = Result.objects.create(
+            student=student, section=catalog["spring"], final_grade="B"
+        )
+
+        api_client.post("/api/results/publish/", {"result_id": result.id})
+        assert StudentCGPA.objects.get(student=student).cgpa == 3.0
+
+        change = PendingChange.objects.create(
+            result=result, new_grade="A", requested_by="faculty"
+        )
+        api_client.post(
+            "/api/results/approve-change/",
+            {"change_id": change.id, "approved": True},
+            format="json",
+        )
+        assert StudentCGPA.objects.get(student=student).cgpa == 4.0
+
+        response = api_client.post("/api/results/freeze/", {"result_id": result.id})
+        assert response.status_code == 200
+        assert TermGPA.objects.get(student=student).gpa == 4.0
+
+
+@pytest.mark.django_db
+class TestStandingsEndpoints:
+    @pytest.fixture
+    def ranked(self, catalog):
+        grades = {"2024001": "A", "2024002": "C", "2024003": "B"}
+        for reg_no, grade in grades.items():
+            student = _student(reg_no)
+            for section in catalog["fall"]:
+                _published(student, section, grade)
+        refresh_standings(Student.objects.values_list("id", flat=True))
+
+    def test_term_ranking(self, api_client, ranked):
+        response = api_client.get("/api/standings/terms/?term=Fall2024")
+
+        assert response.status_code == 200
+        assert [row["reg_no"] for row in response.data["results"]] == [
+            "2024001",
+            "2024003",
+            "2024002",
+        ]
+
+    def test_deans_list(self, api_client, ranked, settings):
+        settings.DEANS_LIST_MIN_GPA = 3.0
+        settings.DEANS_LIST_MIN_CREDITS = 9
+
+        response = api_client.get("/api/standings/terms/deans-list/?term=Fall2024")
+
+        assert [row["reg_no"] for row in response.data["results"]] == [
+            "2024001",
+            "2024003",
+        ]
+        assert api_client.get("/api/standings/terms/deans-list/").status_code == 400
+
+    def test_cgpa_filter(self, api_client, ranked):
+        response = api_client.get("/api/standings/cgpa/?cgpa__gte=3.5")
+        assert [row["reg_no"] for row in response.data["results"]] == ["2024001"]
+
+    def test_students_see_only_their_own(self, ranked):
+        user = User.objects.create_user(username="2024002", password="pass")
+        user.groups.add(Group.objects.get(name="Student"))
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.get("/api/standings/cgpa/")
+
+        assert [row["reg_no"] for row in response.data["results"]] == ["2024002"]
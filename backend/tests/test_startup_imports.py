@@ -0,0 +1,31 @@
+"""Tests for lazy heavy imports and the startup profile"""
+
+import json
+from io import StringIO
+
+from django.core.management import call_command
+
+from core.management.commands.profile_startup import run_profile
+
+# Cold import of the root URLconf after django.setup(), in milliseconds.
+URLCONF_IMPORT_BUDGET_MS = 1000
+
+
+def test_urlconf_import_stays_within_budget():
+    report = run_profile(per_app=False)
+
+    assert report["urlconf"]["ms"] < URLCONF_IMPORT_BUDGET_MS
+    # reportlab, faker and friends load on first use, not at startup.
+    assert report["heavy_modules"] == []
+
+
+def test_profile_command_reports_every_app():
+    out = StringIO()
+    call_command("profile_startup", "--json", stdout=out)
+
+    report = json.loads(out.getvalue())
+    names = [step["name"] for step in report["apps"]]
+    assert "core" in names
+    assert "sims_backend.transcripts" in names
+    assert report["setup"]["ms"] > 0
+    assert report["rss_kb"] > 0
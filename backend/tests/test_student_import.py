@@ -0,0 +1,216 @@
+"""Tests for the streaming bulk student import"""
+
+import io
+
+import pytest
+from django.contrib.auth.models import Group, User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from sims_backend.admissions.importer import StudentImporter, iter_rows
+from sims_backend.admissions.models import Student
+
+URL = "/api/students/import/"
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    user = User.objects.create_user(
+        username="testuser", password="testpass", is_staff=True, is_superuser=True
+    )
+    client.force_authenticate(user=user)
+    return client
+
+
+def _csv(*rows, header="reg_no,name,program,status"):
+    return "\n".join([header, *rows]) + "\n"
+
+
+def _upload(content, name="students.csv"):
+    return SimpleUploadedFile(name, content.encode(), content_type="text/csv")
+
+
+def _run(content, **kwargs):
+    importer = StudentImporter(**kwargs)
+    summary = importer.run(iter_rows(io.BytesIO(content.encode())))
+    return importer, summary
+
+
+@pytest.mark.django_db
+class TestStudentImporter:
+    def test_creates_students(self):
+        _, summary = _run(
+            _csv("2024001,Alice,CS,active", "2024002,Bob,EE,active"), chunk_size=1
+        )
+        assert summary.as_dict() == {"total": 2, "created": 2, "updated": 0, "failed": 0}
+        assert Student.objects.get(reg_no="2024002").name == "Bob"
+
+    def test_upsert_updates_existing(self):
+        Student.objects.create(reg_no="2024001", name="Old", program="CS", status="active")
+
+        _, summary = _run(_csv("2024001,New,CS,graduated"))
+
+        assert (summary.created, summary.updated) == (0, 1)
+        student = Student.objects.get(reg_no="2024001")
+        assert (student.name, student.status) == ("New", "graduated")
+
+    def test_create_mode_rejects_existing(self):
+        Student.objects.create(reg_no="2024001", name="Old", program="CS", status="active")
+
+        _, summary = _run(_csv("2024001,New,CS,active"), mode="create")
+
+        assert summary.failed == 1
+        assert "already exists" in summary.errors[0]["error"]
+        assert Student.objects.get(reg_no="2024001").name == "Old"
+
+    @pytest.mark.parametrize("chunk_size", [1, 10])
+    def test_duplicates_in_file_are_rejected(self, chunk_size):
+        _, summary = _run(
+            _csv("2024001,First,CS,active", "2024001,Second,CS,active"),
+            chunk_size=chunk_size,
+        )
+
+        assert (summary.created, summary.failed) == (1, 1)
+        assert summary.errors == [
+            {"line": 3, "reg_no": "2024001", "error": "Duplicate reg_no in file."}
+        ]
+        assert Student.objects.get(reg_no="2024001").name == "First"
+
+    def test_concurrent_edits_are_not_duplicates(self):
+        importer = StudentImporter()
+        # Another user edits the student after the import has started.
+        Student.objects.create(reg_no="2024001", name="Old", program="CS", status="active")
+
+        summary = importer.run(iter_rows(io.BytesIO(_csv("2024001,New,CS,active").encode())))
+
+        assert (summary.updated, summary.failed) == (1, 0)
+        assert Student.objects.get(reg_no="2024001").name == "New"
+
+    def test_reimporting_a_file_updates_it(self):
+        content = _csv("2024001,Alice,CS,active")
+        _run(content, chunk_size=1)
+
+        _, summary = _run(content, chunk_size=1)
+
+        assert (summary.updated, summary.failed) == (1, 0)
+
+    def test_invalid_rows_are_reported(self):
+        importer, summary = _run(
+            _csv(",No Reg,CS,active", "2024002,,CS,active", f"2024003,Ok,{'x' * 200},a")
+        )
+
+        assert summary.failed == 3
+        assert Student.objects.count() == 0
+        report = importer.report.read().splitlines()
+        assert report[0] == "line,reg_no,error"
+        assert report[1] == "2,,reg_no is required."
+        assert report[3].startswith("4,2024003,program must be at most 128")
+
+    def test_query_count_is_per_chunk(self):
+        rows = [f"2024{i:03d},Student {i},CS,active" for i in range(50)]
+        with CaptureQueriesContext(connection) as ctx:
+            _run(_csv(*rows), chunk_size=25)
+
+        selects = [q for q in ctx.captured_queries if q["sql"].startswith("SELECT")]
+        inserts = [q for q in ctx.captured_queries if q["sql"].startswith("INSERT")]
+        assert (len(selects), len(inserts)) == (2, 2)
+
+    def test_missing_columns_raise(self):
+        with pytest.raises(ValueError, match="Missing required columns: status"):
+            _run(_csv("2024001,Alice,CS", header="reg_no,name,program"))
+
+
+@pytest.mark.django_db
+class TestImportEndpoint:
+    def test_import_and_download_error_report(self, api_client):
+        content = _csv("2024001,Alice,CS,active", ",Nobody,CS,active")
+
+        response = api_client.post(URL, {"file": _upload(content)}, format="multipart")
+
+        assert response.status_code == 200
+        assert response.data["created"] == 1
+        assert response.data["failed"] == 1
+        report_url = response.data["error_report"]
+        assert report_url.endswith("/errors/")
+
+        report = api_client.get(report_url)
+        assert report.status_code == 200
+        assert report["Content-Type"] == "text/csv"
+        assert b"reg_no is required." in b"".join(report.streaming_content)
+
+    def test_large_uploads_stream_from_disk(self, api_client, settings):
+        settings.FILE_UPLOAD_MAX_MEMORY_SIZE = 0
+        rows = [f"2024{i:03d},Student {i},CS,active" for i in range(20)]
+
+        response = api_client.post(URL, {"file": _upload(_csv(*rows))}, format="multipart")
+
+        assert response.data["created"] == 20
+
+    def test_clean_import_has_no_report(self, api_client):
+        response = api_client.post(
+            URL, {"file": _upload(_csv("2024001,Alice,CS,active"))}, format="multipart"
+        )
+        assert response.data["error_report"] is None
+
+    def test_missing_file(self, api_client):
+        response = api_client.post(URL, {}, format="multipart")
+        assert response.status_code == 400
+
+    def test_bad_header(self, api_client):
+        response = api_client.post(
+            URL, {"file": _upload("a,b\n1,2\n")}, format="multipart"
+        )
+        assert response.status_code == 400
+        assert "Missing required columns" in response.data["error"]["message"]
+
+    def test_invalid_mode(self, api_client):
+        response = api_client.post(
+            URL,
+            {"file": _upload(_csv("2024001,Alice,CS,active")), "mode": "merge"},
+            format="multipart",
+        )
+        assert response.status_code == 400
+
+    def test_students_cannot_import(self):
+        client = APIClient()
+        user = User.objects.create_user(username="2024001", password="pass")
+        user.groups.add(Group.objects.get(name="Student"))
+        client.force_authenticate(user=user)
+
+        response = client.post(
+            URL, {"file": _upload(_csv("2024009,Eve,CS,active"))}, format="multipart"
+        )
+        assert response.status_code == 403
+
+        response = client.get(f"{URL}{'0' * 32}/errors/")
+        assert response.status_code == 403
+
+
+@pytest.mark.django_db
+class TestImportCommand:
+    def test_command_imports_and_writes_report(self, tmp_path):
+        source = tmp_path / "students.csv"
+        source.write_text(_csv("2024001,Alice,CS,active", "2024002,,CS,active"))
+        errors = tmp_path / "errors.csv"
+        out = io.StringIO()
+
+        call_command(
+            "import_students", str(source), "--errors", str(errors), stdout=out
+        )
+
+        assert "1 created, 0 updated, 1 failed" in out.getvalue()
+        assert "name is required." in errors.read_text()
+        assert Student.objects.filter(reg_no="2024001").exists()
+
+    def test_command_missing_file(self, tmp_path):
+        with pytest.raises(CommandError):
+            call_command("import_students", str(tmp_path / "missing.csv"))
@@ -0,0 +1,249 @@
+"""Tests for deduplicated transcript jobs and stored transcript renders"""
+
+from unittest import mock
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from rest_framework.test import APIClient
+from rq.job import JobStatus
+
+from sims_backend.academics.models import Course, Program, Section
+from sims_backend.admissions.models import Student
+from sims_backend.results.models import Result
+from sims_backend.transcripts import views
+from sims_backend.transcripts.jobs import generate_and_email_transcript
+from sims_backend.transcripts.renders import (
+    open_render,
+    results_version,
+    save_render,
+    transcript_job_id,
+)
+
+
+@pytest.fixture
+def api_client():
+    client = APIClient()
+    user = User.objects.create_user(
+        username="testuser", password="testpass", is_staff=True, is_superuser=True
+    )
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def student(db):
+    program = Program.objects.create(name="Computer Science")
+    course = Course.objects.create(
+        code="CS101", title="Intro to CS", credits=3, program=program
+    )
+    section = Section.objects.create(
+        course=course, term="Fall2024", teacher=None, teacher_name="Dr. Smith"
+    )
+    student = Student.objects.create(
+        reg_no="2024001", name="John Doe", program="CS", status="active"
+    )
+    Result.objects.create(
+        student=student, section=section, final_grade="A", is_published=True
+    )
+    return student
+
+
+def _queue(status=None):
+    queue = mock.Mock()
+    queue.fetch_job.return_value = (
+        None if status is None else mock.Mock(get_status=mock.Mock(return_value=status))
+    )
+    queue.enqueue.side_effect = lambda *args, job_id, **kwargs: mock.Mock(id=job_id)
+    return queue
+
+
+def _enqueue(client, student, queue, email=None):
+    body = {"student_id": student.id}
+    if email:
+        body["email"] = email
+    with mock.patch("django_rq.get_queue", return_value=queue):
+        return client.post("/api/transcripts/enqueue/", body, format="json")
+
+
+@pytest.mark.django_db
+class TestResultsVersion:
+    def test_stable_until_the_transcript_changes(self, student):
+        version = results_version(student)
+        assert results_version(student) == version
+
+        result = Result.objects.get(student=student)
+        result.final_grade = "B"
+        result.save()
+        graded = results_version(student)
+        assert graded != version
+
+        course = result.section.course
+        course.title = "Introduction to Computing"
+        course.save()
+        assert results_version(student) != graded
+
+    def test_unpublished_results_do_not_count(self, student):
+        version = results_version(student)
+        section = Result.objects.get(student=student).section
+        other = Section.objects.create(
+            course=section.course, term="Spring2025", teacher_name="Dr. Jones"
+        )
+        Result.objects.create(student=student, section=other, final_grade="C")
+
+        assert results_version(student) == version
+
+    def test_job_ids(self, student):
+        version = results_version(student)
+        job_id = transcript_job_id(student.id, version)
+
+        assert job_id == f"transcript-{student.id}-{version}"
+        assert transcript_job_id(student.id, version, "a@example.com") != job_id
+        assert transcript_job_id(student.id, version, "A@example.com") == (
+            transcript_job_id(student.id, version, "a@example.com")
+        )
+
+
+@pytest.mark.django_db
+class TestStoredRenders:
+    def test_download_reuses_the_render(self, api_client, student):
+        with mock.patch.object(
+            views, "generate_transcript_pdf", wraps=views.generate_transcript_pdf
+        ) as generate:
+            first = b"".join(
+                api_client.get(f"/api/transcripts/{student.id}/").streaming_content
+            )
+            second = b"".join(
+                api_client.get(f"/api/transcripts/{student.id}/").streaming_content
+            )
+
+        assert generate.call_count == 1
+        assert second == first
+
+    def test_render_is_replaced_when_results_change(self, api_client, student):
+        old_version = results_version(student)
+        views.render_transcript(student)
+        Result.objects.filter(student=student).update(final_grade="B")
+        Result.objects.get(student=student).save()
+
+        views.render_transcript(student)
+
+        assert open_render(student.id, old_version) is None
+        with open_render(student.id, results_version(student)) as stored:
+            assert stored.read().startswith(b"%PDF")
+
+    def test_stale_render_is_ignored(self, student, settings):
+        version = results_version(student)
+        save_render(student.id, version, views.generate_transcript_pdf(student))
+        settings.TRANSCRIPT_RENDER_TTL = -1
+
+        assert open_render(student.id, version) is None
+
+    def test_job_stores_the_render(self, student):
+        result = generate_and_email_transcript(student.id)
+
+        assert result["status"] == "success"
+        open_render(student.id, results_version(student)).close()
+
+
+@pytest.mark.django_db
+class TestEnqueueDeduplication:
+    def test_enqueues_under_a_deterministic_id(self, api_client, student):
+        queue = _queue()
+        response = _enqueue(api_client, student, queue)
+
+        job_id = transcript_job_id(student.id, results_version(student))
+        assert response.status_code == 202
+        assert response.data["job_id"] == job_id
+        assert queue.enqueue.call_args.kwargs["job_id"] == job_id
+
+    @pytest.mark.parametrize("status", [JobStatus.QUEUED, JobStatus.STARTED])
+    def test_attaches_to_a_pending_job(self, api_client, student, status):
+        queue = _queue(status)
+        response = _enqueue(api_client, student, queue)
+
+        assert response.status_code == 202
+        assert response.data["job_id"] == queue.fetch_job.call_args.args[0]
+        assert "already in progress" in response.data["message"]
+        queue.enqueue.assert_not_called()
+
+    def test_reenqueues_a_failed_job(self, api_client, student):
+        queue = _queue(JobStatus.FAILED)
+        response = _enqueue(api_client, student, queue)
+
+        assert response.status_code == 202
+        queue.fetch_job.return_value.delete.assert_called_once()
+        queue.enqueue.assert_called_once()
+
+    def test_concurrent_request_attaches(self, api_client, student):
+        job_id = transcript_job_id(student.id, results_version(student))
+        cache.add(f"transcript-enqueue:{job_id}", True)
+        queue = _queue()
+
+        response = _enqueue(api_client, student, queue)
+
+        assert response.status_code == 202
+        assert response.data["job_id"] == job_id
+        queue.enqueue.assert_not_called()
+
+    def test_cache_outage_still_enqueues(self, api_client, student):
+        queue = _queue()
+        with (
+            mock.patch.object(cache, "add", side_effect=ConnectionError),
+            mock.patch.object(cache, "delete", side_effect=ConnectionError),
+        ):
+            response = _enqueue(api_client, student, queue)
+
+        assert response.status_code == 202
+        queue.enqueue.assert_called_once()
+
+    def test_up_to_date_render_short_circuits(self, api_client, student):
+        views.render_transcript(student)
+        queue = _queue()
+
+        response = _enqueue(api_client, student, queue)
+
+        assert response.status_code == 200
+        assert response.data["message"] == "Transcript is up to date"
+        assert response.data["download_url"] == f"/api/transcripts/{student.id}/"
+        queue.enqueue.assert_not_called()
+
+    def test_email_requests_still_run(self, api_client, student):
+        views.render_transcript(student)
+        queue = _queue()
+
+        response = _enqueue(api_client, student, queue, email="s@example.com")
+
+        assert response.status_code == 202
+        assert queue.enqueue.call_args.args[1:] == (student.id, "s@example.com")
+
+
+@pytest.mark.django_db
+class TestTranscriptJobStatus:
+    def _get(self, client, student, job=None, error=None):
+        fetch = mock.AsyncMock(return_value=job, side_effect=error)
+        with mock.patch.object(views, "fetch_job", fetch):
+            response = client.get(f"/api/transcripts/{student.id}/job/")
+        return response, fetch
+
+    def test_reports_the_current_job(self, api_client, student):
+        job = {"job_id": "x", "status": "queued"}
+        response, fetch = self._get(api_client, student, job)
+
+        assert response.status_code == 200
+        assert response.json() == job
+        fetch.assert_awaited_once_with(
+            transcript_job_id(student.id, results_version(student))
+        )
+
+    def test_no_job(self, api_client, student):
+        response, _ = self._get(api_client, student)
+        assert response.status_code == 404
+
+    def test_redis_unavailable(self, api_client, student):
+        response, _ = self._get(api_client, student, error=ConnectionError())
+        assert response.status_code == 503
+
+    def test_unknown_student(self, api_client, db):
+        response = api_client.get("/api/transcripts/999/job/")
+        assert response.status_code == 404